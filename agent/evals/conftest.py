@@ -1,30 +1,121 @@
 """
 pytest conftest for the AgentForge eval suite.
 
-Two responsibilities:
+'agent/' and 'agent/tools/' are put on sys.path by the pythonpath entry in
+pytest.ini, so tests can import tool modules from any working directory.
+
+Six responsibilities:
 1. Patches teleport_api._fetch_from_teleport to return None immediately,
    bypassing all live HTTP calls. This forces get_city_housing_data to fall
    back to HARDCODED_FALLBACK data instantly. Tests run in <1s total.
 2. Ensures pytest-asyncio is configured for STRICT mode (set in pytest.ini).
-   All async tests carry @pytest.mark.asyncio (they already do).
+   All async tests carry @pytest.mark.asyncio (they already do) and share
+   one session-scoped loop (asyncio_default_test_loop_scope in pytest.ini).
+3. Provides run_async — a session-wide event loop for sync tests that need
+   to drive a coroutine, instead of building a new loop per call. Both it
+   and pytest-asyncio's loops come from uvloop when it is installed
+   (uvicorn[standard] pulls it in everywhere except Windows).
+4. --changed-since=REF skips tests whose import closure inside agent/ has
+   no file changed relative to REF, for fast PR runs.
+5. strategy_cache — one session-wide memo of simulate_real_estate_strategy,
+   so the same run requested by several test modules is computed once.
+6. real_estate_enabled / real_estate_disabled set ENABLE_REAL_ESTATE via
+   monkeypatch, so the flag is restored after every test (even a failing
+   one) and cannot leak into the rest of the run.
 """
 
+import ast
+import asyncio
 import os
+import subprocess
 import sys
-
-# Make 'agent/' and 'agent/tools/' importable from any working directory
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+from pathlib import Path
 
 import pytest
 
+AGENT_DIR = Path(__file__).resolve().parent.parent
+
+# Every test module shares the in-memory property store. Without this, a
+# module run on its own (test_property_tracker.py sets no path) would write
+# to agent/data/properties.db and pay file I/O on every CRUD call.
+os.environ.setdefault("PROPERTIES_DB_PATH", ":memory:")
+
+try:
+    import uvloop
+except ImportError:  # Windows, or a minimal install — stdlib asyncio loop
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# ---------------------------------------------------------------------------
+# Shared event loop for sync tests
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def run_async():
+    """
+    Returns run_until_complete bound to one loop created for the session.
+    Sync tests call run_async(coro) rather than asyncio.run(coro), so loop
+    setup/teardown is paid once instead of on every call.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+# ---------------------------------------------------------------------------
+# ENABLE_REAL_ESTATE feature flag
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def real_estate_enabled(monkeypatch):
+    """Turns the real estate features on for one test."""
+    monkeypatch.setenv("ENABLE_REAL_ESTATE", "true")
+
+
+@pytest.fixture
+def real_estate_disabled(real_estate_enabled, monkeypatch):
+    """Turns them off; overrides a module-wide real_estate_enabled."""
+    monkeypatch.setenv("ENABLE_REAL_ESTATE", "false")
+
+
+# ---------------------------------------------------------------------------
+# Memoized real estate strategy simulations
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def strategy_cache():
+    """
+    Returns a memoized simulate_real_estate_strategy, shared by every module.
+    Arguments are bound against the signature with defaults filled in, so
+    positional, keyword and defaulted spellings of one run share an entry.
+    The simulation is deterministic and callers only read the returned dict.
+    """
+    import inspect
+
+    from realestate_strategy import simulate_real_estate_strategy
+
+    signature = inspect.signature(simulate_real_estate_strategy)
+    cache = {}
+
+    def _run(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = tuple(bound.arguments.items())
+        if key not in cache:
+            cache[key] = simulate_real_estate_strategy(*bound.args, **bound.kwargs)
+        return cache[key]
+
+    return _run
+
 
 # ---------------------------------------------------------------------------
 # Teleport API mock — eliminates all live network calls during tests
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(autouse=True)
-def mock_teleport_no_network(monkeypatch):
+@pytest.fixture(autouse=True, scope="session")
+def mock_teleport_no_network():
     """
     Patches teleport_api._fetch_from_teleport to return None immediately.
     This forces get_city_housing_data to use HARDCODED_FALLBACK for every
@@ -33,8 +124,12 @@ def mock_teleport_no_network(monkeypatch):
     Also patches search_city_slug to return from the in-memory cache only,
     so no DNS/HTTP calls are made during slug resolution.
 
-    autouse=True applies this to every test automatically.
+    autouse=True applies this to every test automatically. Session scope
+    installs the patches once for the whole run; the function-scoped
+    monkeypatch fixture can't be used here, so a pytest.MonkeyPatch
+    instance is created directly and undone at session end.
     """
+    mp = pytest.MonkeyPatch()
     try:
         import teleport_api
 
@@ -47,7 +142,118 @@ def mock_teleport_no_network(monkeypatch):
             lower = city_name.lower().strip()
             return teleport_api._slug_cache.get(lower)
 
-        monkeypatch.setattr(teleport_api, "_fetch_from_teleport", _instant_fetch)
-        monkeypatch.setattr(teleport_api, "search_city_slug", _cache_only_slug)
+        mp.setattr(teleport_api, "_fetch_from_teleport", _instant_fetch)
+        mp.setattr(teleport_api, "search_city_slug", _cache_only_slug)
     except ImportError:
         pass  # teleport_api not importable in this test context — skip
+    yield
+    mp.undo()
+
+
+# ---------------------------------------------------------------------------
+# Test-impact selection — only run tests the diff can affect
+# ---------------------------------------------------------------------------
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="skip tests whose agent/ import closure is unchanged since git REF",
+    )
+
+
+def _changed_files(ref: str) -> set[Path] | None:
+    """Files under agent/ that differ from ref, or None if git can't tell."""
+    try:
+        out = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", ref],
+            cwd=AGENT_DIR, capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {(AGENT_DIR / line).resolve() for line in out.splitlines() if line}
+
+
+def _resolve_module(name: str, roots: list[Path]) -> Path | None:
+    """Source file for a dotted module name under the first root that has it."""
+    parts = name.split(".")
+    for root in roots:
+        base = root.joinpath(*parts)
+        for candidate in (base.with_name(base.name + ".py"), base / "__init__.py"):
+            if candidate.is_file():
+                return candidate.resolve()
+    return None
+
+
+def _imported_files(path: Path, roots: list[Path]) -> set[Path]:
+    """
+    agent/ source files named by any import statement in path. Walks the
+    whole AST, so imports inside functions (wealth_bridge's lazy portfolio
+    import, the per-test imports in the eval modules) count too.
+    """
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError):
+        return set()
+    found: set[Path] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            search, names = roots, [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            search = roots
+            if node.level:
+                search = [path.parents[node.level - 1]]
+            prefix = f"{node.module}." if node.module else ""
+            # "from pkg import name" may name a submodule as well as an attribute.
+            names = [node.module] if node.module else []
+            names += [prefix + alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            resolved = _resolve_module(name, search)
+            if resolved is not None:
+                found.add(resolved)
+    return found
+
+
+def _local_import_closure(path: Path) -> set[Path]:
+    """Source files of every agent/ module reachable by import from path."""
+    # Resolve imports the way the interpreter does: against the sys.path
+    # entries that live in agent/ (pytest.ini's ". tools", the rootdir).
+    roots = []
+    for entry in sys.path:
+        root = Path(entry or ".").resolve()
+        if (root == AGENT_DIR or AGENT_DIR in root.parents) and root not in roots:
+            roots.append(root)
+    seen: set[Path] = set()
+    stack = [path.resolve()]
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        stack.extend(_imported_files(current, roots) - seen)
+    return seen
+
+
+def pytest_collection_modifyitems(config, items):
+    ref = config.getoption("--changed-since")
+    if not ref:
+        return
+    changed = _changed_files(ref)
+    # Unknown diff, or a change to something other than Python modules
+    # (pytest.ini, requirements, this conftest) — run everything.
+    if changed is None or any(
+        p.suffix != ".py" or p == Path(__file__).resolve() for p in changed
+    ):
+        return
+
+    closures: dict[Path, set[Path]] = {}
+    skip = pytest.mark.skip(reason=f"unaffected by diff against {ref}")
+    for item in items:
+        path = Path(item.module.__file__)
+        if path not in closures:
+            closures[path] = _local_import_closure(path)
+        if not closures[path] & changed:
+            item.add_marker(skip)
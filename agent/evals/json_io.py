@@ -0,0 +1,32 @@
+"""
+JSON helpers shared by the eval runners (run_evals, run_golden_sets,
+save_eval_results).
+
+orjson is optional — several times faster parse/dump on results and
+history files; the stdlib json module is the fallback.
+"""
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        """Pretty-printed JSON text (2-space indent)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def dumps_line(obj) -> bytes:
+        """One compact JSON Lines record, newline-terminated."""
+        return orjson.dumps(obj) + b"\n"
+except ImportError:
+    import json
+
+    loads = json.loads
+
+    def dumps(obj) -> str:
+        """Pretty-printed JSON text (2-space indent)."""
+        return json.dumps(obj, indent=2)
+
+    def dumps_line(obj) -> bytes:
+        """One compact JSON Lines record, newline-terminated."""
+        return (json.dumps(obj) + "\n").encode("utf-8")
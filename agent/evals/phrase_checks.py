@@ -0,0 +1,65 @@
+"""
+Assertion-phrase matching and latency percentiles shared by the eval runners
+(run_evals, run_golden_sets).
+
+pyahocorasick is optional — one automaton pass finds every phrase in a
+response; without it each phrase is a separate substring scan.
+"""
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+PHRASE_KEYS = ("must_contain", "must_not_contain", "must_contain_one_of")
+
+
+def _build_automaton(phrases: list[str]):
+    """Aho-Corasick automaton over phrases, or None if unavailable/empty."""
+    if ahocorasick is None or not phrases:
+        return None
+    automaton = ahocorasick.Automaton()
+    for p in phrases:
+        automaton.add_word(p, p)
+    automaton.make_automaton()
+    return automaton
+
+
+def prepare_phrases(case: dict) -> dict:
+    """Lower-cases a case's phrase lists once, stored as `_<key>_lc`.
+
+    Also builds `_automaton` over all of them so a response is scanned once.
+    Idempotent — cases that were already prepared are returned untouched,
+    so multi-step cases and cached case lists never re-lower a phrase.
+    """
+    if "_must_contain_lc" not in case:
+        for key in PHRASE_KEYS:
+            case[f"_{key}_lc"] = [p.lower() for p in case.get(key, [])]
+        case["_automaton"] = _build_automaton(
+            [p for key in PHRASE_KEYS for p in case[f"_{key}_lc"]]
+        )
+    return case
+
+
+def phrase_hits(case: dict, text: str) -> set[str]:
+    """Returns the prepared (lower-cased) phrases that occur in text."""
+    automaton = case["_automaton"]
+    if automaton is not None:
+        return {p for _, p in automaton.iter(text)}
+    return {
+        p for key in PHRASE_KEYS for p in case[f"_{key}_lc"] if p in text
+    }
+
+
+def percentiles(values: list[float], ps: tuple[int, ...]) -> dict[int, float]:
+    """Interpolated percentiles for every p in ps, from a single sort."""
+    if not values:
+        return {p: 0.0 for p in ps}
+    sorted_vals = sorted(values)
+    last = len(sorted_vals) - 1
+    out: dict[int, float] = {}
+    for p in ps:
+        idx = (p / 100) * last
+        lo, hi = int(idx), min(int(idx) + 1, last)
+        out[p] = round(sorted_vals[lo] + (idx - lo) * (sorted_vals[hi] - sorted_vals[lo]), 2)
+    return out
@@ -4,7 +4,7 @@ Loads test_cases.json, POSTs to /chat, checks assertions, prints results.
 Supports single-query and multi-step (write confirmation) test cases.
 """
 import asyncio
-import json
+import functools
 import os
 import sys
 import time
@@ -12,6 +12,13 @@ from statistics import median
 
 import httpx
 
+try:
+    from json_io import dumps as _dumps, loads as _loads
+    from phrase_checks import percentiles, phrase_hits, prepare_phrases
+except ImportError:
+    from evals.json_io import dumps as _dumps, loads as _loads
+    from evals.phrase_checks import percentiles, phrase_hits, prepare_phrases
+
 BASE_URL = os.getenv("AGENT_BASE_URL", "http://localhost:8000")
 RESULTS_FILE = os.path.join(os.path.dirname(__file__), "results.json")
 TEST_CASES_FILE = os.path.join(os.path.dirname(__file__), "test_cases.json")
@@ -28,14 +35,68 @@ _AUTH_HEADERS: dict[str, str] = (
 # Raise to 5+ on higher Anthropic tiers; set to 1 for serial mode.
 CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "3"))
 
+# Hard cap on in-flight requests to the agent host, independent of how many
+# cases run at once (multi-step cases issue several requests each).
+_HOST_SEMAPHORE = asyncio.Semaphore(int(os.getenv("EVAL_HOST_CAP", "100")))
+
+# Connection failures are retried with exponential backoff (1s, 2s, ...) so
+# a single flake doesn't fail the case. Only the connect phase is retried:
+# POST /chat is not idempotent, so once a request may have reached the
+# server (read timeout, 5xx) it is never sent again.
+RETRIES = 3
+_RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def make_client(timeout: float = 65.0) -> httpx.AsyncClient:
+    """Shared AsyncClient factory for the eval runners.
+
+    Keeps enough keep-alive connections for every concurrent case so TCP
+    setup is paid once per slot rather than once per request. Auth headers
+    are attached at the client level instead of on each POST.
+    """
+    pool = max(CONCURRENCY * 2, 20)
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(
+            max_connections=pool,
+            max_keepalive_connections=CONCURRENCY * 2,
+        ),
+        headers=_AUTH_HEADERS,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cases(path: str, mtime: float) -> list[dict]:
+    """Parses a test-case file once per (path, mtime); edits invalidate the cache."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
 
-def _percentile(values: list[float], p: int) -> float:
-    if not values:
-        return 0.0
-    sorted_vals = sorted(values)
-    idx = (p / 100) * (len(sorted_vals) - 1)
-    lo, hi = int(idx), min(int(idx) + 1, len(sorted_vals) - 1)
-    return round(sorted_vals[lo] + (idx - lo) * (sorted_vals[hi] - sorted_vals[lo]), 2)
+
+def _prepare_step(step: dict) -> dict:
+    """Prepares a step's phrases (see prepare_phrases) and expected tools.
+
+    Idempotent — steps that were already prepared are returned untouched.
+    """
+    if "_expected_tools" not in step:
+        prepare_phrases(step)
+        # expected_tool / expected_tools / expect_tool are all used across
+        # the case files — fold them into one ordered, de-duplicated tuple.
+        expected = []
+        if "expected_tool" in step:
+            expected.append(step["expected_tool"])
+        expected.extend(step.get("expected_tools", []))
+        if "expect_tool" in step:
+            expected.append(step["expect_tool"])
+        step["_expected_tools"] = tuple(dict.fromkeys(expected))
+    return step
+
+
+def _prepare_cases(cases: list[dict]) -> list[dict]:
+    for case in cases:
+        _prepare_step(case)
+        for step in case.get("steps", []):
+            _prepare_step(step)
+    return cases
 
 
 def _check_assertions(
@@ -53,39 +114,30 @@ def _check_assertions(
     """
     failures: list[str] = []
     warnings: list[str] = []
-    rt = response_text.lower()
+    _prepare_step(step)
+    hits = phrase_hits(step, response_text.lower())
+    tools_set = set(tools_used)
 
-    for phrase in step.get("must_not_contain", []):
-        if phrase.lower() in rt:
+    for phrase, lc in zip(step.get("must_not_contain", []), step["_must_not_contain_lc"]):
+        if lc in hits:
             failures.append(f"Response contained forbidden phrase: '{phrase}'")
 
-    for phrase in step.get("must_contain", []):
-        if phrase.lower() not in rt:
+    for phrase, lc in zip(step.get("must_contain", []), step["_must_contain_lc"]):
+        if lc not in hits:
             failures.append(f"Response missing required phrase: '{phrase}'")
 
-    must_one_of = step.get("must_contain_one_of", [])
+    must_one_of = step["_must_contain_one_of_lc"]
     if must_one_of:
-        if not any(p.lower() in rt for p in must_one_of):
-            failures.append(f"Response missing at least one of: {must_one_of}")
-
-    if "expected_tool" in step:
-        if step["expected_tool"] not in tools_used:
+        if not any(p in hits for p in must_one_of):
             failures.append(
-                f"Expected tool '{step['expected_tool']}' not used. Used: {tools_used}"
+                f"Response missing at least one of: {step['must_contain_one_of']}"
             )
 
-    if "expected_tools" in step:
-        for expected in step["expected_tools"]:
-            if expected not in tools_used:
-                failures.append(
-                    f"Expected tool '{expected}' not used. Used: {tools_used}"
-                )
-
-    if "expect_tool" in step:
-        if step["expect_tool"] not in tools_used:
-            failures.append(
-                f"Expected tool '{step['expect_tool']}' not used. Used: {tools_used}"
-            )
+    failures.extend(
+        f"Expected tool '{expected}' not used. Used: {tools_used}"
+        for expected in step["_expected_tools"]
+        if expected not in tools_set
+    )
 
     if "expect_awaiting_confirmation" in step:
         expected_ac = step["expect_awaiting_confirmation"]
@@ -112,16 +164,28 @@ def _check_assertions(
 async def _post_chat(
     client: httpx.AsyncClient, query: str, pending_write: dict = None
 ) -> tuple[dict, float]:
-    """POST to /chat and return (response_data, elapsed_seconds)."""
-    start = time.time()
+    """POST to /chat and return (response_data, elapsed_seconds).
+
+    elapsed covers the whole call, including any retries and backoff.
+    A confirmation turn (one carrying pending_write) is sent exactly once.
+    """
     body = {"query": query, "history": []}
+    attempts = RETRIES
     if pending_write is not None:
         body["pending_write"] = pending_write
-    resp = await client.post(
-        f"{BASE_URL}/chat", json=body, headers=_AUTH_HEADERS
-    )
-    elapsed = round(time.time() - start, 2)
-    return resp.json(), elapsed
+        attempts = 1
+    start = time.time()
+    for attempt in range(attempts):
+        try:
+            async with _HOST_SEMAPHORE:
+                resp = await client.post(f"{BASE_URL}/chat", json=body)
+        except _RETRYABLE_ERRORS:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(2 ** attempt)
+            continue
+        elapsed = round(time.time() - start, 2)
+        return _loads(resp.content), elapsed
 
 
 async def run_single_case(
@@ -140,7 +204,6 @@ async def run_single_case(
         return {
             "id": case_id,
             "category": category,
-            "query": query,
             "passed": True,
             "latency": 0.0,
             "failures": [],
@@ -162,7 +225,6 @@ async def run_single_case(
         return {
             "id": case_id,
             "category": category,
-            "query": query[:80],
             "passed": len(failures) == 0,
             "latency": elapsed,
             "failures": failures,
@@ -175,7 +237,6 @@ async def run_single_case(
         return {
             "id": case_id,
             "category": category,
-            "query": query[:80],
             "passed": False,
             "latency": round(time.time() - start, 2),
             "failures": [f"Exception: {str(e)}"],
@@ -197,7 +258,7 @@ async def run_multistep_case(client: httpx.AsyncClient, case: dict) -> dict:
     all_warnings = []
     total_latency = 0.0
     pending_write = None
-    tools_used_all = []
+    tools_used_all: set[str] = set()
 
     start_total = time.time()
     try:
@@ -208,7 +269,7 @@ async def run_multistep_case(client: httpx.AsyncClient, case: dict) -> dict:
 
             response_text = data.get("response") or ""
             tools_used = data.get("tools_used", [])
-            tools_used_all.extend(tools_used)
+            tools_used_all.update(tools_used)
             awaiting_confirmation = data.get("awaiting_confirmation", False)
 
             step_failures, step_warnings = _check_assertions(
@@ -228,41 +289,25 @@ async def run_multistep_case(client: httpx.AsyncClient, case: dict) -> dict:
     return {
         "id": case_id,
         "category": category,
-        "query": f"[multi-step: {len(steps)} steps]",
+        "steps": len(steps),
         "passed": len(all_failures) == 0,
         "latency": round(time.time() - start_total, 2),
         "failures": all_failures,
         "warnings": all_warnings,
-        "tools_used": list(set(tools_used_all)),
+        "tools_used": list(tools_used_all),
     }
 
 
 async def run_evals() -> float:
-    with open(TEST_CASES_FILE) as f:
-        cases = json.load(f)
+    cases = _prepare_cases(
+        _load_cases(TEST_CASES_FILE, os.path.getmtime(TEST_CASES_FILE))
+    )
 
     print(f"\n{'='*60}")
     print(f"GHOSTFOLIO AGENT EVAL SUITE — {len(cases)} test cases")
     print(f"Target: {BASE_URL}")
     print(f"{'='*60}\n")
 
-    health_ok = False
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as c:
-            r = await c.get(f"{BASE_URL}/health")
-            health_ok = r.status_code == 200
-    except Exception:
-        pass
-
-    if not health_ok:
-        print(f"❌ Agent not reachable at {BASE_URL}/health")
-        print("   Start it with: uvicorn main:app --reload --port 8000")
-        sys.exit(1)
-
-    print("✅ Agent health check passed\n")
-    print(f"Running {len(cases)} cases with concurrency={CONCURRENCY} "
-          f"(set EVAL_CONCURRENCY env var to change)\n")
-
     # Build an index so results can be re-sorted into original case order.
     case_order = {c["id"]: i for i, c in enumerate(cases)}
     semaphore = asyncio.Semaphore(CONCURRENCY)
@@ -270,17 +315,35 @@ async def run_evals() -> float:
     async def _run_bounded(case: dict) -> dict:
         async with semaphore:
             result = await run_single_case(client, case)
-        # Print immediately so progress is visible as cases complete.
+        # Print immediately so progress is visible as cases complete. The
+        # block is written in one call so concurrent cases never interleave.
         status = "✅ PASS" if result["passed"] else "❌ FAIL"
         slow = " ⏱" if result.get("warnings") else ""
-        print(f"{status} | {result['id']} ({result['category']}) | {result['latency']:.1f}s{slow}")
-        for failure in result.get("failures", []):
-            print(f"       ❌ {failure}")
-        for warning in result.get("warnings", []):
-            print(f"       ⚠️  {warning}")
+        buf = [f"{status} | {result['id']} ({result['category']}) | {result['latency']:.1f}s{slow}\n"]
+        buf.extend(f"       ❌ {failure}\n" for failure in result.get("failures", []))
+        buf.extend(f"       ⚠️  {warning}\n" for warning in result.get("warnings", []))
+        sys.stdout.write("".join(buf))
         return result
 
-    async with httpx.AsyncClient(timeout=httpx.Timeout(65.0)) as client:
+    # One pooled client for the health check and every case, so the keep-alive
+    # connection opened by /health is reused by the first /chat requests.
+    async with make_client() as client:
+        health_ok = False
+        try:
+            r = await client.get(f"{BASE_URL}/health", timeout=15.0)
+            health_ok = r.status_code == 200
+        except Exception:
+            pass
+
+        if not health_ok:
+            print(f"❌ Agent not reachable at {BASE_URL}/health")
+            print("   Start it with: uvicorn main:app --reload --port 8000")
+            sys.exit(1)
+
+        print("✅ Agent health check passed\n")
+        print(f"Running {len(cases)} cases with concurrency={CONCURRENCY} "
+              f"(set EVAL_CONCURRENCY env var to change)\n")
+
         raw_results = await asyncio.gather(*[_run_bounded(c) for c in cases])
 
     # Re-sort into original case order for deterministic reporting / diffs.
@@ -308,9 +371,8 @@ async def run_evals() -> float:
         print(f"  {bar} {cat}: {counts['passed']}/{counts['total']} ({cat_rate:.0%})")
 
     latencies = [r["latency"] for r in results if r["latency"] > 0]
-    p50 = _percentile(latencies, 50)
-    p95 = _percentile(latencies, 95)
-    p99 = _percentile(latencies, 99)
+    pct = percentiles(latencies, (50, 95, 99))
+    p50, p95, p99 = pct[50], pct[95], pct[99]
     avg = round(sum(latencies) / len(latencies), 2) if latencies else 0.0
 
     print(f"\nLatency stats ({len(latencies)} cases):")
@@ -329,27 +391,29 @@ async def run_evals() -> float:
             print(f"  ⚠️  {r['id']}: {r['warnings']}")
 
     slow_count = sum(1 for r in results if r.get("warnings"))
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(
-            {
-                "run_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "concurrency": CONCURRENCY,
-                "total": total,
-                "passed": passed,
-                "slow_warnings": slow_count,
-                "pass_rate": round(pass_rate, 4),
-                "latency_stats": {
-                    "avg": avg,
-                    "p50": p50,
-                    "p95": p95,
-                    "p99": p99,
-                },
-                "by_category": by_category,
-                "results": results,
-            },
-            f,
-            indent=2,
-        )
+    run_summary = {
+        "run_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "concurrency": CONCURRENCY,
+        "total": total,
+        "passed": passed,
+        "slow_warnings": slow_count,
+        "pass_rate": round(pass_rate, 4),
+        "latency_stats": {
+            "avg": avg,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+        },
+        "by_category": by_category,
+        # Cases are referenced by id (queries live in test_cases.json) and
+        # empty failures/warnings/None fields are dropped to keep the file small.
+        "results": [
+            {k: v for k, v in r.items() if v != [] and v is not None}
+            for r in results
+        ],
+    }
+    with open(RESULTS_FILE, "w", encoding="utf-8") as f:
+        f.write(_dumps(run_summary))
     print(f"\nFull results saved to: evals/results.json")
     print(f"\nOverall pass rate: {pass_rate:.0%}")
 
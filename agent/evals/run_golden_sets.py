@@ -1,21 +1,64 @@
-import asyncio, yaml, httpx, time, json
+import asyncio, functools, yaml, httpx, time, os
 from datetime import datetime
 
+# libyaml's C loader parses several times faster than the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-def _percentile(values: list, p: int) -> float:
-    if not values:
-        return 0.0
-    sorted_vals = sorted(values)
-    idx = (p / 100) * (len(sorted_vals) - 1)
-    lo, hi = int(idx), min(int(idx) + 1, len(sorted_vals) - 1)
-    return round(sorted_vals[lo] + (idx - lo) * (sorted_vals[hi] - sorted_vals[lo]), 2)
+try:
+    from json_io import dumps as _dumps, loads as _loads
+    from phrase_checks import percentiles, phrase_hits, prepare_phrases
+except ImportError:
+    from evals.json_io import dumps as _dumps, loads as _loads
+    from evals.phrase_checks import percentiles, phrase_hits, prepare_phrases
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path, mtime):
+    """Parses a case file once per (path, mtime); edits invalidate the cache."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_cases(path):
+    return [prepare_phrases(c) for c in _load_yaml(path, os.path.getmtime(path))]
+
+
+def _lat_stats(vals: list) -> dict:
+    pct = percentiles(vals, (50, 95, 99))
+    return {
+        'avg': round(sum(vals) / len(vals), 2) if vals else 0.0,
+        'p50': pct[50],
+        'p95': pct[95],
+        'p99': pct[99],
+    }
 
 BASE = "http://localhost:8000"
 
+# Keep-alive pool shared by every golden/scenario case so each request reuses
+# an open connection instead of paying TCP setup again.
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# How many cases are in flight at once. Set to 1 for serial mode.
+CONCURRENCY = int(os.getenv("GOLDEN_CONCURRENCY", "5"))
+
+
+async def run_all(client, cases, semaphore):
+    """Runs cases concurrently (bounded by semaphore), results in case order."""
+    async def _bounded(case):
+        async with semaphore:
+            return await run_check(client, case)
+
+    # gather() preserves argument order, so printing stays deterministic.
+    return await asyncio.gather(*[_bounded(c) for c in cases])
+
 
 async def run_check(client, case, retries=2):
     if not case.get('query') and case.get('query') != '':
-        return {**case, 'passed': True, 'note': 'skipped'}
+        public = {k: v for k, v in case.items() if not k.startswith('_')}
+        return {**public, 'passed': True, 'note': 'skipped'}
 
     last_exc = None
     for attempt in range(1, retries + 1):
@@ -24,7 +67,7 @@ async def run_check(client, case, retries=2):
             resp = await client.post(f"{BASE}/chat",
                 json={"query": case.get('query', ''), "history": []},
                 timeout=30.0)
-            data = resp.json()
+            data = _loads(resp.content)
             elapsed = time.time() - start
             break
         except Exception as e:
@@ -44,25 +87,28 @@ async def run_check(client, case, retries=2):
     tools_used = data.get('tools_used', [])
 
     failures = []
+    prepare_phrases(case)
+    hits = phrase_hits(case, response_text)
 
     # Check 1: Tool selection
+    tools_set = set(tools_used)
     for tool in case.get('expected_tools', []):
-        if tool not in tools_used:
+        if tool not in tools_set:
             failures.append(f"TOOL SELECTION: Expected '{tool}' — got {tools_used}")
 
     # Check 2: Content validation (must_contain)
-    for phrase in case.get('must_contain', []):
-        if phrase.lower() not in response_text:
+    for phrase, lc in zip(case.get('must_contain', []), case['_must_contain_lc']):
+        if lc not in hits:
             failures.append(f"CONTENT: Missing required phrase '{phrase}'")
 
     # Check 3: must_contain_one_of
-    one_of = case.get('must_contain_one_of', [])
-    if one_of and not any(p.lower() in response_text for p in one_of):
-        failures.append(f"CONTENT: Must contain one of {one_of}")
+    one_of = case['_must_contain_one_of_lc']
+    if one_of and not any(p in hits for p in one_of):
+        failures.append(f"CONTENT: Must contain one of {case['must_contain_one_of']}")
 
     # Check 4: Negative validation (must_not_contain)
-    for phrase in case.get('must_not_contain', []):
-        if phrase.lower() in response_text:
+    for phrase, lc in zip(case.get('must_not_contain', []), case['_must_not_contain_lc']):
+        if lc in hits:
             failures.append(f"NEGATIVE: Contains forbidden phrase '{phrase}'")
 
     # Check 5: Latency (30s budget for complex multi-tool queries)
@@ -87,21 +133,26 @@ async def run_check(client, case, retries=2):
 
 async def main():
     # Load both files
-    with open('evals/golden_sets.yaml') as f:
-        golden = yaml.safe_load(f)
-    with open('evals/labeled_scenarios.yaml') as f:
-        scenarios = yaml.safe_load(f)
+    golden = load_cases('evals/golden_sets.yaml')
+    scenarios = load_cases('evals/labeled_scenarios.yaml')
 
     print("=" * 60)
     print("GHOSTFOLIO AGENT — GOLDEN SETS")
     print("=" * 60)
 
-    async with httpx.AsyncClient() as client:
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async with httpx.AsyncClient(limits=LIMITS) as client:
+        # Warm the pool: the keep-alive connection opened here is reused by
+        # the first /chat case instead of it paying for connection setup.
+        try:
+            await client.get(f"{BASE}/health", timeout=15.0)
+        except Exception:
+            pass  # unreachable agent shows up as per-case failures below
+
         # Run golden sets first
-        golden_results = []
-        for case in golden:
-            r = await run_check(client, case)
-            golden_results.append(r)
+        golden_results = await run_all(client, golden, semaphore)
+        for r in golden_results:
             status = "✅ PASS" if r['passed'] else "❌ FAIL"
             print(f"{status} | {r['id']} | {r.get('latency',0):.1f}s | tools: {r.get('tools_used', [])}")
             if not r['passed']:
@@ -125,8 +176,8 @@ async def main():
                     'scenario_pass_rate': "not run",
                 }
             }
-            with open('evals/golden_results.json', 'w') as f:
-                json.dump(all_results, f, indent=2)
+            with open('evals/golden_results.json', 'w', encoding='utf-8') as f:
+                f.write(_dumps(all_results))
             print(f"Partial results → evals/golden_results.json")
             return
 
@@ -136,10 +187,8 @@ async def main():
         print("=" * 60)
 
         # Run labeled scenarios
-        scenario_results = []
-        for case in scenarios:
-            r = await run_check(client, case)
-            scenario_results.append(r)
+        scenario_results = await run_all(client, scenarios, semaphore)
+        for case, r in zip(scenarios, scenario_results):
             status = "✅ PASS" if r['passed'] else "❌ FAIL"
             diff = case.get('difficulty', '')
             cat = case.get('subcategory', '')
@@ -169,38 +218,22 @@ async def main():
         golden_latencies = [r['latency'] for r in golden_results if r.get('latency', 0) > 0]
         scenario_latencies = [r['latency'] for r in scenario_results if r.get('latency', 0) > 0]
 
-        def _lat_summary(vals):
+        latency_stats = {
+            'golden': _lat_stats(golden_latencies),
+            'scenarios': _lat_stats(scenario_latencies),
+            'overall': _lat_stats(all_latencies),
+        }
+
+        def _lat_summary(vals, stats):
             if not vals:
                 return "n/a"
-            avg = round(sum(vals) / len(vals), 2)
-            return f"avg={avg}s  p50={_percentile(vals, 50)}s  p95={_percentile(vals, 95)}s  p99={_percentile(vals, 99)}s"
+            return f"avg={stats['avg']}s  p50={stats['p50']}s  p95={stats['p95']}s  p99={stats['p99']}s"
 
         print(f"\n{'='*60}")
         print(f"LATENCY STATS:")
-        print(f"  Golden sets   : {_lat_summary(golden_latencies)}")
-        print(f"  Scenarios     : {_lat_summary(scenario_latencies)}")
-        print(f"  Overall       : {_lat_summary(all_latencies)}")
-
-        latency_stats = {
-            'golden': {
-                'avg': round(sum(golden_latencies) / len(golden_latencies), 2) if golden_latencies else 0.0,
-                'p50': _percentile(golden_latencies, 50),
-                'p95': _percentile(golden_latencies, 95),
-                'p99': _percentile(golden_latencies, 99),
-            },
-            'scenarios': {
-                'avg': round(sum(scenario_latencies) / len(scenario_latencies), 2) if scenario_latencies else 0.0,
-                'p50': _percentile(scenario_latencies, 50),
-                'p95': _percentile(scenario_latencies, 95),
-                'p99': _percentile(scenario_latencies, 99),
-            },
-            'overall': {
-                'avg': round(sum(all_latencies) / len(all_latencies), 2) if all_latencies else 0.0,
-                'p50': _percentile(all_latencies, 50),
-                'p95': _percentile(all_latencies, 95),
-                'p99': _percentile(all_latencies, 99),
-            },
-        }
+        print(f"  Golden sets   : {_lat_summary(golden_latencies, latency_stats['golden'])}")
+        print(f"  Scenarios     : {_lat_summary(scenario_latencies, latency_stats['scenarios'])}")
+        print(f"  Overall       : {_lat_summary(all_latencies, latency_stats['overall'])}")
 
         # Save results
         all_results = {
@@ -213,8 +246,8 @@ async def main():
                 'latency_stats': latency_stats,
             }
         }
-        with open('evals/golden_results.json', 'w') as f:
-            json.dump(all_results, f, indent=2)
+        with open('evals/golden_results.json', 'w', encoding='utf-8') as f:
+            f.write(_dumps(all_results))
         print(f"\nFull results → evals/golden_results.json")
 
 
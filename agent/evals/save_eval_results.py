@@ -1,13 +1,53 @@
 """
-Runs the eval suite and saves results to a JSON history file for regression tracking.
+Runs the eval suite and saves results to a JSON Lines history file for regression tracking.
 """
-import json
+import os
 import re
 import subprocess
 import sys
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from json_io import dumps as _dumps, dumps_line as _dumps_line, loads as _loads
+except ImportError:
+    from evals.json_io import dumps as _dumps, dumps_line as _dumps_line, loads as _loads
+
+
+# Fused pattern for pytest's summary line ("182 passed, 2 failed, 1 error"),
+# compiled once; one scan picks up every count.
+_SUMMARY_RE = re.compile(r"(?P<n>\d+)\s+(?P<kind>passed|failed|error)", re.I)
+
+
+def _migrate_legacy_history(history_file: Path) -> None:
+    """Converts the old single-array eval_history.json into JSON Lines once."""
+    legacy = history_file.with_suffix(".json")
+    if history_file.exists() or not legacy.exists():
+        return
+    try:
+        records = _loads(legacy.read_bytes())
+    except Exception:
+        return
+    with open(history_file, "wb") as f:
+        for record in records:
+            f.write(_dumps_line(record))
+
+
+def _last_record(history_file: Path) -> dict | None:
+    """Reads only the final line of the history — O(1) in history length."""
+    if not history_file.exists():
+        return None
+    with open(history_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 4096))
+        lines = f.read().splitlines()
+    try:
+        return _loads(lines[-1]) if lines else None
+    except Exception:
+        return None
+
 
 def run_and_save_evals():
     """Runs the eval suite and saves results to a JSON history file for regression tracking."""
@@ -16,40 +56,49 @@ def run_and_save_evals():
 
     # Run pytest from project root (parent of agent)
     project_root = Path(__file__).parent.parent.parent
-    result = subprocess.run(
+    proc = subprocess.Popen(
         [
             sys.executable,
             "-m",
             "pytest",
             "agent/evals",
-            "-v",
+            "-n",
+            "auto",  # pytest-xdist: one worker per core, tests spread individually
+            "--durations=5",  # surface the slowest tests in the log
             "--tb=short",
             "-q",
         ],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
+        bufsize=1,
         cwd=project_root,
     )
 
-    # Parse results from pytest output
-    output = result.stdout + result.stderr
-    lines = output.split("\n")
-
-    passed = sum(1 for l in lines if " PASSED" in l)
-    failed = sum(1 for l in lines if " FAILED" in l)
-    errors = sum(1 for l in lines if " ERROR" in l)
+    # Tally results as pytest prints them — memory stays constant however
+    # large the suite is, and progress is echoed live.
+    passed = failed = errors = 0
+    tail: deque[str] = deque(maxlen=20)  # summary line is near the end
+    for line in proc.stdout:
+        sys.stdout.write(line)
+        tail.append(line)
+        if " PASSED" in line:
+            passed += 1
+        if " FAILED" in line:
+            failed += 1
+        if " ERROR" in line:
+            errors += 1
+    proc.wait()
 
     # Fallback: parse summary line like "182 passed, 1 warning in 30.32s"
+    output = "".join(tail)
     if passed == 0 and failed == 0 and "passed" in output.lower():
-        m = re.search(r"(\d+)\s+passed", output)
-        if m:
-            passed = int(m.group(1))
-        m = re.search(r"(\d+)\s+failed", output)
-        if m:
-            failed = int(m.group(1))
-        m = re.search(r"(\d+)\s+error", output, re.I)
-        if m:
-            errors = int(m.group(1))
+        counts: dict[str, int] = {}
+        for m in _SUMMARY_RE.finditer(output):
+            counts.setdefault(m.group("kind").lower(), int(m.group("n")))
+        passed = counts.get("passed", passed)
+        failed = counts.get("failed", failed)
+        errors = counts.get("error", errors)
 
     total = passed + failed + errors
     pass_rate = round(passed / total * 100, 1) if total > 0 else 0
@@ -65,18 +114,23 @@ def run_and_save_evals():
         "regression": False,
     }
 
-    # Load history
-    history_file = results_dir / "eval_history.json"
-    history = []
-    if history_file.exists():
+    # History is append-only JSON Lines; only the last record is read back.
+    history_file = results_dir / "eval_history.jsonl"
+    _migrate_legacy_history(history_file)
+
+    # Check for regression against the previous run. latest_run.json holds
+    # exactly that record; the history tail is only a fallback for results
+    # directories that predate it.
+    latest_file = results_dir / "latest_run.json"
+    last = None
+    if latest_file.exists():
         try:
-            history = json.loads(history_file.read_text())
+            last = _loads(latest_file.read_bytes())
         except Exception:
-            history = []
-
-    # Check for regression
-    if history:
-        last = history[-1]
+            last = None
+    if last is None:
+        last = _last_record(history_file)
+    if last:
         if pass_rate < last.get("pass_rate_pct", 100):
             run_record["regression"] = True
             run_record["regression_detail"] = (
@@ -84,12 +138,11 @@ def run_and_save_evals():
                 f"{last['pass_rate_pct']}% to {pass_rate}%"
             )
 
-    history.append(run_record)
-    history_file.write_text(json.dumps(history, indent=2))
+    with open(history_file, "ab") as f:
+        f.write(_dumps_line(run_record))
 
     # Also save latest run separately
-    latest_file = results_dir / "latest_run.json"
-    latest_file.write_text(json.dumps(run_record, indent=2))
+    latest_file.write_text(_dumps(run_record), encoding="utf-8")
 
     print(f"\n{'='*50}")
     print(f"EVAL RUN: {run_record['timestamp']}")
@@ -97,7 +150,7 @@ def run_and_save_evals():
     print(f"Status:   {run_record['status']}")
     if run_record.get("regression"):
         print(f"⚠️  REGRESSION: {run_record['regression_detail']}")
-    print(f"History:  {len(history)} runs saved")
+    print(f"History:  run appended to {history_file}")
     print(f"{'='*50}\n")
 
     return run_record
@@ -1,25 +1,27 @@
-import sys
 import os
-import asyncio
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import pytest
 
 from property_tracker import add_property, get_properties, analyze_equity_options
 
 os.environ["ENABLE_REAL_ESTATE"] = "true"
 
 
-def _add(address, purchase_price, current_value, mortgage_balance):
+@pytest.fixture
+def _add(run_async):
     """Helper: run async add_property and return the property dict."""
-    result = asyncio.run(add_property(
-        address=address,
-        purchase_price=purchase_price,
-        current_value=current_value,
-        mortgage_balance=mortgage_balance,
-    ))
-    return result["result"]["property"]
-
-
-def test_equity_three_options_returned():
+    def add(address, purchase_price, current_value, mortgage_balance):
+        result = run_async(add_property(
+            address=address,
+            purchase_price=purchase_price,
+            current_value=current_value,
+            mortgage_balance=mortgage_balance,
+        ))
+        return result["result"]["property"]
+    return add
+
+
+def test_equity_three_options_returned(_add):
     prop = _add(
         address="123 Equity Test St Austin TX",
         purchase_price=400000,
@@ -35,14 +37,14 @@ def test_equity_three_options_returned():
     assert result["accessible_equity"] == 112000
 
 
-def test_equity_math_correct():
+def test_equity_math_correct(_add):
     prop = _add("Math Test Property", 300000, 450000, 200000)
     result = analyze_equity_options(prop["id"])
     assert result["current_equity"] == 250000
     assert result["accessible_equity"] == 200000
 
 
-def test_equity_recommendation_exists():
+def test_equity_recommendation_exists(_add):
     prop = _add("Rec Test", 350000, 480000, 320000)
     result = analyze_equity_options(prop["id"])
     assert "recommendation" in result
@@ -15,70 +15,74 @@ Network calls: all Teleport API calls are mocked via conftest.py autouse
 fixture (mock_teleport_no_network). Tests are deterministic and fast.
 """
 
-import asyncio
 import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
 
 os.environ.setdefault("ENABLE_REAL_ESTATE", "true")
 os.environ.setdefault("PROPERTIES_DB_PATH", ":memory:")
 
+import time
+
 import pytest
 
+from family_planner import plan_family_finances
+from property_tracker import (
+    add_property,
+    analyze_equity_options,
+    get_properties,
+    get_real_estate_equity,
+    get_total_net_worth,
+    property_batch,
+    property_store_clear,
+    remove_property,
+    update_property,
+)
+from realestate_strategy import simulate_real_estate_strategy
+from relocation_runway import calculate_relocation_runway
+from wealth_bridge import calculate_down_payment_power, calculate_job_offer_affordability
+from wealth_visualizer import analyze_wealth_position
+
 
 # ---------------------------------------------------------------------------
-# Helper: run coroutine from sync context
+# Fixture: every test starts from an empty property store
 # ---------------------------------------------------------------------------
 
-def _run(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-def _clear():
-    from property_tracker import property_store_clear
+@pytest.fixture(autouse=True)
+def _empty_property_store():
     property_store_clear()
 
 
 # ============================================================================
-# HAPPY PATH TESTS (20 tests)
+# HAPPY PATH TESTS (17 tests + 3 strategy variants below)
 # ============================================================================
 
 # TYPE: happy_path
 # INPUT: add home with purchase price, current value, and mortgage
 # EXPECTED: property created, equity = current_value - mortgage_balance
 # CRITERIA: equity == 175000, success == True
-def test_hp_add_property_basic():
-    _clear()
-    from property_tracker import add_property
-    result = _run(add_property(
+@pytest.mark.asyncio
+async def test_hp_add_property_basic():
+    result = await add_property(
         address="My Primary Home",
         purchase_price=420000,
         current_value=490000,
         mortgage_balance=315000,
-    ))
+    )
     assert result["success"] is True
     prop = result["result"]["property"]
-    assert prop["equity"] == pytest.approx(175000)
+    assert prop["equity"] == 175000
 
 
 # TYPE: happy_path
 # INPUT: add two properties, check combined equity
 # EXPECTED: total equity = sum of both properties' equity
 # CRITERIA: total_equity matches manual calculation
-def test_hp_add_two_properties_combined_equity():
-    _clear()
-    from property_tracker import add_property, get_real_estate_equity
-    _run(add_property("Home A", 400000, 480000, 300000))   # equity=180000
-    _run(add_property("Home B", 300000, 350000, 200000))   # equity=150000
-    result = _run(get_real_estate_equity())
+@pytest.mark.asyncio
+async def test_hp_add_two_properties_combined_equity():
+    await add_property("Home A", 400000, 480000, 300000)   # equity=180000
+    await add_property("Home B", 300000, 350000, 200000)   # equity=150000
+    result = await get_real_estate_equity()
     assert result["success"] is True
-    assert result["result"]["total_real_estate_equity"] == pytest.approx(330000)
+    assert result["result"]["total_real_estate_equity"] == 330000
     assert result["result"]["property_count"] == 2
 
 
@@ -86,40 +90,14 @@ def test_hp_add_two_properties_combined_equity():
 # INPUT: get total net worth with portfolio and property
 # EXPECTED: total = portfolio + real estate equity
 # CRITERIA: total_net_worth == 94000 + 175000 = 269000
-def test_hp_total_net_worth_combined():
-    _clear()
-    from property_tracker import add_property, get_total_net_worth
-    _run(add_property("Test Home", 420000, 490000, 315000))  # equity=175000
-    result = _run(get_total_net_worth(portfolio_value=94000))
+@pytest.mark.asyncio
+async def test_hp_total_net_worth_combined():
+    await add_property("Test Home", 420000, 490000, 315000)  # equity=175000
+    result = await get_total_net_worth(portfolio_value=94000)
     assert result["success"] is True
-    assert result["result"]["total_net_worth"] == pytest.approx(269000)
+    assert result["result"]["total_net_worth"] == 269000
     assert result["result"]["investment_portfolio"] == 94000
-    assert result["result"]["real_estate_equity"] == pytest.approx(175000)
-
-
-# TYPE: happy_path
-# INPUT: strategy simulation with 10-year horizon
-# EXPECTED: final net worth exceeds starting portfolio
-# CRITERIA: total_net_worth > initial_portfolio_value
-def test_hp_strategy_10_year_growth():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(94000, 120000, 400000, total_years=10)
-    assert result is not None
-    assert "final_picture" in result
-    assert result["final_picture"]["total_net_worth"] > 94000
-
-
-# TYPE: happy_path
-# INPUT: strategy simulation with user-provided 3% appreciation
-# EXPECTED: strategy uses 3% not default 4%
-# CRITERIA: assumptions show 3.0%
-def test_hp_strategy_user_appreciation():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000,
-        annual_appreciation=0.03,
-    )
-    assert result["strategy"]["assumptions"]["annual_appreciation"] == "3.0%"
+    assert result["result"]["real_estate_equity"] == 175000
 
 
 # TYPE: happy_path
@@ -127,7 +105,6 @@ def test_hp_strategy_user_appreciation():
 # EXPECTED: Fed Reserve comparison with correct median for under_35 bracket
 # CRITERIA: median_for_age == 39000, percentile_estimate present
 def test_hp_wealth_position_age_34():
-    from wealth_visualizer import analyze_wealth_position
     result = analyze_wealth_position(94000, 34, 120000)
     assert "current_position" in result
     assert result["current_position"]["median_for_age"] == 39000
@@ -140,7 +117,6 @@ def test_hp_wealth_position_age_34():
 # EXPECTED: uses 35_to_44 bracket median of $135,000
 # CRITERIA: median_for_age == 135000
 def test_hp_wealth_position_age_42():
-    from wealth_visualizer import analyze_wealth_position
     result = analyze_wealth_position(200000, 42, 150000)
     assert result["current_position"]["median_for_age"] == 135000
 
@@ -149,10 +125,9 @@ def test_hp_wealth_position_age_42():
 # INPUT: equity options for property with substantial equity
 # EXPECTED: 3 distinct options returned (keep, refi, rental)
 # CRITERIA: len(options) >= 3, each option has projection
-def test_hp_equity_options_three_scenarios():
-    _clear()
-    from property_tracker import add_property, analyze_equity_options
-    prop = _run(add_property("Equity Home", 400000, 520000, 370000))
+@pytest.mark.asyncio
+async def test_hp_equity_options_three_scenarios():
+    prop = await add_property("Equity Home", 400000, 520000, 370000)
     pid = prop["result"]["property"]["id"]
     result = analyze_equity_options(pid)
     assert "options" in result
@@ -164,7 +139,6 @@ def test_hp_equity_options_three_scenarios():
 # EXPECTED: childcare costs, monthly surplus, income_impact
 # CRITERIA: income_impact present, monthly_surplus_after is a number
 def test_hp_family_plan_one_child_austin():
-    from family_planner import plan_family_finances
     result = plan_family_finances("Austin", 120000, num_planned_children=1)
     assert "income_impact" in result
     assert "monthly_surplus_after" in result["income_impact"]
@@ -176,7 +150,6 @@ def test_hp_family_plan_one_child_austin():
 # EXPECTED: verdict returned, months to emergency fund calculated
 # CRITERIA: verdict present, milestones_if_you_move has emergency_fund milestone
 def test_hp_relocation_runway_seattle():
-    from relocation_runway import calculate_relocation_runway
     result = calculate_relocation_runway(
         current_salary=120000,
         offer_salary=180000,
@@ -193,15 +166,13 @@ def test_hp_relocation_runway_seattle():
 # INPUT: job offer affordability check Austin → SF
 # EXPECTED: COL-adjusted comparison, is_real_raise boolean
 # CRITERIA: is_real_raise present, verdict non-empty
-@pytest.mark.asyncio
-async def test_hp_job_offer_affordability():
-    from wealth_bridge import calculate_job_offer_affordability
-    result = await calculate_job_offer_affordability(
+def test_hp_job_offer_affordability(run_async):
+    result = run_async(calculate_job_offer_affordability(
         offer_salary=180000,
         offer_city="Seattle",
         current_salary=120000,
         current_city="Austin",
-    )
+    ))
     assert "is_real_raise" in result
     assert isinstance(result["is_real_raise"], bool)
     assert "verdict" in result
@@ -213,7 +184,6 @@ async def test_hp_job_offer_affordability():
 # EXPECTED: at least one Austin-area market affordable at full 20% down
 # CRITERIA: can_afford_full True for at least one market
 def test_hp_down_payment_94k_portfolio():
-    from wealth_bridge import calculate_down_payment_power
     result = calculate_down_payment_power(94000)
     assert "markets" in result
     affordable = [m for m in result["markets"] if m["can_afford_full"]]
@@ -224,30 +194,28 @@ def test_hp_down_payment_94k_portfolio():
 # INPUT: list properties when one exists
 # EXPECTED: property appears in list with correct fields
 # CRITERIA: len(properties) == 1, equity field present
-def test_hp_list_properties_one():
-    _clear()
-    from property_tracker import add_property, get_properties
-    _run(add_property("My Home", 400000, 480000, 320000))
-    result = _run(get_properties())
+@pytest.mark.asyncio
+async def test_hp_list_properties_one():
+    await add_property("My Home", 400000, 480000, 320000)
+    result = await get_properties()
     assert result["success"] is True
     props = result["result"]["properties"]
     assert len(props) == 1
     assert "equity" in props[0]
-    assert props[0]["equity"] == pytest.approx(160000)
+    assert props[0]["equity"] == 160000
 
 
 # TYPE: happy_path
 # INPUT: remove property by ID
 # EXPECTED: property no longer in list
 # CRITERIA: property count drops from 1 to 0
-def test_hp_remove_property_success():
-    _clear()
-    from property_tracker import add_property, remove_property, get_properties
-    prop = _run(add_property("Remove Me", 300000, 350000, 200000))
+@pytest.mark.asyncio
+async def test_hp_remove_property_success():
+    prop = await add_property("Remove Me", 300000, 350000, 200000)
     pid = prop["result"]["property"]["id"]
-    removed = _run(remove_property(pid))
+    removed = await remove_property(pid)
     assert removed["success"] is True
-    listed = _run(get_properties())
+    listed = await get_properties()
     ids = [p["id"] for p in listed["result"]["properties"]]
     assert pid not in ids
 
@@ -256,29 +224,14 @@ def test_hp_remove_property_success():
 # INPUT: update property current value
 # EXPECTED: equity recalculates correctly
 # CRITERIA: equity increases after value update
-def test_hp_update_property_value():
-    _clear()
-    from property_tracker import add_property, update_property
-    prop = _run(add_property("Update Test", 400000, 450000, 320000))
+@pytest.mark.asyncio
+async def test_hp_update_property_value():
+    prop = await add_property("Update Test", 400000, 450000, 320000)
     pid = prop["result"]["property"]["id"]
-    updated = _run(update_property(pid, current_value=470000))
+    updated = await update_property(pid, current_value=470000)
     assert updated["success"] is True
     new_equity = updated["result"]["property"]["equity"]
-    assert new_equity == pytest.approx(150000)  # 470000 - 320000
-
-
-# TYPE: happy_path
-# INPUT: strategy simulation single property scenario
-# EXPECTED: result contains at least 1 property
-# CRITERIA: properties_owned >= 1
-def test_hp_strategy_single_property():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000,
-        buy_interval_years=10,  # only 1 purchase in 10 years
-        total_years=10,
-    )
-    assert result["final_picture"]["num_properties_owned"] >= 1
+    assert new_equity == 150000  # 470000 - 320000
 
 
 # TYPE: happy_path
@@ -286,7 +239,6 @@ def test_hp_strategy_single_property():
 # EXPECTED: household income reflects both incomes
 # CRITERIA: total_household_income > single income
 def test_hp_family_plan_with_partner():
-    from family_planner import plan_family_finances
     result = plan_family_finances("Austin", 120000, partner_income=80000, num_planned_children=1)
     assert "income_impact" in result
     data = result["income_impact"]
@@ -298,7 +250,6 @@ def test_hp_family_plan_with_partner():
 # EXPECTED: total net worth includes real estate
 # CRITERIA: total_net_worth > portfolio_value alone
 def test_hp_wealth_position_with_real_estate():
-    from wealth_visualizer import analyze_wealth_position
     result = analyze_wealth_position(
         portfolio_value=94000,
         age=34,
@@ -307,7 +258,7 @@ def test_hp_wealth_position_with_real_estate():
     )
     assert "current_position" in result
     pos = result["current_position"]
-    assert pos["total_net_worth"] == pytest.approx(269000)
+    assert pos["total_net_worth"] == 269000
 
 
 # TYPE: happy_path
@@ -315,7 +266,6 @@ def test_hp_wealth_position_with_real_estate():
 # EXPECTED: destination surplus higher than current, verdict positive
 # CRITERIA: destination monthly_surplus > 0, verdict present
 def test_hp_relocation_to_cheaper_city():
-    from relocation_runway import calculate_relocation_runway
     result = calculate_relocation_runway(
         current_salary=150000,
         offer_salary=140000,
@@ -333,12 +283,11 @@ def test_hp_relocation_to_cheaper_city():
 # INPUT: strategy with conservative appreciation preset
 # EXPECTED: conservative < optimistic final net worth
 # CRITERIA: conservative_net_worth < optimistic_net_worth
-def test_hp_strategy_conservative_vs_optimistic():
-    from realestate_strategy import simulate_real_estate_strategy
-    conservative = simulate_real_estate_strategy(
+def test_hp_strategy_conservative_vs_optimistic(strategy_cache):
+    conservative = strategy_cache(
         94000, 120000, 400000, annual_appreciation=0.02,
     )
-    optimistic = simulate_real_estate_strategy(
+    optimistic = strategy_cache(
         94000, 120000, 400000, annual_appreciation=0.06,
     )
     assert (conservative["final_picture"]["total_net_worth"] <
@@ -346,7 +295,7 @@ def test_hp_strategy_conservative_vs_optimistic():
 
 
 # ============================================================================
-# EDGE CASE TESTS (12 tests)
+# EDGE CASE TESTS (10 tests + 2 strategy variants below)
 # ============================================================================
 
 # TYPE: edge_case
@@ -354,7 +303,6 @@ def test_hp_strategy_conservative_vs_optimistic():
 # EXPECTED: graceful response, not a crash
 # CRITERIA: returns dict, no exception
 def test_ec_zero_portfolio_value():
-    from wealth_visualizer import analyze_wealth_position
     result = analyze_wealth_position(0, 30, 50000)
     assert result is not None
     assert isinstance(result, dict)
@@ -365,39 +313,24 @@ def test_ec_zero_portfolio_value():
 # INPUT: property with no mortgage (fully paid off)
 # EXPECTED: equity equals current value
 # CRITERIA: equity == current_value, equity_pct == 100.0
-def test_ec_paid_off_property():
-    _clear()
-    from property_tracker import add_property
-    result = _run(add_property(
+@pytest.mark.asyncio
+async def test_ec_paid_off_property():
+    result = await add_property(
         address="Paid Off Home",
         purchase_price=300000,
         current_value=380000,
         mortgage_balance=0,
-    ))
+    )
     prop = result["result"]["property"]
-    assert prop["equity"] == pytest.approx(380000)
+    assert prop["equity"] == 380000
     assert prop["equity_pct"] == pytest.approx(100.0)
 
 
-# TYPE: edge_case
-# INPUT: strategy simulation for just 1 year
-# EXPECTED: returns valid result, no crash
-# CRITERIA: result has final_picture and timeline, no exception
-def test_ec_strategy_single_year():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(50000, 80000, 300000, total_years=1)
-    assert result is not None
-    assert "final_picture" in result
-    assert "timeline" in result
-    assert isinstance(result["final_picture"]["num_properties_owned"], int)
-
-
 # TYPE: edge_case
 # INPUT: equity options on nonexistent property ID
 # EXPECTED: error dict returned, not exception
 # CRITERIA: "error" key present in result
 def test_ec_equity_nonexistent_property():
-    from property_tracker import analyze_equity_options
     result = analyze_equity_options("does-not-exist-999")
     assert result is not None
     assert "error" in result
@@ -408,7 +341,6 @@ def test_ec_equity_nonexistent_property():
 # EXPECTED: graceful response, no ZeroDivisionError
 # CRITERIA: returns dict, no exception raised
 def test_ec_family_planner_zero_income():
-    from family_planner import plan_family_finances
     result = plan_family_finances("Austin", 0, num_planned_children=1)
     assert result is not None
     assert isinstance(result, dict)
@@ -419,7 +351,6 @@ def test_ec_family_planner_zero_income():
 # EXPECTED: correctly identified as median tier
 # CRITERIA: percentile_estimate contains "50th" or similar
 def test_ec_wealth_exactly_at_median():
-    from wealth_visualizer import analyze_wealth_position
     # median for under_35 is 39000
     result = analyze_wealth_position(39000, 30, 60000)
     pos = result["current_position"]
@@ -430,12 +361,11 @@ def test_ec_wealth_exactly_at_median():
 # INPUT: empty property list — get net worth with no properties
 # EXPECTED: net worth equals portfolio value, real estate equity is 0
 # CRITERIA: total_net_worth == portfolio_value, real_estate_equity == 0
-def test_ec_net_worth_no_properties():
-    _clear()
-    from property_tracker import get_total_net_worth
-    result = _run(get_total_net_worth(portfolio_value=50000))
+@pytest.mark.asyncio
+async def test_ec_net_worth_no_properties():
+    result = await get_total_net_worth(portfolio_value=50000)
     assert result["success"] is True
-    assert result["result"]["total_net_worth"] == pytest.approx(50000)
+    assert result["result"]["total_net_worth"] == 50000
     assert result["result"]["real_estate_equity"] == 0
 
 
@@ -444,7 +374,6 @@ def test_ec_net_worth_no_properties():
 # EXPECTED: no crash, verdict makes sense
 # CRITERIA: returns dict with verdict field
 def test_ec_same_city_relocation():
-    from relocation_runway import calculate_relocation_runway
     result = calculate_relocation_runway(
         current_salary=120000,
         offer_salary=125000,
@@ -456,37 +385,18 @@ def test_ec_same_city_relocation():
     assert "verdict" in result
 
 
-# TYPE: edge_case
-# INPUT: strategy with very large portfolio (1M)
-# EXPECTED: simulation completes without overflow
-# CRITERIA: total_net_worth is a positive finite number
-def test_ec_strategy_large_portfolio():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(
-        initial_portfolio_value=1_000_000,
-        annual_income=300000,
-        first_home_price=1_500_000,
-        total_years=10,
-    )
-    assert result is not None
-    nw = result["final_picture"]["total_net_worth"]
-    assert nw > 0
-    assert nw < 1e15  # sanity check: not overflowing
-
-
 # TYPE: edge_case
 # INPUT: analyze property with equity exceeding current value (impossible)
 # EXPECTED: graceful handling, equity capped or error message
 # CRITERIA: no crash, returns dict
-def test_ec_mortgage_exceeds_value():
-    _clear()
-    from property_tracker import add_property
-    result = _run(add_property(
+@pytest.mark.asyncio
+async def test_ec_mortgage_exceeds_value():
+    result = await add_property(
         address="Underwater Property",
         purchase_price=400000,
         current_value=300000,
         mortgage_balance=380000,
-    ))
+    )
     # Should succeed but equity will be negative (underwater)
     assert result["success"] is True
     prop = result["result"]["property"]
@@ -500,7 +410,6 @@ def test_ec_mortgage_exceeds_value():
 # EXPECTED: costs scaled proportionally, no crash
 # CRITERIA: childcare costs for 5 > childcare for 1
 def test_ec_family_many_children():
-    from family_planner import plan_family_finances
     result1 = plan_family_finances("Austin", 200000, num_planned_children=1)
     result5 = plan_family_finances("Austin", 200000, num_planned_children=5)
     assert result1 is not None and result5 is not None
@@ -515,33 +424,31 @@ def test_ec_family_many_children():
 # EXPECTED: uses highest bracket (65+), no crash
 # CRITERIA: median_for_age == 409000 (65_to_74 bracket)
 def test_ec_wealth_very_old_age():
-    from wealth_visualizer import analyze_wealth_position
     result = analyze_wealth_position(500000, 82, 60000)
     assert result is not None
     assert result["current_position"]["median_for_age"] == 409000
 
 
 # ============================================================================
-# ADVERSARIAL TESTS (12 tests)
+# ADVERSARIAL TESTS (9 tests + 3 strategy variants below)
 # ============================================================================
 
 # TYPE: adversarial
 # INPUT: property address contains SQL injection
 # EXPECTED: stored safely as a string, DB still works after
 # CRITERIA: no exception, subsequent queries work normally
-def test_adv_sql_injection_address():
-    _clear()
-    from property_tracker import add_property, get_properties
+@pytest.mark.asyncio
+async def test_adv_sql_injection_address():
     malicious = "'; DROP TABLE properties; --"
-    result = _run(add_property(
+    result = await add_property(
         address=malicious,
         purchase_price=300000,
         current_value=350000,
         mortgage_balance=200000,
-    ))
+    )
     assert result["success"] is True
     # DB still works after the injection attempt
-    props = _run(get_properties())
+    props = await get_properties()
     assert props["success"] is True
 
 
@@ -549,78 +456,28 @@ def test_adv_sql_injection_address():
 # INPUT: negative property values
 # EXPECTED: validation catches it OR handles gracefully
 # CRITERIA: no uncaught exception
-def test_adv_negative_property_value():
-    _clear()
-    from property_tracker import add_property
+@pytest.mark.asyncio
+async def test_adv_negative_property_value():
     try:
-        result = _run(add_property(
+        result = await add_property(
             address="Bad Property",
             purchase_price=-100000,
             current_value=-50000,
             mortgage_balance=0,
-        ))
+        )
         # If it accepts, result should be a dict
         assert result is not None
     except (ValueError, AssertionError):
         pass  # Rejecting invalid input is correct behavior
 
 
-# TYPE: adversarial
-# INPUT: impossible appreciation rate (1000% = 10.0)
-# EXPECTED: simulation runs without crash
-# CRITERIA: returns result dict with final_picture
-def test_adv_extreme_appreciation_rate():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000,
-        annual_appreciation=10.0,  # 1000% — extreme input
-    )
-    assert result is not None
-    assert "final_picture" in result
-
-
-# TYPE: adversarial
-# INPUT: strategy with zero annual income
-# EXPECTED: graceful, not ZeroDivision
-# CRITERIA: returns dict, no crash
-def test_adv_strategy_zero_income():
-    from realestate_strategy import simulate_real_estate_strategy
-    try:
-        result = simulate_real_estate_strategy(
-            initial_portfolio_value=100000,
-            annual_income=0,
-            first_home_price=300000,
-            total_years=5,
-        )
-        assert result is not None
-        assert isinstance(result, dict)
-    except ZeroDivisionError:
-        pytest.fail("ZeroDivisionError raised with zero income")
-
-
-# TYPE: adversarial
-# INPUT: mortgage rate of 100% (extreme)
-# EXPECTED: simulation completes, not crash
-# CRITERIA: result is a dict with final_picture
-def test_adv_extreme_mortgage_rate():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000,
-        mortgage_rate=1.00,  # 100% rate
-        total_years=5,
-    )
-    assert result is not None
-    assert "final_picture" in result
-
-
 # TYPE: adversarial
 # INPUT: address that is only whitespace
 # EXPECTED: validation returns structured error
 # CRITERIA: success=False, error dict present
-def test_adv_whitespace_address():
-    _clear()
-    from property_tracker import add_property
-    result = _run(add_property(address="   \t\n  ", purchase_price=300000))
+@pytest.mark.asyncio
+async def test_adv_whitespace_address():
+    result = await add_property(address="   \t\n  ", purchase_price=300000)
     assert result["success"] is False
     assert "error" in result
 
@@ -629,10 +486,9 @@ def test_adv_whitespace_address():
 # INPUT: purchase price is zero
 # EXPECTED: validation error returned
 # CRITERIA: success=False
-def test_adv_zero_purchase_price():
-    _clear()
-    from property_tracker import add_property
-    result = _run(add_property(address="Test", purchase_price=0))
+@pytest.mark.asyncio
+async def test_adv_zero_purchase_price():
+    result = await add_property(address="Test", purchase_price=0)
     assert result["success"] is False
 
 
@@ -641,7 +497,6 @@ def test_adv_zero_purchase_price():
 # EXPECTED: graceful handling, no crash
 # CRITERIA: returns dict
 def test_adv_negative_portfolio_wealth():
-    from wealth_visualizer import analyze_wealth_position
     try:
         result = analyze_wealth_position(-5000, 30, 60000)
         assert result is not None
@@ -655,7 +510,6 @@ def test_adv_negative_portfolio_wealth():
 # EXPECTED: uses default costs, no crash
 # CRITERIA: returns dict with income_impact
 def test_adv_unknown_city_family_plan():
-    from family_planner import plan_family_finances
     result = plan_family_finances("Xanadu City", 80000, num_planned_children=1)
     assert result is not None
     assert "income_impact" in result
@@ -665,10 +519,9 @@ def test_adv_unknown_city_family_plan():
 # INPUT: remove a nonexistent property ID
 # EXPECTED: structured error dict returned
 # CRITERIA: success=False, error code = NOT_FOUND
-def test_adv_remove_nonexistent_property():
-    _clear()
-    from property_tracker import remove_property
-    result = _run(remove_property("nonexistent-id-999"))
+@pytest.mark.asyncio
+async def test_adv_remove_nonexistent_property():
+    result = await remove_property("nonexistent-id-999")
     assert result["success"] is False
     assert isinstance(result["error"], dict)
     assert result["error"]["code"] == "PROPERTY_TRACKER_NOT_FOUND"
@@ -679,7 +532,6 @@ def test_adv_remove_nonexistent_property():
 # EXPECTED: uses fallback/default or handles gracefully
 # CRITERIA: no crash
 def test_adv_negative_down_payment_pct():
-    from realestate_strategy import simulate_real_estate_strategy
     try:
         result = simulate_real_estate_strategy(
             94000, 120000, 400000,
@@ -695,7 +547,6 @@ def test_adv_negative_down_payment_pct():
 # EXPECTED: no crash, returns dict
 # CRITERIA: result is a dict
 def test_adv_empty_city_relocation():
-    from relocation_runway import calculate_relocation_runway
     try:
         result = calculate_relocation_runway(
             current_salary=100000,
@@ -709,6 +560,78 @@ def test_adv_empty_city_relocation():
         pass  # Failing gracefully is acceptable
 
 
+# ============================================================================
+# STRATEGY SIMULATION VARIANTS (8 tests)
+# Parametrized simulate_real_estate_strategy smoke checks, grouped by the
+# kind of assertion; ids keep the original happy_path / edge_case /
+# adversarial test names.
+# ============================================================================
+
+_STRATEGY_BASE = {
+    "initial_portfolio_value": 94000,
+    "annual_income": 120000,
+    "first_home_price": 400000,
+}
+
+
+@pytest.mark.parametrize("kwargs,field,lower,upper", [
+    # TYPE: happy_path — 10-year horizon grows net worth past the portfolio
+    pytest.param(
+        dict(total_years=10), "total_net_worth", 94000, float("inf"),
+        id="hp_strategy_10_year_growth",
+    ),
+    # TYPE: happy_path — one purchase in 10 years still owns >= 1 property
+    pytest.param(
+        dict(buy_interval_years=10, total_years=10), "num_properties_owned", 0, float("inf"),
+        id="hp_strategy_single_property",
+    ),
+    # TYPE: edge_case — $1M portfolio completes without overflow
+    pytest.param(
+        dict(initial_portfolio_value=1_000_000, annual_income=300000,
+             first_home_price=1_500_000, total_years=10),
+        "total_net_worth", 0, 1e15,
+        id="ec_strategy_large_portfolio",
+    ),
+])
+def test_strategy_final_picture_bounds(strategy_cache, kwargs, field, lower, upper):
+    """final_picture[field] lies strictly between lower and upper."""
+    result = strategy_cache(**{**_STRATEGY_BASE, **kwargs})
+    value = result["final_picture"][field]
+    assert lower < value < upper
+
+
+@pytest.mark.parametrize("kwargs", [
+    # TYPE: edge_case — 1-year simulation returns final_picture and timeline
+    pytest.param(
+        dict(initial_portfolio_value=50000, annual_income=80000,
+             first_home_price=300000, total_years=1),
+        id="ec_strategy_single_year",
+    ),
+    # TYPE: adversarial — 1000% appreciation runs without crash
+    pytest.param(dict(annual_appreciation=10.0), id="adv_extreme_appreciation_rate"),
+    # TYPE: adversarial — zero income is graceful, not ZeroDivisionError
+    pytest.param(
+        dict(initial_portfolio_value=100000, annual_income=0,
+             first_home_price=300000, total_years=5),
+        id="adv_strategy_zero_income",
+    ),
+    # TYPE: adversarial — 100% mortgage rate completes, not crash
+    pytest.param(dict(mortgage_rate=1.00, total_years=5), id="adv_extreme_mortgage_rate"),
+])
+def test_strategy_completes(strategy_cache, kwargs):
+    """Extreme or minimal inputs still produce a full result, no exception."""
+    result = strategy_cache(**{**_STRATEGY_BASE, **kwargs})
+    assert "final_picture" in result
+    assert "timeline" in result
+    assert isinstance(result["final_picture"]["num_properties_owned"], int)
+
+
+# TYPE: happy_path — user-provided 3% appreciation is used, not the 4% default
+def test_hp_strategy_user_appreciation(strategy_cache):
+    result = strategy_cache(**_STRATEGY_BASE, annual_appreciation=0.03)
+    assert result["strategy"]["assumptions"]["annual_appreciation"] == "3.0%"
+
+
 # ============================================================================
 # MULTI-STEP TESTS (12 tests)
 # ============================================================================
@@ -717,33 +640,33 @@ def test_adv_empty_city_relocation():
 # INPUT: add property → get total net worth → verify property appears
 # EXPECTED: net worth increases by property equity after adding
 # CRITERIA: total_net_worth > portfolio_value_alone
-def test_ms_add_then_net_worth():
-    _clear()
-    from property_tracker import add_property, get_total_net_worth
-    _run(add_property(
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_add_then_net_worth():
+    await add_property(
         address="Multi Step Test",
         purchase_price=350000,
         current_value=420000,
         mortgage_balance=280000,
-    ))  # equity = 140000
-    result = _run(get_total_net_worth(portfolio_value=94000))
-    assert result["result"]["total_net_worth"] == pytest.approx(234000)
-    assert result["result"]["real_estate_equity"] == pytest.approx(140000)
+    )  # equity = 140000
+    result = await get_total_net_worth(portfolio_value=94000)
+    assert result["result"]["total_net_worth"] == 234000
+    assert result["result"]["real_estate_equity"] == 140000
 
 
 # TYPE: multi_step
 # INPUT: add property → analyze equity options
 # EXPECTED: equity options reference added property, 3 scenarios returned
 # CRITERIA: options has 3 entries, each has 10-year projection
-def test_ms_add_then_equity_options():
-    _clear()
-    from property_tracker import add_property, analyze_equity_options
-    prop = _run(add_property(
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_add_then_equity_options():
+    prop = await add_property(
         address="Equity Chain Test",
         purchase_price=400000,
         current_value=520000,
         mortgage_balance=370000,
-    ))
+    )
     result = analyze_equity_options(prop["result"]["property"]["id"])
     assert "options" in result
     assert len(result["options"]) >= 3
@@ -753,14 +676,14 @@ def test_ms_add_then_equity_options():
 # INPUT: add two properties → remove one → verify only one remains
 # EXPECTED: after removal, list shows exactly 1 property
 # CRITERIA: len(properties) == 1 after removal
-def test_ms_add_two_remove_one():
-    _clear()
-    from property_tracker import add_property, remove_property, get_properties
-    p1 = _run(add_property("Home 1", 400000, 450000, 300000))
-    p2 = _run(add_property("Home 2", 350000, 400000, 250000))
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_add_two_remove_one():
+    p1 = await add_property("Home 1", 400000, 450000, 300000)
+    p2 = await add_property("Home 2", 350000, 400000, 250000)
     id1 = p1["result"]["property"]["id"]
-    _run(remove_property(id1))
-    listed = _run(get_properties())
+    await remove_property(id1)
+    listed = await get_properties()
     props = listed["result"]["properties"]
     assert len(props) == 1
     assert props[0]["id"] == p2["result"]["property"]["id"]
@@ -770,10 +693,14 @@ def test_ms_add_two_remove_one():
 # INPUT: strategy simulation → use final net worth in wealth position check
 # EXPECTED: chaining results without errors
 # CRITERIA: both return valid dicts, wealth check uses strategy output
-def test_ms_strategy_then_wealth_check():
-    from realestate_strategy import simulate_real_estate_strategy
-    from wealth_visualizer import analyze_wealth_position
-    strategy = simulate_real_estate_strategy(94000, 120000, 400000, total_years=10)
+@pytest.mark.extended
+def test_ms_strategy_then_wealth_check(strategy_cache):
+    strategy = strategy_cache(
+        initial_portfolio_value=94000,
+        annual_income=120000,
+        first_home_price=400000,
+        total_years=10,
+    )
     final_worth = strategy["final_picture"]["total_net_worth"]
     wealth = analyze_wealth_position(
         portfolio_value=final_worth,
@@ -788,9 +715,8 @@ def test_ms_strategy_then_wealth_check():
 # INPUT: family planning → use reduced savings in wealth position
 # EXPECTED: lower savings rate flows into retirement projection
 # CRITERIA: both tools return valid dicts
+@pytest.mark.extended
 def test_ms_family_then_wealth():
-    from family_planner import plan_family_finances
-    from wealth_visualizer import analyze_wealth_position
     family = plan_family_finances("Austin", 120000, num_planned_children=1)
     assert "income_impact" in family
     reduced_savings = max(0, family["income_impact"]["monthly_surplus_after"] * 12)
@@ -809,8 +735,6 @@ def test_ms_family_then_wealth():
 # CRITERIA: both return their respective fields correctly
 @pytest.mark.asyncio
 async def test_ms_job_offer_then_runway():
-    from wealth_bridge import calculate_job_offer_affordability
-    from relocation_runway import calculate_relocation_runway
     offer = await calculate_job_offer_affordability(
         offer_salary=180000,
         offer_city="Seattle",
@@ -832,14 +756,15 @@ async def test_ms_job_offer_then_runway():
 # INPUT: add property → update value → check net worth reflects update
 # EXPECTED: net worth uses updated value not original
 # CRITERIA: net worth after update > net worth after initial add
-def test_ms_add_update_then_net_worth():
-    _clear()
-    from property_tracker import add_property, update_property, get_total_net_worth
-    prop = _run(add_property("Growing Home", 400000, 450000, 320000))
-    pid = prop["result"]["property"]["id"]
-    nw_before = _run(get_total_net_worth(portfolio_value=50000))
-    _run(update_property(pid, current_value=500000))
-    nw_after = _run(get_total_net_worth(portfolio_value=50000))
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_add_update_then_net_worth():
+    with property_batch():
+        prop = await add_property("Growing Home", 400000, 450000, 320000)
+        pid = prop["result"]["property"]["id"]
+        nw_before = await get_total_net_worth(portfolio_value=50000)
+        await update_property(pid, current_value=500000)
+        nw_after = await get_total_net_worth(portfolio_value=50000)
     assert nw_after["result"]["total_net_worth"] > nw_before["result"]["total_net_worth"]
 
 
@@ -847,12 +772,11 @@ def test_ms_add_update_then_net_worth():
 # INPUT: add property → get equity → use in wealth position
 # EXPECTED: wealth position uses real estate equity from property tracker
 # CRITERIA: position with RE equity > position without
-def test_ms_property_equity_in_wealth_position():
-    _clear()
-    from property_tracker import add_property, get_real_estate_equity
-    from wealth_visualizer import analyze_wealth_position
-    _run(add_property("Wealth Test", 400000, 500000, 300000))  # equity=200000
-    equity_result = _run(get_real_estate_equity())
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_property_equity_in_wealth_position():
+    await add_property("Wealth Test", 400000, 500000, 300000)  # equity=200000
+    equity_result = await get_real_estate_equity()
     equity = equity_result["result"]["total_real_estate_equity"]
     pos_with_re = analyze_wealth_position(94000, 34, 120000, real_estate_equity=equity)
     pos_without = analyze_wealth_position(94000, 34, 120000)
@@ -863,31 +787,31 @@ def test_ms_property_equity_in_wealth_position():
 # INPUT: full CRUD cycle — create, read, update, delete
 # EXPECTED: each operation succeeds, state consistent throughout
 # CRITERIA: all 4 operations return success=True, final list is empty
-def test_ms_full_crud_cycle():
-    _clear()
-    from property_tracker import add_property, get_properties, update_property, remove_property
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_full_crud_cycle():
 
     # CREATE
-    prop = _run(add_property("CRUD Home", 400000, 450000, 320000))
+    prop = await add_property("CRUD Home", 400000, 450000, 320000)
     assert prop["success"] is True
     pid = prop["result"]["property"]["id"]
 
     # READ
-    listed = _run(get_properties())
+    listed = await get_properties()
     ids = [p["id"] for p in listed["result"]["properties"]]
     assert pid in ids
 
     # UPDATE
-    updated = _run(update_property(pid, current_value=480000))
+    updated = await update_property(pid, current_value=480000)
     assert updated["success"] is True
-    assert updated["result"]["property"]["equity"] == pytest.approx(160000)
+    assert updated["result"]["property"]["equity"] == 160000
 
     # DELETE
-    removed = _run(remove_property(pid))
+    removed = await remove_property(pid)
     assert removed["success"] is True
 
     # Verify empty
-    after = _run(get_properties())
+    after = await get_properties()
     assert after["result"]["properties"] == []
 
 
@@ -895,23 +819,22 @@ def test_ms_full_crud_cycle():
 # INPUT: multiple properties → wealth position uses combined equity
 # EXPECTED: total equity from all properties flows into net worth
 # CRITERIA: net worth = portfolio + combined equity
-def test_ms_multiple_properties_net_worth():
-    _clear()
-    from property_tracker import add_property, get_total_net_worth
-    _run(add_property("Home A", 400000, 480000, 300000))  # equity=180000
-    _run(add_property("Home B", 300000, 380000, 260000))  # equity=120000
-    result = _run(get_total_net_worth(portfolio_value=94000))
+@pytest.mark.extended
+@pytest.mark.asyncio
+async def test_ms_multiple_properties_net_worth():
+    await add_property("Home A", 400000, 480000, 300000)  # equity=180000
+    await add_property("Home B", 300000, 380000, 260000)  # equity=120000
+    result = await get_total_net_worth(portfolio_value=94000)
     expected = 94000 + 180000 + 120000  # = 394000
-    assert result["result"]["total_net_worth"] == pytest.approx(expected)
+    assert result["result"]["total_net_worth"] == expected
 
 
 # TYPE: multi_step
 # INPUT: relocation runway → family plan in destination city
 # EXPECTED: can chain city data across both tools
 # CRITERIA: both return valid dicts for Seattle
+@pytest.mark.extended
 def test_ms_runway_then_family_plan():
-    from relocation_runway import calculate_relocation_runway
-    from family_planner import plan_family_finances
     runway = calculate_relocation_runway(
         current_salary=120000,
         offer_salary=180000,
@@ -928,10 +851,12 @@ def test_ms_runway_then_family_plan():
 # INPUT: strategy simulation over 20 years → verify timeline length
 # EXPECTED: timeline has 20+ entries covering each year
 # CRITERIA: len(timeline) >= 20
-def test_ms_strategy_long_horizon():
-    from realestate_strategy import simulate_real_estate_strategy
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000,
+@pytest.mark.extended
+def test_ms_strategy_long_horizon(strategy_cache):
+    result = strategy_cache(
+        initial_portfolio_value=94000,
+        annual_income=120000,
+        first_home_price=400000,
         total_years=20,
         buy_interval_years=4,
     )
@@ -943,23 +868,28 @@ def test_ms_strategy_long_horizon():
 
 # TYPE: happy_path
 # INPUT: simple portfolio query timed end to end
-# EXPECTED: tool executes within 30 seconds
-# CRITERIA: elapsed time under 30s — not a performance
-#           gate but confirms agent responds at all
-def test_latency_agent_responds_within_bounds():
+# EXPECTED: warm tool calls average well under half a second
+# CRITERIA: mean of repeated get_properties calls < 0.5s. The call is an
+#           in-memory read taking microseconds, so this only catches
+#           pathological hangs (e.g. a blocking network or disk call),
+#           not ordinary slowdowns
+@pytest.mark.asyncio
+async def test_latency_agent_responds_within_bounds():
     """Verify agent tools respond within acceptable
     time bounds. LLM synthesis is excluded from this
     test — we test tool execution speed only."""
-    import time
-    from property_tracker import get_properties
-
-    start = time.time()
-    result = _run(get_properties())
-    elapsed = time.time() - start
 
+    result = await get_properties()  # cold call: connection + schema setup
     assert result is not None
-    assert elapsed < 5.0, (
-        f"Tool execution took {elapsed:.2f}s — "
-        f"should be under 5s. LLM synthesis latency "
+
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await get_properties()
+    mean = (time.perf_counter() - start) / rounds
+
+    assert mean < 0.5, (
+        f"Tool execution averaged {mean:.3f}s — "
+        f"budget is 0.5s. LLM synthesis latency "
         f"(8-10s) is separate and documented."
     )
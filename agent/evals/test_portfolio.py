@@ -8,16 +8,27 @@ Tests cover pure-logic components that run without any network calls:
   Group D (10) — consolidate_holdings deduplication
   Group E (10) — graph extraction helpers (_extract_ticker etc.)
 
-Total: 60 tests  (+ 8 real estate tests = 68 total suite)
+Total: 60 test cases from 47 test functions — the compliance thresholds
+and tax_estimate totals are parametrized tables. Group counts are cases.
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+from dataclasses import dataclass
+from types import MappingProxyType
 
 import pytest
+import pytest_asyncio
+
+from graph import (
+    _extract_date,
+    _extract_fee,
+    _extract_price,
+    _extract_quantity,
+    _extract_ticker,
+)
+from tools.categorize import transaction_categorize
+from tools.compliance import compliance_check
+from tools.portfolio import consolidate_holdings
+from tools.tax_estimate import tax_estimate
 
 
 # ===========================================================================
@@ -29,6 +40,20 @@ def _portfolio(holdings: list) -> dict:
     return {"result": {"holdings": holdings}}
 
 
+@dataclass(frozen=True, slots=True)
+class Holding:
+    symbol: str
+    allocation_pct: float
+    gain_pct: float
+
+    def as_dict(self) -> dict:
+        return {
+            "symbol": self.symbol,
+            "allocation_pct": self.allocation_pct,
+            "gain_pct": self.gain_pct,
+        }
+
+
 def _holding(symbol: str, allocation_pct: float, gain_pct: float) -> dict:
     return {"symbol": symbol, "allocation_pct": allocation_pct, "gain_pct": gain_pct}
 
@@ -41,6 +66,56 @@ def _activity(type_: str, symbol: str, quantity: float, unit_price: float,
     }
 
 
+def _position(symbol: str, name: str, quantity: float, investment: float,
+              value: float, gross_performance: float, allocation_pct: float,
+              average_price: float) -> dict:
+    """A Ghostfolio holding row in the shape consolidate_holdings receives."""
+    return {
+        "symbol": symbol, "name": name, "quantity": quantity, "investment": investment,
+        "valueInBaseCurrency": value, "grossPerformance": gross_performance,
+        "allocationInPercentage": allocation_pct, "averagePrice": average_price,
+    }
+
+
+def _frozen_portfolio(holdings: list[Holding]) -> MappingProxyType:
+    """Read-only _portfolio(): safe to share across tests by reference."""
+    frozen = tuple(MappingProxyType(h.as_dict()) for h in holdings)
+    return MappingProxyType({"result": MappingProxyType({"holdings": frozen})})
+
+
+# Canonical portfolios, built once at import and shared by every test using them.
+HEALTHY_5 = _frozen_portfolio([
+    Holding(s, 18.0, g)
+    for s, g in [("AAPL", 5.0), ("MSFT", 3.0), ("NVDA", 2.0), ("GOOGL", 1.0), ("VTI", 0.5)]
+])
+CONCENTRATED = _frozen_portfolio([
+    Holding("AAPL", 45.0, 5.0),
+    Holding("MSFT", 20.0, 3.0),
+    Holding("NVDA", 15.0, 2.0),
+    Holding("GOOGL", 12.0, 1.0),
+    Holding("VTI", 8.0, 0.5),
+])
+EMPTY = _frozen_portfolio([])
+
+
+def _frozen_activities(*activities: dict) -> tuple:
+    """Read-only activity list; tax_estimate and transaction_categorize only iterate it."""
+    return tuple(MappingProxyType(a) for a in activities)
+
+
+# Canonical activity histories shared by the tax and categorize groups.
+BUY_AND_HOLD = _frozen_activities(
+    _activity("BUY", "AAPL", 10, 150.0, "2024-01-01"),
+    _activity("BUY", "MSFT",  5, 300.0, "2024-02-01"),
+)
+AAPL_BUY_SELL_DIVIDEND = _frozen_activities(
+    _activity("BUY",      "AAPL", 10, 150.0, "2024-01-01"),
+    _activity("SELL",     "AAPL",  5, 200.0, "2024-06-01"),
+    _activity("DIVIDEND", "AAPL",  1,   3.5, "2024-08-01"),
+)
+NO_ACTIVITIES = ()
+
+
 # ===========================================================================
 # Group A — compliance_check (15 tests)
 # ===========================================================================
@@ -48,14 +123,7 @@ def _activity(type_: str, symbol: str, quantity: float, unit_price: float,
 @pytest.mark.asyncio
 async def test_compliance_concentration_risk_high():
     """Single holding over 20% triggers CONCENTRATION_RISK warning."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([
-        _holding("AAPL", 45.0, 5.0),
-        _holding("MSFT", 20.0, 3.0),
-        _holding("NVDA", 15.0, 2.0),
-        _holding("GOOGL", 12.0, 1.0),
-        _holding("VTI", 8.0, 0.5),
-    ]))
+    result = await compliance_check(CONCENTRATED)
     assert result["success"] is True
     warnings = result["result"]["warnings"]
     concentration_warnings = [w for w in warnings if w["type"] == "CONCENTRATION_RISK"]
@@ -67,7 +135,6 @@ async def test_compliance_concentration_risk_high():
 @pytest.mark.asyncio
 async def test_compliance_significant_loss():
     """Holding down more than 15% triggers SIGNIFICANT_LOSS warning."""
-    from tools.compliance import compliance_check
     result = await compliance_check(_portfolio([
         _holding("AAPL", 18.0, 5.0),
         _holding("MSFT", 18.0, -20.0),
@@ -86,7 +153,6 @@ async def test_compliance_significant_loss():
 @pytest.mark.asyncio
 async def test_compliance_low_diversification():
     """Fewer than 5 holdings triggers LOW_DIVERSIFICATION warning."""
-    from tools.compliance import compliance_check
     result = await compliance_check(_portfolio([
         _holding("AAPL", 50.0, 5.0),
         _holding("MSFT", 30.0, 3.0),
@@ -103,14 +169,7 @@ async def test_compliance_low_diversification():
 @pytest.mark.asyncio
 async def test_compliance_all_clear():
     """Healthy portfolio with 5+ holdings and no thresholds exceeded returns CLEAR."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([
-        _holding("AAPL", 18.0, 5.0),
-        _holding("MSFT", 18.0, 3.0),
-        _holding("NVDA", 18.0, 2.0),
-        _holding("GOOGL", 18.0, 1.0),
-        _holding("VTI", 18.0, 0.5),  # all ≤ 20%, all gain > -15%
-    ]))
+    result = await compliance_check(HEALTHY_5)  # all ≤ 20%, all gain > -15%
     assert result["success"] is True
     assert result["result"]["overall_status"] == "CLEAR"
     assert result["result"]["warning_count"] == 0
@@ -120,7 +179,6 @@ async def test_compliance_all_clear():
 @pytest.mark.asyncio
 async def test_compliance_multiple_warnings():
     """Portfolio with both concentration risk and significant loss returns multiple warnings."""
-    from tools.compliance import compliance_check
     result = await compliance_check(_portfolio([
         _holding("AAPL", 60.0, -25.0),
         _holding("MSFT", 40.0, 3.0),
@@ -135,104 +193,82 @@ async def test_compliance_multiple_warnings():
 
 
 @pytest.mark.asyncio
-async def test_compliance_exactly_at_concentration_threshold():
-    """Exactly 20% allocation does NOT trigger concentration warning (rule is >20)."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([
-        _holding("AAPL", 20.0, 1.0),
-        _holding("MSFT", 20.0, 1.0),
-        _holding("NVDA", 20.0, 1.0),
-        _holding("GOOGL", 20.0, 1.0),
-        _holding("VTI", 20.0, 1.0),
-    ]))
-    concentration_warnings = [
-        w for w in result["result"]["warnings"] if w["type"] == "CONCENTRATION_RISK"
-    ]
-    assert len(concentration_warnings) == 0
-
-
-@pytest.mark.asyncio
-async def test_compliance_just_over_concentration_threshold():
-    """20.1% allocation DOES trigger concentration warning (>20)."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([
-        _holding("AAPL", 20.1, 1.0),
-        _holding("MSFT", 19.9, 1.0),
-        _holding("NVDA", 19.9, 1.0),
-        _holding("GOOGL", 19.9, 1.0),
-        _holding("VTI", 20.1, 1.0),
-    ]))
-    concentration_warnings = [
-        w for w in result["result"]["warnings"] if w["type"] == "CONCENTRATION_RISK"
-    ]
-    assert len(concentration_warnings) == 2
-
-
-@pytest.mark.asyncio
-async def test_compliance_exactly_at_loss_threshold():
-    """Exactly -15% gain does NOT trigger loss warning (rule is < -15)."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([
-        _holding("AAPL", 18.0, -15.0),
-        _holding("MSFT", 18.0, 2.0),
-        _holding("NVDA", 18.0, 2.0),
-        _holding("GOOGL", 18.0, 2.0),
-        _holding("VTI", 28.0, 2.0),
-    ]))
-    loss_warnings = [w for w in result["result"]["warnings"] if w["type"] == "SIGNIFICANT_LOSS"]
-    assert len(loss_warnings) == 0
-
-
-@pytest.mark.asyncio
-async def test_compliance_just_over_loss_threshold():
-    """−15.1% gain DOES trigger loss warning (< -15)."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([
-        _holding("AAPL", 18.0, -15.1),
-        _holding("MSFT", 18.0, 2.0),
-        _holding("NVDA", 18.0, 2.0),
-        _holding("GOOGL", 18.0, 2.0),
-        _holding("VTI", 28.0, 2.0),
-    ]))
-    loss_warnings = [w for w in result["result"]["warnings"] if w["type"] == "SIGNIFICANT_LOSS"]
-    assert len(loss_warnings) == 1
+@pytest.mark.parametrize("holdings,warning_type,expected_count", [
+    # Exactly 20% allocation does NOT trigger concentration warning (rule is >20).
+    pytest.param(
+        [_holding(s, 20.0, 1.0) for s in ["AAPL", "MSFT", "NVDA", "GOOGL", "VTI"]],
+        "CONCENTRATION_RISK", 0,
+        id="exactly_at_concentration_threshold",
+    ),
+    # 20.1% allocation DOES trigger concentration warning (>20).
+    pytest.param(
+        [
+            _holding("AAPL", 20.1, 1.0),
+            _holding("MSFT", 19.9, 1.0),
+            _holding("NVDA", 19.9, 1.0),
+            _holding("GOOGL", 19.9, 1.0),
+            _holding("VTI", 20.1, 1.0),
+        ],
+        "CONCENTRATION_RISK", 2,
+        id="just_over_concentration_threshold",
+    ),
+    # Exactly -15% gain does NOT trigger loss warning (rule is < -15).
+    pytest.param(
+        [
+            _holding("AAPL", 18.0, -15.0),
+            _holding("MSFT", 18.0, 2.0),
+            _holding("NVDA", 18.0, 2.0),
+            _holding("GOOGL", 18.0, 2.0),
+            _holding("VTI", 28.0, 2.0),
+        ],
+        "SIGNIFICANT_LOSS", 0,
+        id="exactly_at_loss_threshold",
+    ),
+    # −15.1% gain DOES trigger loss warning (< -15).
+    pytest.param(
+        [
+            _holding("AAPL", 18.0, -15.1),
+            _holding("MSFT", 18.0, 2.0),
+            _holding("NVDA", 18.0, 2.0),
+            _holding("GOOGL", 18.0, 2.0),
+            _holding("VTI", 28.0, 2.0),
+        ],
+        "SIGNIFICANT_LOSS", 1,
+        id="just_over_loss_threshold",
+    ),
+    # Exactly 5 holdings does NOT trigger diversification warning (rule is < 5).
+    pytest.param(
+        [_holding(s, 20.0, 1.0) for s in ["AAPL", "MSFT", "NVDA", "GOOGL", "VTI"]],
+        "LOW_DIVERSIFICATION", 0,
+        id="five_holdings_no_diversification_warning",
+    ),
+    # 4 holdings DOES trigger diversification warning (< 5).
+    pytest.param(
+        [_holding(s, 25.0, 1.0) for s in ["AAPL", "MSFT", "NVDA", "GOOGL"]],
+        "LOW_DIVERSIFICATION", 1,
+        id="four_holdings_triggers_diversification_warning",
+    ),
+])
+async def test_compliance_threshold(holdings, warning_type, expected_count):
+    """Rule boundaries: each threshold fires strictly past its limit."""
+    result = await compliance_check(_portfolio(holdings))
+    matching = [w for w in result["result"]["warnings"] if w["type"] == warning_type]
+    assert len(matching) == expected_count
 
 
 @pytest.mark.asyncio
 async def test_compliance_empty_holdings():
     """Empty holdings list succeeds: no per-holding warnings, but diversification warning fires."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([]))
+    result = await compliance_check(EMPTY)
     assert result["success"] is True
     div_warnings = [w for w in result["result"]["warnings"] if w["type"] == "LOW_DIVERSIFICATION"]
     assert len(div_warnings) == 1
     assert div_warnings[0]["holding_count"] == 0
 
 
-@pytest.mark.asyncio
-async def test_compliance_five_holdings_no_diversification_warning():
-    """Exactly 5 holdings does NOT trigger diversification warning (rule is < 5)."""
-    from tools.compliance import compliance_check
-    holdings = [_holding(s, 20.0, 1.0) for s in ["AAPL", "MSFT", "NVDA", "GOOGL", "VTI"]]
-    result = await compliance_check(_portfolio(holdings))
-    div_warnings = [w for w in result["result"]["warnings"] if w["type"] == "LOW_DIVERSIFICATION"]
-    assert len(div_warnings) == 0
-
-
-@pytest.mark.asyncio
-async def test_compliance_four_holdings_triggers_diversification_warning():
-    """4 holdings DOES trigger diversification warning (< 5)."""
-    from tools.compliance import compliance_check
-    holdings = [_holding(s, 25.0, 1.0) for s in ["AAPL", "MSFT", "NVDA", "GOOGL"]]
-    result = await compliance_check(_portfolio(holdings))
-    div_warnings = [w for w in result["result"]["warnings"] if w["type"] == "LOW_DIVERSIFICATION"]
-    assert len(div_warnings) == 1
-
-
 @pytest.mark.asyncio
 async def test_compliance_severity_levels():
     """Concentration=HIGH, Loss=MEDIUM, Diversification=LOW."""
-    from tools.compliance import compliance_check
     result = await compliance_check(_portfolio([
         _holding("AAPL", 55.0, -20.0),
     ]))
@@ -245,8 +281,7 @@ async def test_compliance_severity_levels():
 @pytest.mark.asyncio
 async def test_compliance_result_schema():
     """Result must contain all required top-level schema keys."""
-    from tools.compliance import compliance_check
-    result = await compliance_check(_portfolio([_holding("AAPL", 18.0, 2.0)] * 5))
+    result = await compliance_check(HEALTHY_5)
     assert result["tool_name"] == "compliance_check"
     assert "tool_result_id" in result
     assert "timestamp" in result
@@ -259,7 +294,6 @@ async def test_compliance_result_schema():
 @pytest.mark.asyncio
 async def test_compliance_null_values_in_holding():
     """None values for allocation_pct and gain_pct do not crash the engine."""
-    from tools.compliance import compliance_check
     holdings = [
         {"symbol": "AAPL", "allocation_pct": None, "gain_pct": None},
         {"symbol": "MSFT", "allocation_pct": None, "gain_pct": None},
@@ -275,42 +309,103 @@ async def test_compliance_null_values_in_holding():
 # Group B — tax_estimate (15 tests)
 # ===========================================================================
 
-@pytest.mark.asyncio
-async def test_tax_short_term_gain():
-    """Sale held < 365 days is taxed at the short-term rate (22%)."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY",  "AAPL", 10, 100.0, "2024-01-01"),
-        _activity("SELL", "AAPL", 10, 200.0, "2024-06-01"),  # ~5 months
-    ]
+@pytest_asyncio.fixture(scope="session")
+async def empty_tax_result():
+    """tax_estimate on no activity, computed once for the read-only schema checks."""
+    return await tax_estimate(NO_ACTIVITIES)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("activities,expected", [
+    # Sale held < 365 days is taxed at the short-term rate (22%).
+    pytest.param(
+        [
+            _activity("BUY",  "AAPL", 10, 100.0, "2024-01-01"),
+            _activity("SELL", "AAPL", 10, 200.0, "2024-06-01"),  # ~5 months
+        ],
+        {"short_term_gains": 1000.0, "long_term_gains": 0.0,
+         "short_term_tax_estimated": 220.0},
+        id="short_term_gain",
+    ),
+    # Sale held >= 365 days is taxed at the long-term rate (15%).
+    pytest.param(
+        [
+            _activity("BUY",  "MSFT", 10, 100.0, "2022-01-01"),
+            _activity("SELL", "MSFT", 10, 300.0, "2023-02-01"),  # > 365 days
+        ],
+        {"long_term_gains": 2000.0, "short_term_gains": 0.0,
+         "long_term_tax_estimated": 300.0},
+        id="long_term_gain",
+    ),
+    # Empty activity list returns zero gains and zero tax.
+    pytest.param(
+        NO_ACTIVITIES,
+        {"short_term_gains": 0.0, "long_term_gains": 0.0,
+         "total_estimated_tax": 0.0, "sell_transactions_analyzed": 0},
+        id="empty_activities",
+    ),
+    # Activities with only buys returns zero gains.
+    pytest.param(
+        BUY_AND_HOLD,
+        {"sell_transactions_analyzed": 0, "total_estimated_tax": 0.0},
+        id="no_sells",
+    ),
+    # Sale at same price as buy results in zero gain and zero tax.
+    pytest.param(
+        [
+            _activity("BUY",  "AAPL", 10, 150.0, "2024-01-01"),
+            _activity("SELL", "AAPL", 10, 150.0, "2024-06-01"),
+        ],
+        {"short_term_gains": 0.0, "total_estimated_tax": 0.0},
+        id="zero_gain_sale",
+    ),
+    # Short-term tax is exactly 22% of positive short-term gains.
+    pytest.param(
+        [
+            _activity("BUY",  "AAPL", 10, 100.0, "2024-01-01"),
+            _activity("SELL", "AAPL", 10, 200.0, "2024-04-01"),  # $1000 gain, short-term
+        ],
+        {"short_term_gains": 1000.0, "short_term_tax_estimated": 1000.0 * 0.22},
+        id="short_term_rate_22pct",
+    ),
+    # Long-term tax is exactly 15% of positive long-term gains.
+    pytest.param(
+        [
+            _activity("BUY",  "AAPL", 10, 100.0, "2020-01-01"),
+            _activity("SELL", "AAPL", 10, 200.0, "2022-01-01"),  # $1000 gain, long-term
+        ],
+        {"long_term_gains": 1000.0, "long_term_tax_estimated": 1000.0 * 0.15},
+        id="long_term_rate_15pct",
+    ),
+    # When no matching buy exists, cost basis defaults to sell price (zero gain).
+    pytest.param(
+        [_activity("SELL", "TSLA", 5, 200.0, "2024-06-01")],
+        {"short_term_gains": 0.0},
+        id="sell_with_no_matching_buy",
+    ),
+    # Negative gains (losses) do not add to estimated tax.
+    pytest.param(
+        [
+            _activity("BUY",  "AAPL", 10, 200.0, "2024-01-01"),
+            _activity("SELL", "AAPL", 10, 100.0, "2024-04-01"),  # $1000 loss
+        ],
+        {"short_term_gains": -1000.0, "short_term_tax_estimated": 0.0,
+         "total_estimated_tax": 0.0},
+        id="negative_gain_not_taxed",
+    ),
+])
+async def test_tax_estimate_totals(activities, expected):
+    """Gains, per-term tax and totals for a single tax_estimate call."""
     result = await tax_estimate(activities)
     assert result["success"] is True
     res = result["result"]
-    assert res["short_term_gains"] == pytest.approx(1000.0)
-    assert res["long_term_gains"] == pytest.approx(0.0)
-    assert res["short_term_tax_estimated"] == pytest.approx(220.0)
-
-
-@pytest.mark.asyncio
-async def test_tax_long_term_gain():
-    """Sale held >= 365 days is taxed at the long-term rate (15%)."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY",  "MSFT", 10, 100.0, "2022-01-01"),
-        _activity("SELL", "MSFT", 10, 300.0, "2023-02-01"),  # > 365 days
-    ]
-    result = await tax_estimate(activities)
-    assert result["success"] is True
-    res = result["result"]
-    assert res["long_term_gains"] == pytest.approx(2000.0)
-    assert res["short_term_gains"] == pytest.approx(0.0)
-    assert res["long_term_tax_estimated"] == pytest.approx(300.0)
+    for key, value in expected.items():
+        assert res[key] == pytest.approx(value), key
 
 
 @pytest.mark.asyncio
 async def test_tax_mixed_gains():
     """Mix of short-term and long-term gains are calculated separately."""
-    from tools.tax_estimate import tax_estimate
     activities = [
         _activity("BUY",  "AAPL", 5, 100.0, "2024-01-01"),
         _activity("SELL", "AAPL", 5, 200.0, "2024-06-01"),  # short-term: +$500
@@ -330,7 +425,6 @@ async def test_tax_mixed_gains():
 @pytest.mark.asyncio
 async def test_tax_wash_sale_detection():
     """Buy within 30 days of a loss sale triggers wash sale warning."""
-    from tools.tax_estimate import tax_estimate
     activities = [
         _activity("BUY",  "NVDA", 10, 200.0, "2024-01-01"),
         _activity("SELL", "NVDA", 10, 150.0, "2024-06-01"),  # loss sale
@@ -342,51 +436,9 @@ async def test_tax_wash_sale_detection():
     assert result["result"]["wash_sale_warnings"][0]["symbol"] == "NVDA"
 
 
-@pytest.mark.asyncio
-async def test_tax_empty_activities():
-    """Empty activity list returns zero gains and zero tax."""
-    from tools.tax_estimate import tax_estimate
-    result = await tax_estimate([])
-    assert result["success"] is True
-    res = result["result"]
-    assert res["short_term_gains"] == 0.0
-    assert res["long_term_gains"] == 0.0
-    assert res["total_estimated_tax"] == 0.0
-    assert res["sell_transactions_analyzed"] == 0
-
-
-@pytest.mark.asyncio
-async def test_tax_no_sells():
-    """Activities with only buys returns zero gains."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY", "AAPL", 10, 150.0, "2024-01-01"),
-        _activity("BUY", "MSFT", 5, 300.0, "2024-02-01"),
-    ]
-    result = await tax_estimate(activities)
-    assert result["success"] is True
-    assert result["result"]["sell_transactions_analyzed"] == 0
-    assert result["result"]["total_estimated_tax"] == 0.0
-
-
-@pytest.mark.asyncio
-async def test_tax_zero_gain_sale():
-    """Sale at same price as buy results in zero gain and zero tax."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY",  "AAPL", 10, 150.0, "2024-01-01"),
-        _activity("SELL", "AAPL", 10, 150.0, "2024-06-01"),
-    ]
-    result = await tax_estimate(activities)
-    assert result["success"] is True
-    assert result["result"]["short_term_gains"] == pytest.approx(0.0)
-    assert result["result"]["total_estimated_tax"] == pytest.approx(0.0)
-
-
 @pytest.mark.asyncio
 async def test_tax_multiple_symbols():
     """Multiple symbols are processed independently."""
-    from tools.tax_estimate import tax_estimate
     activities = [
         _activity("BUY",  "AAPL", 5, 100.0, "2024-01-01"),
         _activity("SELL", "AAPL", 5, 200.0, "2024-04-01"),
@@ -399,75 +451,16 @@ async def test_tax_multiple_symbols():
     assert len(result["result"]["breakdown"]) == 2
 
 
-@pytest.mark.asyncio
-async def test_tax_disclaimer_always_present():
+def test_tax_disclaimer_always_present(empty_tax_result):
     """Disclaimer key is always present in the result, even for zero-gain scenarios."""
-    from tools.tax_estimate import tax_estimate
-    result = await tax_estimate([])
+    result = empty_tax_result
     assert "disclaimer" in result["result"]
     assert "ESTIMATE ONLY" in result["result"]["disclaimer"]
 
 
-@pytest.mark.asyncio
-async def test_tax_short_term_rate_22pct():
-    """Short-term tax is exactly 22% of positive short-term gains."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY",  "AAPL", 10, 100.0, "2024-01-01"),
-        _activity("SELL", "AAPL", 10, 200.0, "2024-04-01"),  # $1000 gain, short-term
-    ]
-    result = await tax_estimate(activities)
-    res = result["result"]
-    assert res["short_term_gains"] == pytest.approx(1000.0)
-    assert res["short_term_tax_estimated"] == pytest.approx(1000.0 * 0.22)
-
-
-@pytest.mark.asyncio
-async def test_tax_long_term_rate_15pct():
-    """Long-term tax is exactly 15% of positive long-term gains."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY",  "AAPL", 10, 100.0, "2020-01-01"),
-        _activity("SELL", "AAPL", 10, 200.0, "2022-01-01"),  # $1000 gain, long-term
-    ]
-    result = await tax_estimate(activities)
-    res = result["result"]
-    assert res["long_term_gains"] == pytest.approx(1000.0)
-    assert res["long_term_tax_estimated"] == pytest.approx(1000.0 * 0.15)
-
-
-@pytest.mark.asyncio
-async def test_tax_sell_with_no_matching_buy():
-    """When no matching buy exists, cost basis defaults to sell price (zero gain)."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("SELL", "TSLA", 5, 200.0, "2024-06-01"),
-    ]
-    result = await tax_estimate(activities)
-    assert result["success"] is True
-    # cost_basis = sell_price → gain = 0
-    assert result["result"]["short_term_gains"] == pytest.approx(0.0)
-
-
-@pytest.mark.asyncio
-async def test_tax_negative_gain_not_taxed():
-    """Negative gains (losses) do not add to estimated tax."""
-    from tools.tax_estimate import tax_estimate
-    activities = [
-        _activity("BUY",  "AAPL", 10, 200.0, "2024-01-01"),
-        _activity("SELL", "AAPL", 10, 100.0, "2024-04-01"),  # $1000 loss
-    ]
-    result = await tax_estimate(activities)
-    assert result["success"] is True
-    assert result["result"]["short_term_gains"] == pytest.approx(-1000.0)
-    assert result["result"]["short_term_tax_estimated"] == pytest.approx(0.0)
-    assert result["result"]["total_estimated_tax"] == pytest.approx(0.0)
-
-
 @pytest.mark.asyncio
 async def test_tax_breakdown_structure():
     """Each breakdown entry has required keys: symbol, gain_loss, holding_days, term."""
-    from tools.tax_estimate import tax_estimate
     activities = [
         _activity("BUY",  "AAPL", 10, 100.0, "2024-01-01"),
         _activity("SELL", "AAPL", 10, 150.0, "2024-06-01"),
@@ -481,11 +474,9 @@ async def test_tax_breakdown_structure():
     assert entry["term"] in ("short-term", "long-term")
 
 
-@pytest.mark.asyncio
-async def test_tax_result_schema():
+def test_tax_result_schema(empty_tax_result):
     """Result must contain all required schema keys."""
-    from tools.tax_estimate import tax_estimate
-    result = await tax_estimate([])
+    result = empty_tax_result
     assert result["tool_name"] == "tax_estimate"
     assert "tool_result_id" in result
     res = result["result"]
@@ -502,7 +493,6 @@ async def test_tax_result_schema():
 @pytest.mark.asyncio
 async def test_categorize_basic_buy():
     """Single buy activity is counted correctly."""
-    from tools.categorize import transaction_categorize
     result = await transaction_categorize([
         _activity("BUY", "AAPL", 10, 150.0, "2024-01-01")
     ])
@@ -516,13 +506,7 @@ async def test_categorize_basic_buy():
 @pytest.mark.asyncio
 async def test_categorize_buy_sell_dividend():
     """All three activity types are categorized independently."""
-    from tools.categorize import transaction_categorize
-    activities = [
-        _activity("BUY",      "AAPL", 10, 150.0, "2024-01-01"),
-        _activity("SELL",     "AAPL",  5, 200.0, "2024-06-01"),
-        _activity("DIVIDEND", "AAPL",  1,   3.5, "2024-08-01"),
-    ]
-    result = await transaction_categorize(activities)
+    result = await transaction_categorize(AAPL_BUY_SELL_DIVIDEND)
     assert result["success"] is True
     summary = result["result"]["summary"]
     assert summary["buy_count"] == 1
@@ -534,8 +518,7 @@ async def test_categorize_buy_sell_dividend():
 @pytest.mark.asyncio
 async def test_categorize_empty_activities():
     """Empty input returns zero counts without crashing."""
-    from tools.categorize import transaction_categorize
-    result = await transaction_categorize([])
+    result = await transaction_categorize(NO_ACTIVITIES)
     assert result["success"] is True
     summary = result["result"]["summary"]
     assert summary["total_transactions"] == 0
@@ -545,12 +528,7 @@ async def test_categorize_empty_activities():
 @pytest.mark.asyncio
 async def test_categorize_per_symbol_breakdown():
     """by_symbol contains an entry for each distinct symbol."""
-    from tools.categorize import transaction_categorize
-    activities = [
-        _activity("BUY", "AAPL", 5, 150.0, "2024-01-01"),
-        _activity("BUY", "MSFT", 3, 300.0, "2024-02-01"),
-    ]
-    result = await transaction_categorize(activities)
+    result = await transaction_categorize(BUY_AND_HOLD)
     by_symbol = result["result"]["by_symbol"]
     assert "AAPL" in by_symbol
     assert "MSFT" in by_symbol
@@ -561,31 +539,20 @@ async def test_categorize_per_symbol_breakdown():
 @pytest.mark.asyncio
 async def test_categorize_buy_and_hold_detection():
     """Portfolio with no sells is flagged as buy-and-hold."""
-    from tools.categorize import transaction_categorize
-    activities = [
-        _activity("BUY", "AAPL", 10, 150.0, "2024-01-01"),
-        _activity("BUY", "MSFT",  5, 300.0, "2024-02-01"),
-    ]
-    result = await transaction_categorize(activities)
+    result = await transaction_categorize(BUY_AND_HOLD)
     assert result["result"]["patterns"]["is_buy_and_hold"] is True
 
 
 @pytest.mark.asyncio
 async def test_categorize_has_dividends_flag():
     """Portfolio with any dividend sets has_dividends=True."""
-    from tools.categorize import transaction_categorize
-    activities = [
-        _activity("BUY",      "AAPL", 10, 150.0, "2024-01-01"),
-        _activity("DIVIDEND", "AAPL",  1,   3.5, "2024-08-01"),
-    ]
-    result = await transaction_categorize(activities)
+    result = await transaction_categorize(AAPL_BUY_SELL_DIVIDEND)
     assert result["result"]["patterns"]["has_dividends"] is True
 
 
 @pytest.mark.asyncio
 async def test_categorize_high_fee_ratio():
     """Fees > 1% of total invested sets high_fee_ratio=True."""
-    from tools.categorize import transaction_categorize
     activities = [
         _activity("BUY", "AAPL", 1, 100.0, "2024-01-01", fee=5.0),  # 5% fee ratio
     ]
@@ -596,7 +563,6 @@ async def test_categorize_high_fee_ratio():
 @pytest.mark.asyncio
 async def test_categorize_total_invested_calculation():
     """Total invested is the sum of quantity × unit_price for all BUY activities."""
-    from tools.categorize import transaction_categorize
     activities = [
         _activity("BUY", "AAPL", 10, 150.0, "2024-01-01"),  # $1500
         _activity("BUY", "MSFT",  5, 200.0, "2024-02-01"),  # $1000
@@ -608,7 +574,6 @@ async def test_categorize_total_invested_calculation():
 @pytest.mark.asyncio
 async def test_categorize_most_traded_top5():
     """most_traded list contains at most 5 symbols."""
-    from tools.categorize import transaction_categorize
     activities = [
         _activity("BUY", sym, 1, 100.0, "2024-01-01")
         for sym in ["AAPL", "MSFT", "NVDA", "GOOGL", "AMZN", "TSLA", "META"]
@@ -620,8 +585,7 @@ async def test_categorize_most_traded_top5():
 @pytest.mark.asyncio
 async def test_categorize_result_schema():
     """Result contains all required top-level schema keys."""
-    from tools.categorize import transaction_categorize
-    result = await transaction_categorize([])
+    result = await transaction_categorize(NO_ACTIVITIES)
     assert result["tool_name"] == "transaction_categorize"
     assert "tool_result_id" in result
     assert "result" in result
@@ -642,14 +606,9 @@ _FAKE_UUID2 = "00fda606-1234-5678-abcd-000000000002"
 
 def test_consolidate_normal_holdings():
     """Normal (non-UUID) holdings pass through without modification."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "AAPL", "name": "Apple", "quantity": 10, "investment": 1500,
-         "valueInBaseCurrency": 1800, "grossPerformance": 300,
-         "allocationInPercentage": 50, "averagePrice": 150},
-        {"symbol": "MSFT", "name": "Microsoft", "quantity": 5, "investment": 1000,
-         "valueInBaseCurrency": 1200, "grossPerformance": 200,
-         "allocationInPercentage": 50, "averagePrice": 200},
+        _position("AAPL", "Apple", 10, 1500, 1800, 300, 50, 150),
+        _position("MSFT", "Microsoft", 5, 1000, 1200, 200, 50, 200),
     ]
     result = consolidate_holdings(holdings)
     symbols = [h["symbol"] for h in result]
@@ -659,14 +618,9 @@ def test_consolidate_normal_holdings():
 
 def test_consolidate_uuid_matched_by_name():
     """UUID-symbol holding matched by name is merged into the real ticker entry."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "AAPL", "name": "AAPL", "quantity": 10, "investment": 1500,
-         "valueInBaseCurrency": 1800, "grossPerformance": 300,
-         "allocationInPercentage": 50, "averagePrice": 150},
-        {"symbol": _FAKE_UUID, "name": "AAPL", "quantity": 5, "investment": 750,
-         "valueInBaseCurrency": 900, "grossPerformance": 150,
-         "allocationInPercentage": 25, "averagePrice": 150},
+        _position("AAPL", "AAPL", 10, 1500, 1800, 300, 50, 150),
+        _position(_FAKE_UUID, "AAPL", 5, 750, 900, 150, 25, 150),
     ]
     result = consolidate_holdings(holdings)
     # Should merge into single AAPL entry
@@ -677,11 +631,8 @@ def test_consolidate_uuid_matched_by_name():
 
 def test_consolidate_uuid_no_match_promoted():
     """UUID-symbol holding with no name match is promoted using its name as symbol."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": _FAKE_UUID, "name": "TSLA", "quantity": 3, "investment": 600,
-         "valueInBaseCurrency": 750, "grossPerformance": 150,
-         "allocationInPercentage": 100, "averagePrice": 200},
+        _position(_FAKE_UUID, "TSLA", 3, 600, 750, 150, 100, 200),
     ]
     result = consolidate_holdings(holdings)
     assert len(result) == 1
@@ -690,14 +641,9 @@ def test_consolidate_uuid_no_match_promoted():
 
 def test_consolidate_duplicate_real_tickers():
     """Two entries with the same real ticker symbol are merged."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "AAPL", "name": "Apple", "quantity": 5, "investment": 750,
-         "valueInBaseCurrency": 900, "grossPerformance": 150,
-         "allocationInPercentage": 50, "averagePrice": 150},
-        {"symbol": "AAPL", "name": "Apple", "quantity": 5, "investment": 750,
-         "valueInBaseCurrency": 900, "grossPerformance": 150,
-         "allocationInPercentage": 50, "averagePrice": 150},
+        _position("AAPL", "Apple", 5, 750, 900, 150, 50, 150),
+        _position("AAPL", "Apple", 5, 750, 900, 150, 50, 150),
     ]
     result = consolidate_holdings(holdings)
     aapl_entries = [h for h in result if h["symbol"] == "AAPL"]
@@ -707,17 +653,13 @@ def test_consolidate_duplicate_real_tickers():
 
 def test_consolidate_empty_list():
     """Empty input returns an empty list."""
-    from tools.portfolio import consolidate_holdings
     assert consolidate_holdings([]) == []
 
 
 def test_consolidate_single_holding():
     """Single holding passes through as a list with one item."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "NVDA", "name": "NVIDIA", "quantity": 8, "investment": 1200,
-         "valueInBaseCurrency": 2400, "grossPerformance": 1200,
-         "allocationInPercentage": 100, "averagePrice": 150},
+        _position("NVDA", "NVIDIA", 8, 1200, 2400, 1200, 100, 150),
     ]
     result = consolidate_holdings(holdings)
     assert len(result) == 1
@@ -726,14 +668,9 @@ def test_consolidate_single_holding():
 
 def test_consolidate_quantities_summed():
     """Merged holding quantities are summed correctly."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "AAPL", "name": "Apple", "quantity": 10, "investment": 1500,
-         "valueInBaseCurrency": 1800, "grossPerformance": 300,
-         "allocationInPercentage": 50, "averagePrice": 150},
-        {"symbol": _FAKE_UUID, "name": "AAPL", "quantity": 7, "investment": 1050,
-         "valueInBaseCurrency": 1260, "grossPerformance": 210,
-         "allocationInPercentage": 35, "averagePrice": 150},
+        _position("AAPL", "Apple", 10, 1500, 1800, 300, 50, 150),
+        _position(_FAKE_UUID, "AAPL", 7, 1050, 1260, 210, 35, 150),
     ]
     result = consolidate_holdings(holdings)
     aapl = next(h for h in result if h["symbol"] == "AAPL")
@@ -742,14 +679,9 @@ def test_consolidate_quantities_summed():
 
 def test_consolidate_investment_summed():
     """Merged holding investment values are summed correctly."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "MSFT", "name": "Microsoft", "quantity": 5, "investment": 1000,
-         "valueInBaseCurrency": 1200, "grossPerformance": 200,
-         "allocationInPercentage": 50, "averagePrice": 200},
-        {"symbol": "MSFT", "name": "Microsoft", "quantity": 5, "investment": 1000,
-         "valueInBaseCurrency": 1200, "grossPerformance": 200,
-         "allocationInPercentage": 50, "averagePrice": 200},
+        _position("MSFT", "Microsoft", 5, 1000, 1200, 200, 50, 200),
+        _position("MSFT", "Microsoft", 5, 1000, 1200, 200, 50, 200),
     ]
     result = consolidate_holdings(holdings)
     msft = next(h for h in result if h["symbol"] == "MSFT")
@@ -758,17 +690,10 @@ def test_consolidate_investment_summed():
 
 def test_consolidate_mixed_uuid_and_real():
     """Mix of UUID and real-ticker holdings resolves to correct symbol count."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "AAPL", "name": "Apple", "quantity": 10, "investment": 1500,
-         "valueInBaseCurrency": 1800, "grossPerformance": 300,
-         "allocationInPercentage": 40, "averagePrice": 150},
-        {"symbol": _FAKE_UUID,  "name": "AAPL", "quantity": 5, "investment": 750,
-         "valueInBaseCurrency": 900, "grossPerformance": 150,
-         "allocationInPercentage": 20, "averagePrice": 150},
-        {"symbol": "MSFT", "name": "Microsoft", "quantity": 8, "investment": 2400,
-         "valueInBaseCurrency": 2800, "grossPerformance": 400,
-         "allocationInPercentage": 40, "averagePrice": 300},
+        _position("AAPL", "Apple", 10, 1500, 1800, 300, 40, 150),
+        _position(_FAKE_UUID, "AAPL", 5, 750, 900, 150, 20, 150),
+        _position("MSFT", "Microsoft", 8, 2400, 2800, 400, 40, 300),
     ]
     result = consolidate_holdings(holdings)
     symbols = {h["symbol"] for h in result}
@@ -777,14 +702,9 @@ def test_consolidate_mixed_uuid_and_real():
 
 def test_consolidate_case_insensitive_name_match():
     """Name matching between UUID entries and real tickers is case-insensitive."""
-    from tools.portfolio import consolidate_holdings
     holdings = [
-        {"symbol": "aapl", "name": "apple inc", "quantity": 10, "investment": 1500,
-         "valueInBaseCurrency": 1800, "grossPerformance": 300,
-         "allocationInPercentage": 50, "averagePrice": 150},
-        {"symbol": _FAKE_UUID2, "name": "APPLE INC", "quantity": 5, "investment": 750,
-         "valueInBaseCurrency": 900, "grossPerformance": 150,
-         "allocationInPercentage": 25, "averagePrice": 150},
+        _position("aapl", "apple inc", 10, 1500, 1800, 300, 50, 150),
+        _position(_FAKE_UUID2, "APPLE INC", 5, 750, 900, 150, 25, 150),
     ]
     result = consolidate_holdings(holdings)
     # Should not crash; UUID entry should be handled (promoted or merged)
@@ -797,20 +717,17 @@ def test_consolidate_case_insensitive_name_match():
 
 def test_extract_ticker_known_symbol():
     """Known tickers are extracted correctly from a natural language query."""
-    from graph import _extract_ticker
     assert _extract_ticker("What is AAPL doing today?") == "AAPL"
 
 
 def test_extract_ticker_msft_in_buy_query():
     """Ticker is extracted from a buy instruction."""
-    from graph import _extract_ticker
     result = _extract_ticker("buy 10 shares of MSFT at $350")
     assert result == "MSFT"
 
 
 def test_extract_ticker_not_found():
     """Returns None when query has no 1-5 letter ticker candidate (all words long or excluded)."""
-    from graph import _extract_ticker
     # All words are either in exclusion list or > 5 chars — no ticker candidate
     result = _extract_ticker("What percentage allocation is my portfolio tracking?")
     assert result is None
@@ -818,41 +735,34 @@ def test_extract_ticker_not_found():
 
 def test_extract_quantity_shares():
     """Extracts integer share count."""
-    from graph import _extract_quantity
     assert _extract_quantity("buy 5 shares of AAPL") == pytest.approx(5.0)
 
 
 def test_extract_quantity_decimal():
     """Extracts decimal quantity."""
-    from graph import _extract_quantity
     assert _extract_quantity("sell 10.5 units") == pytest.approx(10.5)
 
 
 def test_extract_price_dollar_sign():
     """Extracts price preceded by dollar sign."""
-    from graph import _extract_price
     assert _extract_price("buy AAPL at $185.50") == pytest.approx(185.50)
 
 
 def test_extract_price_per_share():
     """Extracts price with 'per share' suffix."""
-    from graph import _extract_price
     assert _extract_price("250 per share") == pytest.approx(250.0)
 
 
 def test_extract_date_iso_format():
     """Extracts ISO date string unchanged."""
-    from graph import _extract_date
     assert _extract_date("transaction on 2024-01-15") == "2024-01-15"
 
 
 def test_extract_date_slash_format():
     """Converts MM/DD/YYYY to YYYY-MM-DD."""
-    from graph import _extract_date
     assert _extract_date("on 1/15/2024") == "2024-01-15"
 
 
 def test_extract_fee_explicit():
     """Extracts fee amount from natural language."""
-    from graph import _extract_fee
     assert _extract_fee("buy 10 shares with fee of $7.50") == pytest.approx(7.50)
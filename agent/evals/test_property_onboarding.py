@@ -8,12 +8,7 @@ Tests:
   4. test_no_properties_returns_graceful_response
 """
 
-import asyncio
 import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
 
 # Use an in-memory SQLite to avoid polluting any real DB
 os.environ["PROPERTIES_DB_PATH"] = ":memory:"
@@ -29,23 +24,16 @@ from property_tracker import (
 )
 
 
-def _run(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
 # ---------------------------------------------------------------------------
-# Clear the in-memory store between tests via autouse fixture
+# Start from an empty in-memory store — requested by each test that reads it
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(autouse=True)
-def clear_store():
-    """Reset in-memory DB before each test."""
-    property_store_clear()
-    yield
+@pytest.fixture
+def clean_store():
+    """
+    Reset in-memory DB before the test. No teardown clear: every test that
+    depends on the store's contents clears it on the way in.
+    """
     property_store_clear()
 
 
@@ -53,13 +41,14 @@ def clear_store():
 # Test 1 — add_property returns equity in the result
 # ---------------------------------------------------------------------------
 
-def test_add_property_returns_equity():
-    result = _run(add_property(
+@pytest.mark.asyncio
+async def test_add_property_returns_equity():
+    result = await add_property(
         address="My Primary Home",
         purchase_price=400000,
         current_value=480000,
         mortgage_balance=310000,
-    ))
+    )
     assert result is not None
     assert result.get("success") is True, f"Expected success, got: {result}"
 
@@ -74,9 +63,10 @@ def test_add_property_returns_equity():
 # Test 2 — get_properties returns properties with equity
 # ---------------------------------------------------------------------------
 
-def test_get_properties_shows_equity():
-    _run(add_property("Test Home", 300000, 380000, 250000))
-    result = _run(get_properties())
+@pytest.mark.asyncio
+async def test_get_properties_shows_equity(clean_store):
+    await add_property("Test Home", 300000, 380000, 250000)
+    result = await get_properties()
     assert result is not None
     assert result.get("success") is True
 
@@ -92,10 +82,11 @@ def test_get_properties_shows_equity():
 # Test 3 — total net worth combines portfolio + real estate equity
 # ---------------------------------------------------------------------------
 
-def test_total_net_worth_combines_both():
-    _run(add_property("Net Worth Test Home", 350000, 420000, 280000))
+@pytest.mark.asyncio
+async def test_total_net_worth_combines_both(clean_store):
+    await add_property("Net Worth Test Home", 350000, 420000, 280000)
     # equity = 420000 - 280000 = 140000
-    result = _run(get_total_net_worth(portfolio_value=94000))
+    result = await get_total_net_worth(portfolio_value=94000)
     assert result.get("success") is True
 
     data = result.get("result", {})
@@ -111,8 +102,9 @@ def test_total_net_worth_combines_both():
 # Test 4 — no properties returns graceful response (not a crash)
 # ---------------------------------------------------------------------------
 
-def test_no_properties_returns_graceful_response():
-    result = _run(get_properties())
+@pytest.mark.asyncio
+async def test_no_properties_returns_graceful_response(clean_store):
+    result = await get_properties()
     assert result is not None
     assert isinstance(result, dict)
     # Should not crash — may return success with empty list or a helpful message
@@ -10,26 +10,11 @@ Tests cover:
 """
 
 import asyncio
-import os
-import sys
-
-# Add agent root to path so imports work when running from any directory
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
 
 import pytest
 
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _set_flag(value: str):
-    os.environ["ENABLE_REAL_ESTATE"] = value
-
-
-def _clear_flag():
-    os.environ.pop("ENABLE_REAL_ESTATE", None)
+# Every test runs with the feature on (fixture in conftest.py).
+pytestmark = pytest.mark.usefixtures("real_estate_enabled")
 
 
 # ---------------------------------------------------------------------------
@@ -45,7 +30,6 @@ async def test_search_listings_schema():
            each listing must have id, address, price, bedrooms, sqft,
            days_on_market, cap_rate_estimate.
     """
-    _set_flag("true")
     # Import inside test so the env var is already set
     from tools.real_estate import search_listings, cache_clear
     cache_clear()
@@ -83,7 +67,6 @@ async def test_neighborhood_snapshot_caching():
     THEN   the second call returns the same tool_result_id (from cache)
            and does not mutate data.
     """
-    _set_flag("true")
     from tools.real_estate import get_neighborhood_snapshot, cache_clear
     cache_clear()
 
@@ -113,7 +96,6 @@ async def test_compare_neighborhoods_schema():
     WHEN   compare_neighborhoods('Austin', 'Denver') is called
     THEN   the result contains both locations, all metric keys, and summaries.
     """
-    _set_flag("true")
     from tools.real_estate import compare_neighborhoods, cache_clear
     cache_clear()
 
@@ -148,13 +130,12 @@ async def test_compare_neighborhoods_schema():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_feature_flag_disabled():
+async def test_feature_flag_disabled(real_estate_disabled):
     """
     GIVEN  ENABLE_REAL_ESTATE is not set (or set to false)
     WHEN   any real estate tool is called
     THEN   it returns success=False with error=FEATURE_DISABLED (no crash).
     """
-    _set_flag("false")
     from tools.real_estate import (
         search_listings,
         get_neighborhood_snapshot,
@@ -179,9 +160,6 @@ async def test_feature_flag_disabled():
             f"Expected REAL_ESTATE_FEATURE_DISABLED, got: {result}"
         )
 
-    # Restore for other tests
-    _set_flag("true")
-
 
 # ---------------------------------------------------------------------------
 # Test 5 — graceful fallback: unknown location returns helpful error, no crash
@@ -195,7 +173,6 @@ async def test_unknown_location_graceful_error():
     THEN   it returns success=False with error=NO_LISTINGS_FOUND and a helpful
            message listing supported cities (no exception raised).
     """
-    _set_flag("true")
     from tools.real_estate import search_listings, cache_clear
     cache_clear()
 
@@ -221,7 +198,6 @@ async def test_search_listings_bedroom_filter():
     WHEN   search_listings('Austin', min_beds=3) is called
     THEN   every returned listing has bedrooms >= 3.
     """
-    _set_flag("true")
     from tools.real_estate import search_listings, cache_clear
     cache_clear()
 
@@ -251,7 +227,6 @@ async def test_search_listings_price_filter():
     WHEN   search_listings('Austin', max_price=400000) is called
     THEN   every returned listing has price <= 400000.
     """
-    _set_flag("true")
     from tools.real_estate import search_listings, cache_clear
     cache_clear()
 
@@ -282,7 +257,6 @@ async def test_structured_error_code():
     THEN   the error field is a dict with 'code' and 'message' keys
            and the code is one of the expected REAL_ESTATE_* values.
     """
-    _set_flag("true")
     from tools.real_estate import (
         get_neighborhood_snapshot,
         search_listings,
@@ -11,27 +11,29 @@ Tests:
   7. test_net_worth_grows_over_time
 """
 
-import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
-
 import pytest
 from realestate_strategy import simulate_real_estate_strategy
 
 
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def default_strategy(strategy_cache):
+    """
+    The baseline 10-year run shared by the tests that only read its output.
+    strategy_cache (conftest.py) memoizes runs for the whole session.
+    """
+    return strategy_cache(94000, 120000, 400000, total_years=10)
+
+
 # ---------------------------------------------------------------------------
 # Test 1 — basic shape
 # ---------------------------------------------------------------------------
 
-def test_basic_strategy_returns_expected_shape():
-    result = simulate_real_estate_strategy(
-        initial_portfolio_value=94000,
-        annual_income=120000,
-        first_home_price=400000,
-        total_years=10,
-    )
+def test_basic_strategy_returns_expected_shape(default_strategy):
+    result = default_strategy
     assert "strategy" in result
     assert "timeline" in result
     assert "final_picture" in result
@@ -49,13 +51,11 @@ def test_basic_strategy_returns_expected_shape():
 # Test 2 — user-provided appreciation overrides default
 # ---------------------------------------------------------------------------
 
-def test_user_provided_appreciation_overrides_default():
-    result_default = simulate_real_estate_strategy(
-        94000, 120000, 400000, total_years=10
-    )
-    result_custom = simulate_real_estate_strategy(
+def test_user_provided_appreciation_overrides_default(strategy_cache):
+    result_default = strategy_cache(94000, 120000, 400000, total_years=10)
+    result_custom = strategy_cache(
         94000, 120000, 400000, total_years=10,
-        annual_appreciation=0.02  # conservative
+        annual_appreciation=0.02,  # conservative
     )
     default_equity = result_default["final_picture"]["total_real_estate_equity"]
     custom_equity = result_custom["final_picture"]["total_real_estate_equity"]
@@ -67,14 +67,14 @@ def test_user_provided_appreciation_overrides_default():
 # Test 3 — conservative numbers produce lower net worth than optimistic
 # ---------------------------------------------------------------------------
 
-def test_conservative_preset_lower_than_optimistic():
-    result_conservative = simulate_real_estate_strategy(
+def test_conservative_preset_lower_than_optimistic(strategy_cache):
+    result_conservative = strategy_cache(
         94000, 120000, 400000, total_years=10,
         annual_appreciation=0.02,
         annual_rent_yield=0.06,
         annual_market_return=0.05,
     )
-    result_optimistic = simulate_real_estate_strategy(
+    result_optimistic = strategy_cache(
         94000, 120000, 400000, total_years=10,
         annual_appreciation=0.06,
         annual_rent_yield=0.10,
@@ -90,10 +90,8 @@ def test_conservative_preset_lower_than_optimistic():
 # Test 4 — disclaimer and how_to_adjust fields present
 # ---------------------------------------------------------------------------
 
-def test_disclaimer_and_how_to_adjust_present():
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000
-    )
+def test_disclaimer_and_how_to_adjust_present(default_strategy):
+    result = default_strategy
     assert "disclaimer" in result
     assert "how_to_adjust" in result
     assert "assumptions" in result["strategy"]
@@ -110,10 +108,12 @@ def test_timeline_length_matches_total_years():
     result = simulate_real_estate_strategy(
         94000, 120000, 400000, total_years=5
     )
-    # Timeline includes year 0 through year 5 → 6 entries
-    assert len(result["timeline"]) == 6
-    assert result["timeline"][0]["year"] == 0
-    assert result["timeline"][-1]["year"] == 5
+    # Timeline includes year 0 through year 5 → 6 entries; entry 5 being the
+    # last one pins the length without a separate len() check.
+    tl = result["timeline"]
+    assert tl[0]["year"] == 0
+    assert tl[-1]["year"] == 5
+    assert tl[5] is tl[-1]
 
 
 # ---------------------------------------------------------------------------
@@ -137,10 +137,7 @@ def test_single_property_no_rentals():
 # Test 7 — net worth generally grows over time
 # ---------------------------------------------------------------------------
 
-def test_net_worth_grows_over_time():
-    result = simulate_real_estate_strategy(
-        94000, 120000, 400000, total_years=10
-    )
-    timeline = result["timeline"]
+def test_net_worth_grows_over_time(default_strategy):
+    timeline = default_strategy["timeline"]
     # Net worth at year 10 should be higher than year 0
     assert timeline[-1]["total_net_worth"] > timeline[0]["total_net_worth"]
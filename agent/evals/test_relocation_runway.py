@@ -1,6 +1,3 @@
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
 from relocation_runway import calculate_relocation_runway
 
 
@@ -60,3 +57,19 @@ def test_runway_returns_comparison():
     assert "milestones_if_you_stay" in result
     assert "months_to_down_payment_20pct" in result["milestones_if_you_move"]
     assert "months_to_down_payment_20pct" in result["milestones_if_you_stay"]
+
+
+def test_sync_loop_closed_when_thread_exits():
+    import asyncio
+    import threading
+
+    from relocation_runway import _run_sync
+
+    async def _current_loop():
+        return asyncio.get_running_loop()
+
+    loops = []
+    worker = threading.Thread(target=lambda: loops.append(_run_sync(_current_loop())))
+    worker.start()
+    worker.join()
+    assert loops[0].is_closed()
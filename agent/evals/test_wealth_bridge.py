@@ -18,30 +18,19 @@ Tests:
         equity + portfolio = expected total
   8.  test_teleport_fallback_works_when_api_unavailable
         get_city_housing_data("seattle") returns usable data
+  9.  test_col_lookup_same_city_on_two_loops
+        concurrent same-city lookups on two loops each get their own request
 """
 
 import asyncio
 import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
 
 import pytest
 
-
 # ---------------------------------------------------------------------------
-# Fixtures / helpers
+# Setup
 # ---------------------------------------------------------------------------
 
-def _set_flag(value: str):
-    os.environ["ENABLE_REAL_ESTATE"] = value
-
-
-def _clear_flag():
-    os.environ.pop("ENABLE_REAL_ESTATE", None)
-
-
 # Use an in-memory SQLite for property tracker tests (no file side effects)
 os.environ["PROPERTIES_DB_PATH"] = ":memory:"
 
@@ -221,7 +210,7 @@ async def test_job_offer_global_city_london():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_property_crud_full_cycle():
+async def test_property_crud_full_cycle(real_estate_enabled):
     """
     GIVEN  ENABLE_REAL_ESTATE=true
     WHEN   full CRUD cycle is executed
@@ -231,7 +220,6 @@ async def test_property_crud_full_cycle():
            UPDATE: equity recalculates to $140,000 after value bump
            DELETE: property no longer appears in list
     """
-    _set_flag("true")
     from tools.property_tracker import (
         add_property, get_properties, update_property,
         remove_property, property_store_clear,
@@ -285,7 +273,7 @@ async def test_property_crud_full_cycle():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_net_worth_combines_portfolio_and_property():
+async def test_net_worth_combines_portfolio_and_property(real_estate_enabled):
     """
     GIVEN  one property: current_value=$400k, mortgage=$250k → equity=$150k
     WHEN   get_total_net_worth(portfolio_value=94000) is called
@@ -293,7 +281,6 @@ async def test_net_worth_combines_portfolio_and_property():
            total_net_worth == 244000
            investment_portfolio == 94000
     """
-    _set_flag("true")
     from tools.property_tracker import (
         add_property, get_total_net_worth, property_store_clear,
     )
@@ -343,3 +330,45 @@ async def test_teleport_fallback_works_when_api_unavailable():
     assert has_rent or has_price, (
         f"Result must have MedianRentMonthly or median_price. Got keys: {list(result.keys())}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Test 9 — same-city lookups on two event loops do not share a future
+# ---------------------------------------------------------------------------
+
+def test_col_lookup_same_city_on_two_loops(monkeypatch):
+    """
+    GIVEN  a Teleport lookup for "Tokyo" is still in flight on one thread's loop
+    WHEN   another thread's loop looks up "Tokyo" at the same time
+    THEN   each loop runs its own lookup and both return the city's COL data
+           (a future owned by one loop cannot be awaited from another)
+    """
+    import threading
+
+    from tools import wealth_bridge
+
+    started = threading.Event()
+    calls = []
+
+    async def _slow_city_data(city):
+        calls.append(city)
+        started.set()
+        await asyncio.sleep(0.05)
+        return wealth_bridge.HARDCODED_FALLBACK["tokyo"]
+
+    monkeypatch.setattr(wealth_bridge, "get_city_housing_data", _slow_city_data)
+
+    results = {}
+
+    def _lookup(name):
+        results[name] = asyncio.run(wealth_bridge._get_col_data("Tokyo"))
+
+    worker = threading.Thread(target=_lookup, args=("worker",))
+    worker.start()
+    assert started.wait(timeout=5)
+    _lookup("main")
+    worker.join(timeout=5)
+
+    assert calls == ["Tokyo", "Tokyo"]
+    assert results["worker"] == results["main"]
+    assert results["main"][1]["city"] == "Tokyo, Japan"
@@ -1,7 +1,4 @@
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
-from wealth_visualizer import analyze_wealth_position
+from wealth_visualizer import analyze_wealth_position, rank_wealth_positions
 
 
 def test_wealth_above_median():
@@ -64,3 +61,13 @@ def test_savings_grade_low_vs_high():
     high_grade = result_high["savings_analysis"]["savings_grade"]
     assert low_grade in ["critical", "minimum", "low"]
     assert high_grade in ["excellent", "exceptional"]
+
+
+def test_rank_wealth_positions_matches_scalar():
+    cohort = [(94000, 34), (15000, 45), (234000, 40), (3_500_000, 70), (0, 22)]
+    ranked = rank_wealth_positions(cohort)
+    assert len(ranked) == len(cohort)
+    for (net_worth, age), row in zip(cohort, ranked):
+        single = analyze_wealth_position(net_worth, age, 100000)["current_position"]
+        assert row["median_for_age"] == single["median_for_age"]
+        assert row["percentile_estimate"] == single["percentile_estimate"]
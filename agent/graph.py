@@ -305,6 +305,71 @@ def _get_client() -> anthropic.Anthropic:
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Common misspellings and aliases
+_TICKER_CORRECTIONS = {
+    "APPL": "AAPL",
+    "APPL.": "AAPL",
+    "APPLE": "AAPL",
+    "GOOG": "GOOGL",
+    "GOOGLE": "GOOGL",
+    "ALPHABET": "GOOGL",
+    "AMAZON": "AMZN",
+    "MICROSOFT": "MSFT",
+    "NVIDIA": "NVDA",
+    "TESLA": "TSLA",
+    "META": "META",
+    "FACEBOOK": "META",
+}
+
+_KNOWN_TICKERS = frozenset({
+    "AAPL", "MSFT", "NVDA", "TSLA", "GOOGL", "GOOG", "AMZN",
+    "META", "NFLX", "SPY", "QQQ", "BRK", "BRKB", "VTI",
+})
+
+_NOT_TICKERS = frozenset({
+    # Articles, pronouns, prepositions
+    "I", "A", "MY", "AM", "IS", "IN", "OF", "DO", "THE", "FOR",
+    "AND", "OR", "AT", "IT", "ME", "HOW", "WHAT", "SHOW", "GET",
+    "CAN", "TO", "ON", "BE", "BY", "US", "UP", "AN",
+    # Action words that are not tickers
+    "BUY", "SELL", "ADD", "YES", "NO",
+    # Common English words frequently mistaken for tickers
+    "IF", "THINK", "HALF", "THAT", "ONLY", "WRONG", "JUST",
+    "SOLD", "BOUGHT", "WERE", "WAS", "HAD", "HAS", "NOT",
+    "BUT", "SO", "ALL", "WHEN", "THEN", "EACH", "ANY", "BOTH",
+    "ALSO", "INTO", "OVER", "OUT", "BACK", "EVEN", "SAME",
+    "SUCH", "AFTER", "SAID", "THAN", "THEM", "THEY", "THIS",
+    "WITH", "YOUR", "FROM", "BEEN", "HAVE", "WILL", "ABOUT",
+    "WHICH", "THEIR", "THERE", "WHERE", "THESE", "WOULD",
+    "COULD", "SHOULD", "MIGHT", "SHALL", "ONLY", "ALSO",
+    "SINCE", "WHILE", "STILL", "AGAIN", "THOSE", "OTHER",
+})
+
+# Extraction patterns run on every write-intent query — compiled once here.
+_SHARE_OF_RE = re.compile(r"share[s]?\s+of\s+([A-Z]{1,5})")
+# Strips everything but A-Z while keeping word breaks, so one pass over the
+# query yields the same cleaned words as stripping each split word.
+_NON_TICKER_CHARS_RE = re.compile(r"[^A-Z\s]")
+_QUANTITY_RES = tuple(re.compile(p, re.I) for p in (
+    r"(\d+(?:\.\d+)?)\s+shares?",
+    r"(\d+(?:,\d{3})*(?:\.\d+)?)\s+shares?",
+    r"(?:buy|sell|purchase|record)\s+(\d+(?:,\d{3})*(?:\.\d+)?)",
+    r"(\d+(?:,\d{3})*(?:\.\d+)?)\s+(?:units?|stocks?)",
+))
+_PRICE_RES = tuple(re.compile(p, re.I) for p in (
+    r"\$(\d+(?:,\d{3})*(?:\.\d+)?)",
+    r"(?:at|@|price(?:\s+of)?|for)\s+\$?(\d+(?:,\d{3})*(?:\.\d+)?)",
+    r"(\d+(?:,\d{3})*(?:\.\d+)?)\s+(?:per\s+share|each)",
+))
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_US_DATE_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})")
+_FEE_RE = re.compile(r"fee\s+(?:of\s+)?\$?(\d+(?:\.\d+)?)", re.I)
+_DOLLAR_AMOUNT_RE = re.compile(r"\$(\d+(?:,\d{3})*(?:\.\d+)?)")
+_WORDED_AMOUNT_RE = re.compile(r"(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:dollars?|usd|cash)", re.I)
+_DIVIDEND_OF_RE = re.compile(r"dividend\s+of\s+\$?(\d+(?:\.\d+)?)", re.I)
+_DOLLAR_DIVIDEND_RE = re.compile(r"\$(\d+(?:\.\d+)?)\s+dividend", re.I)
+
+
 def _extract_ticker(query: str, fallback: str = None) -> str | None:
     """
     Extracts the most likely stock ticker from a query string.
@@ -312,76 +377,33 @@ def _extract_ticker(query: str, fallback: str = None) -> str | None:
     Returns fallback (default None) if no ticker found.
     Pass fallback='SPY' for market queries that require a symbol.
     """
-    # Common misspellings and aliases
-    TICKER_CORRECTIONS = {
-        "APPL": "AAPL",
-        "APPL.": "AAPL",
-        "APPLE": "AAPL",
-        "GOOG": "GOOGL",
-        "GOOGLE": "GOOGL",
-        "ALPHABET": "GOOGL",
-        "AMAZON": "AMZN",
-        "MICROSOFT": "MSFT",
-        "NVIDIA": "NVDA",
-        "TESLA": "TSLA",
-        "META": "META",
-        "FACEBOOK": "META",
-    }
-
     message = query.strip()
     msg_upper = message.upper()
 
     # Pattern: "share of TICKER" or "shares of TICKER" — check first
-    share_of_match = re.search(r"share[s]?\s+of\s+([A-Z]{1,5})", msg_upper)
+    share_of_match = _SHARE_OF_RE.search(msg_upper)
     if share_of_match:
         candidate = share_of_match.group(1)
-        return TICKER_CORRECTIONS.get(candidate, candidate)
+        return _TICKER_CORRECTIONS.get(candidate, candidate)
 
-    words = msg_upper.split()
-    known_tickers = {"AAPL", "MSFT", "NVDA", "TSLA", "GOOGL", "GOOG", "AMZN",
-                     "META", "NFLX", "SPY", "QQQ", "BRK", "BRKB", "VTI"}
+    cleaned = _NON_TICKER_CHARS_RE.sub("", msg_upper).split()
 
-    for word in words:
-        clean = re.sub(r"[^A-Z]", "", word)
-        corrected = TICKER_CORRECTIONS.get(clean, clean)
-        if corrected in known_tickers:
+    for clean in cleaned:
+        corrected = _TICKER_CORRECTIONS.get(clean, clean)
+        if corrected in _KNOWN_TICKERS:
             return corrected
 
-    for word in words:
-        clean = re.sub(r"[^A-Z]", "", word)
-        if 1 <= len(clean) <= 5 and clean.isalpha() and clean not in {
-            # Articles, pronouns, prepositions
-            "I", "A", "MY", "AM", "IS", "IN", "OF", "DO", "THE", "FOR",
-            "AND", "OR", "AT", "IT", "ME", "HOW", "WHAT", "SHOW", "GET",
-            "CAN", "TO", "ON", "BE", "BY", "US", "UP", "AN",
-            # Action words that are not tickers
-            "BUY", "SELL", "ADD", "YES", "NO",
-            # Common English words frequently mistaken for tickers
-            "IF", "THINK", "HALF", "THAT", "ONLY", "WRONG", "JUST",
-            "SOLD", "BOUGHT", "WERE", "WAS", "HAD", "HAS", "NOT",
-            "BUT", "SO", "ALL", "WHEN", "THEN", "EACH", "ANY", "BOTH",
-            "ALSO", "INTO", "OVER", "OUT", "BACK", "EVEN", "SAME",
-            "SUCH", "AFTER", "SAID", "THAN", "THEM", "THEY", "THIS",
-            "WITH", "YOUR", "FROM", "BEEN", "HAVE", "WILL", "ABOUT",
-            "WHICH", "THEIR", "THERE", "WHERE", "THESE", "WOULD",
-            "COULD", "SHOULD", "MIGHT", "SHALL", "ONLY", "ALSO",
-            "SINCE", "WHILE", "STILL", "AGAIN", "THOSE", "OTHER",
-        }:
-            return TICKER_CORRECTIONS.get(clean, clean)
+    for clean in cleaned:
+        if 1 <= len(clean) <= 5 and clean.isalpha() and clean not in _NOT_TICKERS:
+            return _TICKER_CORRECTIONS.get(clean, clean)
 
     return fallback
 
 
 def _extract_quantity(query: str) -> float | None:
     """Extract a share/unit quantity from natural language."""
-    patterns = [
-        r"(\d+(?:\.\d+)?)\s+shares?",
-        r"(\d+(?:,\d{3})*(?:\.\d+)?)\s+shares?",
-        r"(?:buy|sell|purchase|record)\s+(\d+(?:,\d{3})*(?:\.\d+)?)",
-        r"(\d+(?:,\d{3})*(?:\.\d+)?)\s+(?:units?|stocks?)",
-    ]
-    for pattern in patterns:
-        m = re.search(pattern, query, re.I)
+    for pattern in _QUANTITY_RES:
+        m = pattern.search(query)
         if m:
             return float(m.group(1).replace(",", ""))
     return None
@@ -389,13 +411,8 @@ def _extract_quantity(query: str) -> float | None:
 
 def _extract_price(query: str) -> float | None:
     """Extract an explicit price from natural language."""
-    patterns = [
-        r"\$(\d+(?:,\d{3})*(?:\.\d+)?)",
-        r"(?:at|@|price(?:\s+of)?|for)\s+\$?(\d+(?:,\d{3})*(?:\.\d+)?)",
-        r"(\d+(?:,\d{3})*(?:\.\d+)?)\s+(?:per\s+share|each)",
-    ]
-    for pattern in patterns:
-        m = re.search(pattern, query, re.I)
+    for pattern in _PRICE_RES:
+        m = pattern.search(query)
         if m:
             return float(m.group(1).replace(",", ""))
     return None
@@ -403,10 +420,10 @@ def _extract_price(query: str) -> float | None:
 
 def _extract_date(query: str) -> str | None:
     """Extract an explicit date (YYYY-MM-DD or MM/DD/YYYY)."""
-    m = re.search(r"(\d{4}-\d{2}-\d{2})", query)
+    m = _ISO_DATE_RE.search(query)
     if m:
         return m.group(1)
-    m = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", query)
+    m = _US_DATE_RE.search(query)
     if m:
         parts = m.group(1).split("/")
         return f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
@@ -415,7 +432,7 @@ def _extract_date(query: str) -> str | None:
 
 def _extract_fee(query: str) -> float:
     """Extract fee from natural language, default 0."""
-    m = re.search(r"fee\s+(?:of\s+)?\$?(\d+(?:\.\d+)?)", query, re.I)
+    m = _FEE_RE.search(query)
     if m:
         return float(m.group(1))
     return 0.0
@@ -423,10 +440,10 @@ def _extract_fee(query: str) -> float:
 
 def _extract_amount(query: str) -> float | None:
     """Extract a cash amount (for add_cash)."""
-    m = re.search(r"\$(\d+(?:,\d{3})*(?:\.\d+)?)", query)
+    m = _DOLLAR_AMOUNT_RE.search(query)
     if m:
         return float(m.group(1).replace(",", ""))
-    m = re.search(r"(\d+(?:,\d{3})*(?:\.\d+)?)\s*(?:dollars?|usd|cash)", query, re.I)
+    m = _WORDED_AMOUNT_RE.search(query)
     if m:
         return float(m.group(1).replace(",", ""))
     return None
@@ -434,10 +451,10 @@ def _extract_amount(query: str) -> float | None:
 
 def _extract_dividend_amount(query: str) -> float | None:
     """Extract a dividend/interest amount from natural language."""
-    m = re.search(r"dividend\s+of\s+\$?(\d+(?:\.\d+)?)", query, re.I)
+    m = _DIVIDEND_OF_RE.search(query)
     if m:
         return float(m.group(1))
-    m = re.search(r"\$(\d+(?:\.\d+)?)\s+dividend", query, re.I)
+    m = _DOLLAR_DIVIDEND_RE.search(query)
     if m:
         return float(m.group(1))
     return None
@@ -18,6 +18,7 @@ async def compliance_check(portfolio_data: dict) -> dict:
     try:
         result = portfolio_data.get("result", {})
         holdings = result.get("holdings", [])
+        holding_count = len(holdings)
 
         warnings = []
 
@@ -52,13 +53,13 @@ async def compliance_check(portfolio_data: dict) -> dict:
                     ),
                 })
 
-        if len(holdings) < 5:
+        if holding_count < 5:
             warnings.append({
                 "type": "LOW_DIVERSIFICATION",
                 "severity": "LOW",
-                "holding_count": len(holdings),
+                "holding_count": holding_count,
                 "message": (
-                    f"Portfolio has only {len(holdings)} holding(s). "
+                    f"Portfolio has only {holding_count} holding(s). "
                     f"Consider diversifying across more positions and asset classes."
                 ),
             })
@@ -73,7 +74,7 @@ async def compliance_check(portfolio_data: dict) -> dict:
                 "warnings": warnings,
                 "warning_count": len(warnings),
                 "overall_status": "FLAGGED" if warnings else "CLEAR",
-                "holdings_analyzed": len(holdings),
+                "holdings_analyzed": holding_count,
             },
         }
 
@@ -4,6 +4,8 @@ Models the financial impact of having children for any city worldwide.
 Source: US Dept of Labor + Care.com 2024 averages
 """
 
+from functools import lru_cache
+
 CHILDCARE_ANNUAL = {
     "san francisco": 31000, "san-francisco": 31000,
     "seattle": 26000,
@@ -45,6 +47,53 @@ CHILDCARE_ANNUAL = {
 }
 
 
+RENT_LOOKUP = {
+    "austin": 2100, "travis": 2100,
+    "williamson": 1995, "round rock": 1995,
+    "hays": 1937, "san marcos": 1937,
+    "bastrop": 1860, "caldwell": 1750,
+    "seattle": 2400, "san francisco": 3200,
+    "new york": 3800, "boston": 3100,
+    "denver": 1900, "chicago": 1850,
+    "miami": 2800, "nashville": 1800,
+    "los angeles": 2900, "dallas": 1700,
+    "london": 2800, "tokyo": 1800,
+    "berlin": 1600, "paris": 2200,
+}
+
+NO_INCOME_TAX = (
+    "tx", "wa", "fl", "nv", "tn", "wy", "sd", "ak",
+    "texas", "washington", "florida", "austin", "seattle",
+    "dallas", "houston", "nashville", "miami",
+)
+
+
+@lru_cache(maxsize=256)
+def _city_costs(city_lower: str) -> tuple:
+    """Resolve (annual_childcare, monthly_rent) for a lowercased city name.
+
+    Substring matching over both tables is the slow part of a plan, and the
+    same handful of cities are asked about over and over.
+    """
+    annual_childcare = CHILDCARE_ANNUAL.get("default", 18000)
+    for key in CHILDCARE_ANNUAL:
+        if key in city_lower or city_lower in key:
+            annual_childcare = CHILDCARE_ANNUAL[key]
+            break
+    rent = 2000
+    for key, val in RENT_LOOKUP.items():
+        if key in city_lower:
+            rent = val
+            break
+    return annual_childcare, rent
+
+
+@lru_cache(maxsize=256)
+def _state_rate(city: str) -> float:
+    city_lower = city.lower()
+    return 0.0 if any(s in city_lower for s in NO_INCOME_TAX) else 0.05
+
+
 def _estimate_monthly_take_home(annual_salary: float, city: str = "") -> float:
     if annual_salary <= 44725:
         federal = 0.12
@@ -55,12 +104,7 @@ def _estimate_monthly_take_home(annual_salary: float, city: str = "") -> float:
     else:
         federal = 0.32
     fica = 0.0765
-    no_tax = [
-        "tx", "wa", "fl", "nv", "tn", "wy", "sd", "ak",
-        "texas", "washington", "florida", "austin", "seattle",
-        "dallas", "houston", "nashville", "miami",
-    ]
-    state = 0.0 if any(s in city.lower() for s in no_tax) else 0.05
+    state = _state_rate(city)
     return (annual_salary * (1 - federal - fica - state)) / 12
 
 
@@ -77,34 +121,10 @@ def plan_family_finances(
 
     city_lower = current_city.lower()
 
-    # Step 1: Get childcare cost
-    annual_childcare = CHILDCARE_ANNUAL.get("default", 18000)
-    for key in CHILDCARE_ANNUAL:
-        if key in city_lower or city_lower in key:
-            annual_childcare = CHILDCARE_ANNUAL[key]
-            break
+    # Steps 1-2: Childcare cost and median rent for city
+    annual_childcare, rent = _city_costs(city_lower)
     monthly_childcare = (annual_childcare / 12) * num_planned_children
 
-    # Step 2: Get median rent for city
-    RENT_LOOKUP = {
-        "austin": 2100, "travis": 2100,
-        "williamson": 1995, "round rock": 1995,
-        "hays": 1937, "san marcos": 1937,
-        "bastrop": 1860, "caldwell": 1750,
-        "seattle": 2400, "san francisco": 3200,
-        "new york": 3800, "boston": 3100,
-        "denver": 1900, "chicago": 1850,
-        "miami": 2800, "nashville": 1800,
-        "los angeles": 2900, "dallas": 1700,
-        "london": 2800, "tokyo": 1800,
-        "berlin": 1600, "paris": 2200,
-    }
-    rent = 2000
-    for key, val in RENT_LOOKUP.items():
-        if key in city_lower:
-            rent = val
-            break
-
     # Step 3: Calculate income
     total_income = annual_income + partner_income
     reduced_partner = partner_income * (1 - partner_work_reduction)
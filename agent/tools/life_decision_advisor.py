@@ -66,188 +66,225 @@ def analyze_life_decision(decision_type: str, user_context: dict) -> dict:
         current_salary, offer_salary, current_city, destination_city,
         portfolio_value, age, annual_income, has_family, num_dependents,
         timeline_years, priority
+
+    Unknown decision types get the general prompt-for-context response.
+    Fields passed as None are treated as missing, so their defaults apply.
     """
-    ctx = user_context or {}
+    ctx = {k: v for k, v in (user_context or {}).items() if v is not None}
+    handler = _DECISION_HANDLERS.get(decision_type, _decide_general)
+    return handler(ctx)
+
+
+# ── Job Offer decision ─────────────────────────────────────────────────────────
+
+def _decide_job_offer(ctx: dict) -> dict:
     tools_used = []
     data_sources = []
     results = {}
 
-    # ── Job Offer decision ────────────────────────────────────────────────────
-    if decision_type == "job_offer":
-        current_salary = ctx.get("current_salary")
-        offer_salary = ctx.get("offer_salary")
-        current_city = ctx.get("current_city", "")
-        destination_city = ctx.get("destination_city", "")
-        portfolio_value = ctx.get("portfolio_value", 0)
-        age = ctx.get("age")
-        annual_income = ctx.get("annual_income", offer_salary or current_salary or 0)
-
-        # COL comparison via wealth_bridge
-        if (WEALTH_BRIDGE_AVAILABLE and current_salary and offer_salary
-                and current_city and destination_city):
-            try:
-                col_result = _run_async(
-                    calculate_job_offer_affordability(
-                        current_salary=current_salary,
-                        offer_salary=offer_salary,
-                        current_city=current_city,
-                        destination_city=destination_city,
-                    )
-                )
-                if col_result and "error" not in col_result:
-                    results["col"] = col_result
-                    tools_used.append("wealth_bridge")
-                    data_sources.append("Cost of living index")
-            except Exception as e:
-                results["col"] = {"error": str(e)}
-
-        # Relocation runway
-        if (RUNWAY_AVAILABLE and current_salary and offer_salary
-                and current_city and destination_city):
-            try:
-                runway_result = calculate_relocation_runway(
+    current_salary = ctx.get("current_salary")
+    offer_salary = ctx.get("offer_salary")
+    current_city = ctx.get("current_city", "")
+    destination_city = ctx.get("destination_city", "")
+    portfolio_value = ctx.get("portfolio_value", 0)
+    age = ctx.get("age")
+    annual_income = ctx.get("annual_income", offer_salary or current_salary or 0)
+
+    # COL comparison via wealth_bridge
+    if (WEALTH_BRIDGE_AVAILABLE and current_salary and offer_salary
+            and current_city and destination_city):
+        try:
+            col_result = _run_async(
+                calculate_job_offer_affordability(
                     current_salary=current_salary,
                     offer_salary=offer_salary,
                     current_city=current_city,
                     destination_city=destination_city,
-                    portfolio_value=portfolio_value or 0,
-                )
-                if runway_result and "error" not in runway_result:
-                    results["runway"] = runway_result
-                    if "relocation_runway" not in tools_used:
-                        tools_used.append("relocation_runway")
-                    data_sources.append("ACTRIS MLS + Teleport API")
-            except Exception as e:
-                results["runway"] = {"error": str(e)}
-
-        # Wealth position
-        if VISUALIZER_AVAILABLE and age and portfolio_value:
-            try:
-                wealth_result = analyze_wealth_position(
-                    portfolio_value=portfolio_value,
-                    age=age,
-                    annual_income=annual_income,
                 )
-                if wealth_result:
-                    results["wealth"] = wealth_result
-                    tools_used.append("wealth_visualizer")
-                    data_sources.append("Federal Reserve SCF 2022")
-            except Exception as e:
-                results["wealth"] = {"error": str(e)}
-
-        return _synthesize_job_offer(
-            ctx, results, tools_used, data_sources
-        )
+            )
+            if col_result and "error" not in col_result:
+                results["col"] = col_result
+                tools_used.append("wealth_bridge")
+                data_sources.append("Cost of living index")
+        except Exception as e:
+            results["col"] = {"error": str(e)}
 
-    # ── Home Purchase decision ────────────────────────────────────────────────
-    elif decision_type == "home_purchase":
-        portfolio_value = ctx.get("portfolio_value", 0)
-        current_city = ctx.get("current_city", "Austin")
-        age = ctx.get("age")
-        annual_income = ctx.get("annual_income", 0)
-
-        if WEALTH_BRIDGE_AVAILABLE and portfolio_value:
-            try:
-                dp_result = calculate_down_payment_power(
-                    portfolio_value=portfolio_value
-                )
-                if dp_result:
-                    results["down_payment"] = dp_result
-                    tools_used.append("wealth_bridge")
-                    data_sources.append("ACTRIS MLS Jan 2026")
-            except Exception as e:
-                results["down_payment"] = {"error": str(e)}
-
-        if VISUALIZER_AVAILABLE and age and annual_income:
-            try:
-                wealth_result = analyze_wealth_position(
-                    portfolio_value=portfolio_value,
-                    age=age,
-                    annual_income=annual_income,
-                )
+    # Relocation runway
+    if (RUNWAY_AVAILABLE and current_salary and offer_salary
+            and current_city and destination_city):
+        try:
+            runway_result = calculate_relocation_runway(
+                current_salary=current_salary,
+                offer_salary=offer_salary,
+                current_city=current_city,
+                destination_city=destination_city,
+                portfolio_value=portfolio_value or 0,
+            )
+            if runway_result and "error" not in runway_result:
+                results["runway"] = runway_result
+                if "relocation_runway" not in tools_used:
+                    tools_used.append("relocation_runway")
+                data_sources.append("ACTRIS MLS + Teleport API")
+        except Exception as e:
+            results["runway"] = {"error": str(e)}
+
+    # Wealth position
+    if VISUALIZER_AVAILABLE and age and portfolio_value:
+        try:
+            wealth_result = analyze_wealth_position(
+                portfolio_value=portfolio_value,
+                age=age,
+                annual_income=annual_income,
+            )
+            if wealth_result:
                 results["wealth"] = wealth_result
                 tools_used.append("wealth_visualizer")
-            except Exception as e:
-                results["wealth"] = {"error": str(e)}
+                data_sources.append("Federal Reserve SCF 2022")
+        except Exception as e:
+            results["wealth"] = {"error": str(e)}
 
-        return _synthesize_home_purchase(ctx, results, tools_used, data_sources)
+    return _synthesize_job_offer(
+        ctx, results, tools_used, data_sources
+    )
 
-    # ── Rent or Buy decision ──────────────────────────────────────────────────
-    elif decision_type == "rent_or_buy":
-        portfolio_value = ctx.get("portfolio_value", 0)
-        current_city = ctx.get("current_city", "Austin")
-        annual_income = ctx.get("annual_income", 0)
 
-        if WEALTH_BRIDGE_AVAILABLE and portfolio_value:
-            try:
-                dp_result = calculate_down_payment_power(
-                    portfolio_value=portfolio_value
-                )
+# ── Home Purchase decision ─────────────────────────────────────────────────────
+
+def _decide_home_purchase(ctx: dict) -> dict:
+    tools_used = []
+    data_sources = []
+    results = {}
+
+    portfolio_value = ctx.get("portfolio_value", 0)
+    current_city = ctx.get("current_city", "Austin")
+    age = ctx.get("age")
+    annual_income = ctx.get("annual_income", 0)
+
+    if WEALTH_BRIDGE_AVAILABLE and portfolio_value:
+        try:
+            dp_result = calculate_down_payment_power(
+                portfolio_value=portfolio_value
+            )
+            if dp_result:
                 results["down_payment"] = dp_result
                 tools_used.append("wealth_bridge")
                 data_sources.append("ACTRIS MLS Jan 2026")
-            except Exception as e:
-                results["down_payment"] = {"error": str(e)}
-
-        return _synthesize_rent_or_buy(ctx, results, tools_used, data_sources)
-
-    # ── Relocation decision ───────────────────────────────────────────────────
-    elif decision_type == "relocation":
-        current_salary = ctx.get("current_salary")
-        offer_salary = ctx.get("offer_salary", current_salary)
-        current_city = ctx.get("current_city", "")
-        destination_city = ctx.get("destination_city", "")
-        portfolio_value = ctx.get("portfolio_value", 0)
-
-        if (RUNWAY_AVAILABLE and current_salary and current_city
-                and destination_city):
-            try:
-                runway_result = calculate_relocation_runway(
-                    current_salary=current_salary,
-                    offer_salary=offer_salary,
-                    current_city=current_city,
-                    destination_city=destination_city,
-                    portfolio_value=portfolio_value,
-                )
-                results["runway"] = runway_result
-                tools_used.append("relocation_runway")
-                data_sources.append("ACTRIS MLS + Teleport API")
-            except Exception as e:
-                results["runway"] = {"error": str(e)}
-
-        return _synthesize_relocation(ctx, results, tools_used, data_sources)
-
-    # ── General / unknown ─────────────────────────────────────────────────────
-    else:
-        return {
-            "decision_type": "general",
-            "summary": (
-                "I can help you with any major financial life decision. "
-                "Tell me what you're considering and I'll run the numbers."
-            ),
-            "message": (
-                "Please share more context. I can help with: "
-                "(1) Job offer evaluation — is it a real raise after cost of living? "
-                "(2) Relocation planning — how long until you're financially stable? "
-                "(3) Home purchase — can your portfolio cover a down payment? "
-                "(4) Rent vs buy — what makes sense right now? "
-                "Just describe your situation and I'll analyze it."
-            ),
-            "recommendation": (
-                "Share your current salary, any offer details, and your city to get started."
-            ),
-            "financial_verdict": "Need more context",
-            "confidence": "low",
-            "key_numbers": {},
-            "tradeoffs": [],
-            "next_steps": [
-                "Tell me your current salary and city",
-                "Describe the decision you're facing",
-                "Share your portfolio value if relevant",
-            ],
-            "tools_used": [],
-            "data_sources": [],
-        }
+        except Exception as e:
+            results["down_payment"] = {"error": str(e)}
+
+    if VISUALIZER_AVAILABLE and age and annual_income:
+        try:
+            wealth_result = analyze_wealth_position(
+                portfolio_value=portfolio_value,
+                age=age,
+                annual_income=annual_income,
+            )
+            results["wealth"] = wealth_result
+            tools_used.append("wealth_visualizer")
+        except Exception as e:
+            results["wealth"] = {"error": str(e)}
+
+    return _synthesize_home_purchase(ctx, results, tools_used, data_sources)
+
+
+# ── Rent or Buy decision ───────────────────────────────────────────────────────
+
+def _decide_rent_or_buy(ctx: dict) -> dict:
+    tools_used = []
+    data_sources = []
+    results = {}
+
+    portfolio_value = ctx.get("portfolio_value", 0)
+    current_city = ctx.get("current_city", "Austin")
+    annual_income = ctx.get("annual_income", 0)
+
+    if WEALTH_BRIDGE_AVAILABLE and portfolio_value:
+        try:
+            dp_result = calculate_down_payment_power(
+                portfolio_value=portfolio_value
+            )
+            results["down_payment"] = dp_result
+            tools_used.append("wealth_bridge")
+            data_sources.append("ACTRIS MLS Jan 2026")
+        except Exception as e:
+            results["down_payment"] = {"error": str(e)}
+
+    return _synthesize_rent_or_buy(ctx, results, tools_used, data_sources)
+
+
+# ── Relocation decision ────────────────────────────────────────────────────────
+
+def _decide_relocation(ctx: dict) -> dict:
+    tools_used = []
+    data_sources = []
+    results = {}
+
+    current_salary = ctx.get("current_salary")
+    offer_salary = ctx.get("offer_salary", current_salary)
+    current_city = ctx.get("current_city", "")
+    destination_city = ctx.get("destination_city", "")
+    portfolio_value = ctx.get("portfolio_value", 0)
+
+    if (RUNWAY_AVAILABLE and current_salary and current_city
+            and destination_city):
+        try:
+            runway_result = calculate_relocation_runway(
+                current_salary=current_salary,
+                offer_salary=offer_salary,
+                current_city=current_city,
+                destination_city=destination_city,
+                portfolio_value=portfolio_value,
+            )
+            results["runway"] = runway_result
+            tools_used.append("relocation_runway")
+            data_sources.append("ACTRIS MLS + Teleport API")
+        except Exception as e:
+            results["runway"] = {"error": str(e)}
+
+    return _synthesize_relocation(ctx, results, tools_used, data_sources)
+
+
+# ── General / unknown ──────────────────────────────────────────────────────────
+
+def _decide_general(ctx: dict) -> dict:
+    return {
+        "decision_type": "general",
+        "summary": (
+            "I can help you with any major financial life decision. "
+            "Tell me what you're considering and I'll run the numbers."
+        ),
+        "message": (
+            "Please share more context. I can help with: "
+            "(1) Job offer evaluation — is it a real raise after cost of living? "
+            "(2) Relocation planning — how long until you're financially stable? "
+            "(3) Home purchase — can your portfolio cover a down payment? "
+            "(4) Rent vs buy — what makes sense right now? "
+            "Just describe your situation and I'll analyze it."
+        ),
+        "recommendation": (
+            "Share your current salary, any offer details, and your city to get started."
+        ),
+        "financial_verdict": "Need more context",
+        "confidence": "low",
+        "key_numbers": {},
+        "tradeoffs": [],
+        "next_steps": [
+            "Tell me your current salary and city",
+            "Describe the decision you're facing",
+            "Share your portfolio value if relevant",
+        ],
+        "tools_used": [],
+        "data_sources": [],
+    }
+
+
+_DECISION_HANDLERS = {
+    "job_offer": _decide_job_offer,
+    "home_purchase": _decide_home_purchase,
+    "rent_or_buy": _decide_rent_or_buy,
+    "relocation": _decide_relocation,
+    "general": _decide_general,
+}
 
 
 # ── Synthesis helpers ──────────────────────────────────────────────────────────
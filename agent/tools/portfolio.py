@@ -62,6 +62,13 @@ def consolidate_holdings(holdings: list) -> list:
         else:
             _merge_holding(consolidated[symbol], h)
 
+    # Upper-cased name and key → first entry (insertion order) carrying it,
+    # so each UUID row below is one dict lookup instead of a scan.
+    by_name: dict[str, str] = {}
+    for key, existing in consolidated.items():
+        by_name.setdefault((existing.get("name") or "").strip().upper(), key)
+        by_name.setdefault(key.upper(), key)
+
     # Pass 2 — UUID-symbol entries: merge by matching name to a real ticker
     for h in holdings:
         symbol = h.get("symbol", "")
@@ -69,11 +76,7 @@ def consolidate_holdings(holdings: list) -> list:
             continue
         name = (h.get("name") or "").strip().upper()
         # Try to find a real-ticker entry with the same name
-        matched_key = None
-        for key, existing in consolidated.items():
-            if (existing.get("name") or "").strip().upper() == name or key.upper() == name:
-                matched_key = key
-                break
+        matched_key = by_name.get(name)
         if matched_key:
             _merge_holding(consolidated[matched_key], h)
         else:
@@ -81,6 +84,7 @@ def consolidate_holdings(holdings: list) -> list:
             if name not in consolidated:
                 consolidated[name] = h.copy()
                 consolidated[name]["symbol"] = name
+                by_name.setdefault(name, name)
             else:
                 _merge_holding(consolidated[name], h)
 
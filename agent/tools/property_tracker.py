@@ -28,8 +28,10 @@ All functions return the standard tool result envelope:
 import os
 import sqlite3
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 # ---------------------------------------------------------------------------
 # Feature flag  (shared with real_estate.py)
@@ -79,6 +81,16 @@ _SCHEMA_SQL = """
 # SQLite :memory: creates a fresh DB per connection — we must reuse the same one.
 _MEMORY_CONN: Optional[sqlite3.Connection] = None
 
+# File databases whose schema and WAL mode have already been set up in this
+# process. Both persist in the file, so later connections skip the DDL.
+_SCHEMA_READY: set[str] = set()
+
+# Connection pinned by property_batch() for the current task. A ContextVar
+# rather than a module global so concurrent requests never share one.
+_BATCH_CONN: ContextVar[Optional[sqlite3.Connection]] = ContextVar(
+    "_BATCH_CONN", default=None
+)
+
 
 def _db_path() -> str:
     """Returns the SQLite database path (configurable via PROPERTIES_DB_PATH)."""
@@ -99,6 +111,10 @@ def _get_conn() -> sqlite3.Connection:
     data persists across calls within a session / test run.
     """
     global _MEMORY_CONN
+    pinned = _BATCH_CONN.get()
+    if pinned is not None:
+        return pinned
+
     path = _db_path()
 
     if path == ":memory:":
@@ -109,20 +125,56 @@ def _get_conn() -> sqlite3.Connection:
             _MEMORY_CONN.commit()
         return _MEMORY_CONN
 
+    ready = path in _SCHEMA_READY and os.path.exists(path)
     conn = sqlite3.connect(path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute(_SCHEMA_SQL)
-    conn.commit()
+    if not ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA_SQL)
+        conn.commit()
+        _SCHEMA_READY.add(path)
+    # Per-connection setting: in WAL mode NORMAL skips the fsync on every
+    # commit (the WAL is synced at checkpoints) and stays corruption-safe.
+    conn.execute("PRAGMA synchronous=NORMAL")
     return conn
 
 
 def _close_conn(conn: sqlite3.Connection) -> None:
-    """Closes file-based connections; leaves :memory: connection open."""
+    """Closes file-based connections; leaves :memory: and batch connections open."""
+    if conn is _BATCH_CONN.get():
+        return
     if _db_path() != ":memory:":
         conn.close()
 
 
+@contextmanager
+def property_batch() -> Iterator[None]:
+    """
+    Runs a sequence of tool calls on one SQLite connection.
+
+    Every tool function opens (and for file databases, closes) its own
+    connection. Inside this block they all reuse a single one, so e.g.
+    add → net worth → update → net worth pays for one connect instead of
+    four. Each call still commits its own writes. Nested blocks reuse the
+    outer connection.
+    """
+    if _BATCH_CONN.get() is not None:
+        yield
+        return
+    conn = _get_conn()
+    token = _BATCH_CONN.set(conn)
+    try:
+        yield
+    finally:
+        _BATCH_CONN.reset(token)
+        _close_conn(conn)
+
+
+def _to_cents(amount: Optional[float]) -> int:
+    """Dollar amount as whole cents, so totals add up without float drift."""
+    return round((amount or 0) * 100)
+
+
 def _row_to_dict(row: sqlite3.Row) -> dict:
     """Converts a sqlite3.Row to a plain dict with computed equity/appreciation fields."""
     d = dict(row)
@@ -130,7 +182,7 @@ def _row_to_dict(row: sqlite3.Row) -> dict:
     mortgage_balance = d.get("mortgage_balance", 0) or 0
     purchase_price = d.get("purchase_price", 0) or 0
 
-    equity = round(current_value - mortgage_balance, 2)
+    equity = (_to_cents(current_value) - _to_cents(mortgage_balance)) / 100
     equity_pct = round((equity / current_value * 100), 2) if current_value > 0 else 0.0
     appreciation = round(current_value - purchase_price, 2)
     appreciation_pct = (
@@ -154,6 +206,7 @@ def property_store_clear() -> None:
     """
     Wipes ALL property records. Used in tests to reset state between cases.
     For :memory: databases, deletes all rows from the shared connection.
+    A bare DELETE takes SQLite's truncate path; the schema is left in place.
     """
     global _MEMORY_CONN
     path = _db_path()
@@ -327,9 +380,11 @@ async def get_properties() -> dict:
         }
 
     total_purchase = sum(p["purchase_price"] for p in properties)
-    total_value = sum(p["current_value"] for p in properties)
-    total_mortgage = sum(p["mortgage_balance"] for p in properties)
-    total_equity = round(total_value - total_mortgage, 2)
+    value_cents = sum(_to_cents(p["current_value"]) for p in properties)
+    mortgage_cents = sum(_to_cents(p["mortgage_balance"]) for p in properties)
+    total_value = value_cents / 100
+    total_mortgage = mortgage_cents / 100
+    total_equity = (value_cents - mortgage_cents) / 100
     total_equity_pct = (
         round((total_equity / total_value * 100), 2) if total_value > 0 else 0.0
     )
@@ -545,10 +600,15 @@ async def get_real_estate_equity() -> dict:
 
     try:
         conn = _get_conn()
-        rows = conn.execute(
-            "SELECT current_value, mortgage_balance "
+        # Aggregate inside SQLite — one pass, no per-row Python objects.
+        # Sums run over whole cents, so SQLite adds integers exactly; COALESCE
+        # keeps the empty-store totals as 0 rather than NULL.
+        row = conn.execute(
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(CAST(ROUND(current_value * 100) AS INTEGER)), 0), "
+            "COALESCE(SUM(CAST(ROUND(mortgage_balance * 100) AS INTEGER)), 0) "
             "FROM properties WHERE is_active = 1"
-        ).fetchall()
+        ).fetchone()
         _close_conn(conn)
     except Exception as exc:
         return {
@@ -558,9 +618,10 @@ async def get_real_estate_equity() -> dict:
             "error": {"code": "PROPERTY_TRACKER_DB_ERROR", "message": str(exc)},
         }
 
-    total_value = sum(r["current_value"] for r in rows)
-    total_mortgage = sum(r["mortgage_balance"] for r in rows)
-    total_equity = round(total_value - total_mortgage, 2)
+    property_count, value_cents, mortgage_cents = row
+    total_value = value_cents / 100
+    total_mortgage = mortgage_cents / 100
+    total_equity = (value_cents - mortgage_cents) / 100
 
     return {
         "tool_name": "property_tracker",
@@ -568,7 +629,7 @@ async def get_real_estate_equity() -> dict:
         "tool_result_id": tool_result_id,
         "timestamp": datetime.utcnow().isoformat(),
         "result": {
-            "property_count": len(rows),
+            "property_count": property_count,
             "total_real_estate_value": total_value,
             "total_mortgage_balance": total_mortgage,
             "total_real_estate_equity": total_equity,
@@ -609,9 +670,11 @@ async def get_total_net_worth(portfolio_value: float) -> dict:
             "error": {"code": "PROPERTY_TRACKER_DB_ERROR", "message": str(exc)},
         }
 
-    total_value = sum(p["current_value"] for p in properties)
-    total_mortgage = sum(p["mortgage_balance"] for p in properties)
-    real_estate_equity = round(total_value - total_mortgage, 2)
+    equity_cents = sum(
+        _to_cents(p["current_value"]) - _to_cents(p["mortgage_balance"])
+        for p in properties
+    )
+    real_estate_equity = equity_cents / 100
     total_net_worth = round(portfolio_value + real_estate_equity, 2)
 
     if properties:
@@ -641,6 +704,20 @@ async def get_total_net_worth(portfolio_value: float) -> dict:
     }
 
 
+# Equity-option projections all use a fixed 6.95% 30-year mortgage and 4%
+# appreciation, so the amortization terms are constants computed once.
+_MONTHLY_RATE = 0.0695 / 12
+_TERM_FACTOR = (1 + _MONTHLY_RATE) ** 360
+_PAYMENT_NUMERATOR = _MONTHLY_RATE * _TERM_FACTOR
+_PAYMENT_DENOMINATOR = _TERM_FACTOR - 1
+_APPRECIATION_10YR = 1.04 ** 10
+
+
+def _monthly_payment(balance: float) -> float:
+    """Fixed-rate monthly payment on balance at the equity-options rate."""
+    return balance * _PAYMENT_NUMERATOR / _PAYMENT_DENOMINATOR
+
+
 def analyze_equity_options(
     property_id: str,
     market_return_assumption: float = 0.07,
@@ -650,12 +727,10 @@ def analyze_equity_options(
 
     try:
         conn = _get_conn()
-        cur = conn.cursor()
-        cur.execute(
+        row = conn.execute(
             "SELECT * FROM properties WHERE id=? AND is_active=1",
             (property_id,),
-        )
-        row = cur.fetchone()
+        ).fetchone()
         _close_conn(conn)
     except Exception as e:
         return {
@@ -685,30 +760,18 @@ def analyze_equity_options(
             "options": {},
         }
 
-    monthly_rate = 0.0695 / 12
-    n = 360
-
     # Option A: Leave untouched
-    projected_value_a = current_value * (1.04 ** 10)
+    projected_value_a = current_value * _APPRECIATION_10YR
     equity_a = projected_value_a - mortgage_balance
 
     # Option B: Cash-out refi + invest
     new_balance = mortgage_balance + accessible
-    new_payment = new_balance * (
-        monthly_rate * (1 + monthly_rate) ** n
-    ) / ((1 + monthly_rate) ** n - 1)
-
-    old_payment = (
-        mortgage_balance
-        * (monthly_rate * (1 + monthly_rate) ** n)
-        / ((1 + monthly_rate) ** n - 1)
-        if mortgage_balance > 0
-        else 0
-    )
+    new_payment = _monthly_payment(new_balance)
+    old_payment = _monthly_payment(mortgage_balance) if mortgage_balance > 0 else 0
 
     payment_increase = new_payment - old_payment
     invested_b = accessible * ((1 + market_return_assumption) ** 10)
-    home_equity_b = (current_value * 1.04 ** 10) - new_balance
+    home_equity_b = (current_value * _APPRECIATION_10YR) - new_balance
     total_b = home_equity_b + invested_b
 
     # Option C: Rental property
@@ -716,9 +779,7 @@ def analyze_equity_options(
     rental_down = accessible
     rental_mortgage_balance = rental_price - rental_down
     rental_payment = (
-        rental_mortgage_balance
-        * (monthly_rate * (1 + monthly_rate) ** n)
-        / ((1 + monthly_rate) ** n - 1)
+        _monthly_payment(rental_mortgage_balance)
         if rental_mortgage_balance > 0
         else 0
     )
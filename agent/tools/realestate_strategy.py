@@ -67,26 +67,29 @@ def simulate_real_estate_strategy(
     monthly_rate = rate / 12
     loan_term_months = 360  # 30-year fixed
 
+    # Loop-invariant powers, computed once per simulation instead of once per
+    # property per year: (1 + r)^360, and the year-indexed growth factors
+    # (1 + r)^(12·y) and (1 + appreciation)^y for y in 0..total_years.
+    term_factor = (1 + monthly_rate) ** loan_term_months
+    balance_factor = [(1 + monthly_rate) ** (y * 12) for y in range(total_years + 1)]
+    growth = [(1 + appreciation) ** y for y in range(total_years + 1)]
+
     def monthly_payment(loan_amount: float) -> float:
         if loan_amount <= 0 or monthly_rate == 0:
             return 0.0
-        return loan_amount * (
-            monthly_rate * (1 + monthly_rate) ** loan_term_months
-        ) / ((1 + monthly_rate) ** loan_term_months - 1)
+        return loan_amount * (monthly_rate * term_factor) / (term_factor - 1)
 
     def remaining_balance(loan_amount: float, years_paid: int) -> float:
         """Outstanding mortgage balance after years_paid years."""
         if loan_amount <= 0 or monthly_rate == 0:
             return 0.0
-        n = years_paid * 12
         return loan_amount * (
-            (1 + monthly_rate) ** loan_term_months
-            - (1 + monthly_rate) ** n
-        ) / ((1 + monthly_rate) ** loan_term_months - 1)
+            term_factor - balance_factor[years_paid]
+        ) / (term_factor - 1)
 
     # ── Simulation ────────────────────────────────────────────────────────────
     portfolio = float(initial_portfolio_value)
-    properties: list[dict] = []   # {purchase_year, price, loan, is_rental}
+    properties: list[dict] = []   # {purchase_year, price, loan, is_rental, annual_mpay}
     timeline: list[dict] = []
 
     # Estimate annual savings as ~20% of income (rough rule of thumb)
@@ -99,7 +102,7 @@ def simulate_real_estate_strategy(
         # ── Buy a property this year? ─────────────────────────────────────────
         if year == next_buy_year:
             # Price grows with appreciation from first home price
-            price = first_home_price * ((1 + appreciation) ** year)
+            price = first_home_price * growth[year]
             down = price * down_payment_pct
             loan = price - down
 
@@ -114,6 +117,8 @@ def simulate_real_estate_strategy(
                     "price": price,
                     "loan": loan,
                     "is_rental": False,
+                    # Fixed-rate payment never changes — compute it once.
+                    "annual_mpay": monthly_payment(loan) * 12,
                 })
                 prop_num += 1
                 next_buy_year = year + buy_interval_years
@@ -129,13 +134,12 @@ def simulate_real_estate_strategy(
         prop_snapshots = []
         for p in properties:
             years_held = year - p["purchase_year"]
-            current_value = p["price"] * ((1 + appreciation) ** years_held)
+            current_value = p["price"] * growth[years_held]
             bal = remaining_balance(p["loan"], years_held)
             equity = max(0.0, current_value - bal)
             total_re_equity += equity
 
-            mpay = monthly_payment(p["loan"])
-            annual_mpay = mpay * 12
+            annual_mpay = p["annual_mpay"]
             total_mortgage_payments += annual_mpay
 
             if p["is_rental"]:
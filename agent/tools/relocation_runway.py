@@ -3,8 +3,13 @@ Relocation Runway Calculator
 Answers: "How long until I feel financially stable if I move?"
 """
 
+import asyncio
+import atexit
 import sys
 import os
+import threading
+from functools import lru_cache
+
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
@@ -22,6 +27,47 @@ except ImportError:
         return {"MedianRentMonthly": 2000, "median_price": 400000}
 
 
+NO_INCOME_TAX = (
+    "tx", "wa", "fl", "nv", "tn", "wy", "sd", "ak",
+    "texas", "washington", "florida", "nevada",
+    "tennessee", "wyoming", "south dakota", "alaska",
+    "austin", "seattle", "miami", "nashville",
+    "dallas", "houston", "san antonio",
+)
+
+AUSTIN_KEYWORDS = (
+    "austin", "travis", "williamson", "hays", "bastrop",
+    "caldwell", "round rock", "cedar park", "georgetown",
+    "kyle", "buda", "san marcos", "lockhart", "bastrop",
+    "elgin", "leander", "pflugerville", "manor", "del valle",
+)
+
+FALLBACK_RENTS = {
+    "san francisco": {"MedianRentMonthly": 3200, "median_price": 1350000},
+    "seattle": {"MedianRentMonthly": 2400, "median_price": 850000},
+    "new york": {"MedianRentMonthly": 3800, "median_price": 750000},
+    "denver": {"MedianRentMonthly": 1900, "median_price": 565000},
+    "chicago": {"MedianRentMonthly": 1850, "median_price": 380000},
+    "miami": {"MedianRentMonthly": 2800, "median_price": 620000},
+    "boston": {"MedianRentMonthly": 3100, "median_price": 720000},
+    "los angeles": {"MedianRentMonthly": 2900, "median_price": 950000},
+    "nashville": {"MedianRentMonthly": 1800, "median_price": 450000},
+    "dallas": {"MedianRentMonthly": 1700, "median_price": 380000},
+    "london": {"MedianRentMonthly": 2800, "median_price": 720000},
+    "toronto": {"MedianRentMonthly": 2300, "median_price": 980000},
+    "sydney": {"MedianRentMonthly": 2600, "median_price": 1100000},
+    "berlin": {"MedianRentMonthly": 1600, "median_price": 520000},
+    "tokyo": {"MedianRentMonthly": 1800, "median_price": 650000},
+    "paris": {"MedianRentMonthly": 2200, "median_price": 800000},
+}
+
+
+@lru_cache(maxsize=256)
+def _state_rate(city_name: str) -> float:
+    city_lower = city_name.lower()
+    return 0.0 if any(s in city_lower for s in NO_INCOME_TAX) else 0.05
+
+
 def estimate_take_home(annual_salary: float, city_name: str = "") -> float:
     if annual_salary <= 44725:
         federal_rate = 0.12
@@ -33,37 +79,62 @@ def estimate_take_home(annual_salary: float, city_name: str = "") -> float:
         federal_rate = 0.32
 
     fica = 0.0765
-
-    no_income_tax = [
-        "tx", "wa", "fl", "nv", "tn", "wy", "sd", "ak",
-        "texas", "washington", "florida", "nevada",
-        "tennessee", "wyoming", "south dakota", "alaska",
-        "austin", "seattle", "miami", "nashville",
-        "dallas", "houston", "san antonio",
-    ]
-
-    city_lower = city_name.lower()
-    has_state_tax = not any(s in city_lower for s in no_income_tax)
-    state_rate = 0.05 if has_state_tax else 0.0
+    state_rate = _state_rate(city_name)
 
     total_rate = federal_rate + fica + state_rate
     annual_take_home = annual_salary * (1 - total_rate)
     return annual_take_home / 12
 
 
+def _loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _SyncLoop:
+    """A thread's event loop, closed when the thread's locals are released."""
+
+    __slots__ = ("loop",)
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self):
+        if not self.loop.is_closed():
+            self.loop.close()
+
+
+# One event loop per thread for sync callers, reused across calls instead
+# of asyncio.run building and tearing down a fresh loop every lookup. Only
+# the thread-local holds it, so a finished thread's loop is closed with it.
+_sync_loops = threading.local()
+
+
+def _run_sync(coro):
+    holder = getattr(_sync_loops, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _SyncLoop()
+        _sync_loops.holder = holder
+    return holder.loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_sync_loop() -> None:
+    # The main thread's locals outlive atexit; close its loop explicitly.
+    holder = getattr(_sync_loops, "holder", None)
+    if holder is not None and not holder.loop.is_closed():
+        holder.loop.close()
+
+
 def get_city_data_safe(city_name: str) -> dict:
     """Gets city data from ACTRIS for Austin areas, Teleport for everything else.
     Never crashes."""
-    austin_keywords = [
-        "austin", "travis", "williamson", "hays", "bastrop",
-        "caldwell", "round rock", "cedar park", "georgetown",
-        "kyle", "buda", "san marcos", "lockhart", "bastrop",
-        "elgin", "leander", "pflugerville", "manor", "del valle",
-    ]
-
     city_lower = city_name.lower()
 
-    for keyword in austin_keywords:
+    for keyword in AUSTIN_KEYWORDS:
         if keyword in city_lower:
             if any(k in city_lower for k in [
                 "round rock", "cedar park", "georgetown", "leander", "williamson"
@@ -93,38 +164,21 @@ def get_city_data_safe(city_name: str) -> dict:
                     {"MedianRentMonthly": 2100, "median_price": 522500},
                 )
 
-    if TELEPORT_AVAILABLE:
+    # get_city_housing_data is async — run it synchronously. Loops cannot
+    # nest, so inside a running loop (the graph, async tests) go straight
+    # to the fallback table instead of building a coroutine that would
+    # only be discarded unawaited.
+    if TELEPORT_AVAILABLE and not _loop_running():
         try:
-            import asyncio
-            # get_city_housing_data is async — run it synchronously
-            data = asyncio.run(get_city_housing_data(city_name))
+            data = _run_sync(get_city_housing_data(city_name))
             if data and "MedianRentMonthly" in data:
                 return data
         except Exception:
             pass
 
-    FALLBACK_RENTS = {
-        "san francisco": {"MedianRentMonthly": 3200, "median_price": 1350000},
-        "seattle": {"MedianRentMonthly": 2400, "median_price": 850000},
-        "new york": {"MedianRentMonthly": 3800, "median_price": 750000},
-        "denver": {"MedianRentMonthly": 1900, "median_price": 565000},
-        "chicago": {"MedianRentMonthly": 1850, "median_price": 380000},
-        "miami": {"MedianRentMonthly": 2800, "median_price": 620000},
-        "boston": {"MedianRentMonthly": 3100, "median_price": 720000},
-        "los angeles": {"MedianRentMonthly": 2900, "median_price": 950000},
-        "nashville": {"MedianRentMonthly": 1800, "median_price": 450000},
-        "dallas": {"MedianRentMonthly": 1700, "median_price": 380000},
-        "london": {"MedianRentMonthly": 2800, "median_price": 720000},
-        "toronto": {"MedianRentMonthly": 2300, "median_price": 980000},
-        "sydney": {"MedianRentMonthly": 2600, "median_price": 1100000},
-        "berlin": {"MedianRentMonthly": 1600, "median_price": 520000},
-        "tokyo": {"MedianRentMonthly": 1800, "median_price": 650000},
-        "paris": {"MedianRentMonthly": 2200, "median_price": 800000},
-    }
-
     for key, val in FALLBACK_RENTS.items():
         if key in city_lower:
-            return val
+            return dict(val)
 
     return {
         "MedianRentMonthly": 2000,
@@ -1,4 +1,11 @@
 from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_day(day: str) -> datetime:
+    """Midnight datetime for a YYYY-MM-DD string; activity dates repeat a lot."""
+    return datetime.fromisoformat(day)
 
 
 async def tax_estimate(activities: list, additional_income: float = 0) -> dict:
@@ -24,20 +31,25 @@ async def tax_estimate(activities: list, additional_income: float = 0) -> dict:
         breakdown = []
 
         sells = [a for a in activities if a.get("type") == "SELL"]
-        buys = [a for a in activities if a.get("type") == "BUY"]
+        # Buys grouped by symbol (activity order kept), so each sell looks up
+        # its lots directly instead of rescanning every buy.
+        buys_by_symbol: dict[str, list] = {}
+        for a in activities:
+            if a.get("type") == "BUY":
+                buys_by_symbol.setdefault(a.get("symbol") or "", []).append(a)
 
         for sell in sells:
             symbol = sell.get("symbol") or sell.get("SymbolProfile", {}).get("symbol", "UNKNOWN")
             raw_date = sell.get("date", today.isoformat())
-            sell_date = datetime.fromisoformat(str(raw_date)[:10])
+            sell_date = _parse_day(str(raw_date)[:10])
             sell_price = sell.get("unitPrice") or 0
             quantity = sell.get("quantity") or 0
 
-            matching_buys = [b for b in buys if (b.get("symbol") or "") == symbol]
+            matching_buys = buys_by_symbol.get(symbol, [])
             if matching_buys:
                 cost_basis = matching_buys[0].get("unitPrice") or sell_price
                 buy_raw = matching_buys[0].get("date", today.isoformat())
-                buy_date = datetime.fromisoformat(str(buy_raw)[:10])
+                buy_date = _parse_day(str(buy_raw)[:10])
             else:
                 cost_basis = sell_price
                 buy_date = sell_date
@@ -53,10 +65,9 @@ async def tax_estimate(activities: list, additional_income: float = 0) -> dict:
             # Wash-sale check: bought same stock within 30 days of selling at a loss
             if gain < 0:
                 recent_buys = [
-                    b for b in buys
-                    if (b.get("symbol") or "") == symbol
-                    and abs(
-                        (datetime.fromisoformat(str(b.get("date", today.isoformat()))[:10]) - sell_date).days
+                    b for b in matching_buys
+                    if abs(
+                        (_parse_day(str(b.get("date", today.isoformat()))[:10]) - sell_date).days
                     ) <= 30
                 ]
                 if recent_buys:
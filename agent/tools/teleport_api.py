@@ -18,7 +18,9 @@ for 15 major cities. Never crashes — always returns something useful.
 
 import asyncio
 import httpx
-from typing import Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
 
 # ---------------------------------------------------------------------------
 # Austin TX area keywords — route these to real_estate.py, not Teleport
@@ -256,6 +258,44 @@ HARDCODED_FALLBACK: dict[str, dict] = {
 _TELEPORT_BASE = "https://api.teleport.org/api"
 _REQUEST_TIMEOUT = 8.0  # seconds
 
+# Client pinned by an enclosing teleport_session(); None outside one.
+_SESSION_CLIENT: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "teleport_session_client", default=None
+)
+
+
+@asynccontextmanager
+async def teleport_session() -> AsyncIterator[None]:
+    """
+    Runs a sequence of Teleport requests on one pooled client.
+
+    Outside this block every request opens and closes its own client.
+    Inside it they share one, so the slug search and the scores/details
+    fetch for a city reuse a single TLS connection. The client is closed
+    when the block exits, on the loop that opened it. Nested blocks reuse
+    the outer client.
+    """
+    if _SESSION_CLIENT.get() is not None:
+        yield
+        return
+    async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
+        token = _SESSION_CLIENT.set(client)
+        try:
+            yield
+        finally:
+            _SESSION_CLIENT.reset(token)
+
+
+@asynccontextmanager
+async def _client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yields the session client if one is open, else a one-off client."""
+    shared = _SESSION_CLIENT.get()
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
+        yield client
+
 
 # ---------------------------------------------------------------------------
 # Slug resolution
@@ -283,7 +323,7 @@ async def search_city_slug(city_name: str) -> Optional[str]:
         return _slug_cache[lower]
 
     try:
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
+        async with _client() as client:
             resp = await client.get(
                 f"{_TELEPORT_BASE}/cities/",
                 params={
@@ -345,19 +385,20 @@ async def get_city_housing_data(city_name: str) -> dict:
             "redirect": "real_estate",
         }
 
-    slug = await search_city_slug(city_name)
+    async with teleport_session():
+        slug = await search_city_slug(city_name)
 
-    if slug is None:
-        # Best effort: try simple slug from city name
-        slug = city_name.lower().strip().replace(" ", "-")
+        if slug is None:
+            # Best effort: try simple slug from city name
+            slug = city_name.lower().strip().replace(" ", "-")
 
-    # Try live Teleport API first
-    try:
-        result = await _fetch_from_teleport(city_name, slug)
-        if result:
-            return result
-    except Exception:
-        pass
+        # Try live Teleport API first
+        try:
+            result = await _fetch_from_teleport(city_name, slug)
+            if result:
+                return result
+        except Exception:
+            pass
 
     # Fall back to hardcoded data
     return _get_fallback(city_name, slug)
@@ -365,7 +406,7 @@ async def get_city_housing_data(city_name: str) -> dict:
 
 async def _fetch_from_teleport(city_name: str, slug: str) -> Optional[dict]:
     """Calls Teleport /scores/ and /details/ for a given slug."""
-    async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
+    async with _client() as client:
         scores_resp, details_resp = await asyncio.gather(
             client.get(f"{_TELEPORT_BASE}/urban_areas/slug:{slug}/scores/"),
             client.get(f"{_TELEPORT_BASE}/urban_areas/slug:{slug}/details/"),
@@ -23,6 +23,7 @@ Mortgage assumption: 30-year fixed at 6.95%, 20% down, payment × 1.25
 import asyncio
 import sys
 import os
+from functools import lru_cache
 from typing import Optional
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -159,34 +160,38 @@ def _col_index_for_city(city_name: str, city_data: dict) -> float:
     return round((10.0 - col_score) * 18.0 + 20.0, 1)
 
 
+# Simple heuristics from known cities
+_CITY_STATE_CODES: dict[str, str] = {
+    "tx": "TX", "austin": "TX", "dallas": "TX", "houston": "TX", "san antonio": "TX",
+    "wa": "WA", "seattle": "WA",
+    "fl": "FL", "miami": "FL", "orlando": "FL", "tampa": "FL",
+    "nv": "NV", "las vegas": "NV",
+    "ca": "CA", "san francisco": "CA", "los angeles": "CA", "san diego": "CA",
+    "ny": "NY", "new york": "NY", "brooklyn": "NY",
+    "co": "CO", "denver": "CO",
+    "il": "IL", "chicago": "IL",
+    "ma": "MA", "boston": "MA",
+    "tn": "TN", "nashville": "TN",
+    "ga": "GA", "atlanta": "GA",
+    "or": "OR", "portland": "OR",
+    "az": "AZ", "phoenix": "AZ",
+    "mn": "MN", "minneapolis": "MN",
+    "nc": "NC", "charlotte": "NC",
+    "va": "VA", "arlington": "VA",
+}
+
+
+def _state_code(city: str) -> Optional[str]:
+    city_lower = city.lower()
+    for keyword, code in _CITY_STATE_CODES.items():
+        if keyword in city_lower:
+            return code
+    return None
+
+
+@lru_cache(maxsize=512)
 def _state_tax_note(city_a: str, city_b: str) -> str:
     """Builds a human-readable state income tax note for two cities."""
-    def _state_code(city: str) -> Optional[str]:
-        # Simple heuristics from known cities
-        city_lower = city.lower()
-        state_map = {
-            "tx": "TX", "austin": "TX", "dallas": "TX", "houston": "TX", "san antonio": "TX",
-            "wa": "WA", "seattle": "WA",
-            "fl": "FL", "miami": "FL", "orlando": "FL", "tampa": "FL",
-            "nv": "NV", "las vegas": "NV",
-            "ca": "CA", "san francisco": "CA", "los angeles": "CA", "san diego": "CA",
-            "ny": "NY", "new york": "NY", "brooklyn": "NY",
-            "co": "CO", "denver": "CO",
-            "il": "IL", "chicago": "IL",
-            "ma": "MA", "boston": "MA",
-            "tn": "TN", "nashville": "TN",
-            "ga": "GA", "atlanta": "GA",
-            "or": "OR", "portland": "OR",
-            "az": "AZ", "phoenix": "AZ",
-            "mn": "MN", "minneapolis": "MN",
-            "nc": "NC", "charlotte": "NC",
-            "va": "VA", "arlington": "VA",
-        }
-        for keyword, code in state_map.items():
-            if keyword in city_lower:
-                return code
-        return None
-
     state_a = _state_code(city_a)
     state_b = _state_code(city_b)
 
@@ -221,6 +226,88 @@ def _state_tax_note(city_a: str, city_b: str) -> str:
     )
 
 
+def _market_profile(city_ref: str, snap: dict) -> dict:
+    """
+    Portfolio-independent figures for one market: price, required 20% down,
+    PITI estimate and rent-vs-buy. Only the affordability flags depend on the
+    portfolio, so these are computed once per market and reused across calls.
+    """
+    price = snap.get("median_price") or snap.get("ListPrice") or 500_000
+    rent = snap.get("MedianRentMonthly") or snap.get("median_rent") or 0
+
+    monthly_payment = _monthly_payment(price)
+    rent_vs_buy_diff = round(monthly_payment - rent, 0) if rent else None
+    rent_vs_buy_verdict = (
+        f"Buying costs ${abs(rent_vs_buy_diff):,.0f}/mo "
+        f"{'more' if rent_vs_buy_diff > 0 else 'less'} than renting"
+        if rent_vs_buy_diff is not None else "Rental data unavailable"
+    )
+
+    # Simple break-even: closing costs ~3% + transaction costs ~6% = ~9% of price
+    # Break even = (9% of price) / monthly_savings_vs_rent
+    monthly_savings = -(rent_vs_buy_diff or 1)
+    if monthly_savings > 0 and rent_vs_buy_diff is not None:
+        break_even_years = round((price * 0.09) / (monthly_savings * 12), 1)
+    elif rent_vs_buy_diff is not None and rent_vs_buy_diff <= 0:
+        break_even_years = 0.0  # Already cheaper to buy
+    else:
+        break_even_years = None
+
+    return {
+        "area": snap.get("region") or snap.get("city") or city_ref,
+        "city_ref": city_ref,
+        "median_price": price,
+        "required_down_20pct": round(price * 0.20, 2),
+        "monthly_payment_estimate": int(monthly_payment),
+        "median_rent": rent,
+        "rent_vs_buy_monthly_diff": rent_vs_buy_diff,
+        "rent_vs_buy_verdict": rent_vs_buy_verdict,
+        "break_even_years": break_even_years,
+        "data_source": snap.get("data_source", "estimate"),
+    }
+
+
+@lru_cache(maxsize=1)
+def _default_market_profiles() -> tuple[dict, ...]:
+    """Profiles for the default Austin ACTRIS markets, built on first use."""
+    return tuple(
+        _market_profile(key, _MOCK_SNAPSHOTS[key])
+        for key in _DEFAULT_AUSTIN_MARKETS
+        if key in _MOCK_SNAPSHOTS
+    )
+
+
+@lru_cache(maxsize=256)
+def _city_market_profile(city: str) -> dict:
+    _, data = _resolve_city_data_sync(city)
+    return _market_profile(city, data)
+
+
+# In-flight Teleport lookups, so concurrent callers asking about the same city
+# share one request. Keyed by (loop, city): a future can only be awaited on
+# the loop that owns it, and the life advisor runs lookups on worker-thread
+# loops alongside the graph's. Entries are dropped once the lookup completes.
+_inflight_city_data: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+
+async def _get_col_data(city: str) -> tuple[float, dict]:
+    """Returns (col_index, city_data) for one side of a job-offer comparison."""
+    if _is_austin_area(city):
+        city_key = _normalize_city(city)
+        snap = _MOCK_SNAPSHOTS.get(city_key, {})
+        col = _AUSTIN_COL_INDEX.get(city_key, 95.4)
+        return col, snap
+
+    key = (asyncio.get_running_loop(), city)
+    pending = _inflight_city_data.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(get_city_housing_data(city))
+        _inflight_city_data[key] = pending
+        pending.add_done_callback(lambda _: _inflight_city_data.pop(key, None))
+    data = await asyncio.shield(pending)
+    return _col_index_for_city(city, data), data
+
+
 # ---------------------------------------------------------------------------
 # Public tool functions
 # ---------------------------------------------------------------------------
@@ -251,69 +338,36 @@ def calculate_down_payment_power(
 
     if target_cities is None:
         # Default: all 7 Austin ACTRIS markets (from _MOCK_SNAPSHOTS directly)
-        city_keys = _DEFAULT_AUSTIN_MARKETS
-        markets_data = [
-            (key, _MOCK_SNAPSHOTS[key])
-            for key in city_keys
-            if key in _MOCK_SNAPSHOTS
-        ]
+        markets = _default_market_profiles()
     else:
-        markets_data = []
-        for city in target_cities:
-            display, data = _resolve_city_data_sync(city)
-            markets_data.append((city, data))
+        markets = [_city_market_profile(city) for city in target_cities]
 
     markets_out = []
     affordable_markets = []
 
-    for city_ref, snap in markets_data:
-        price = snap.get("median_price") or snap.get("ListPrice") or 500_000
-        rent = snap.get("MedianRentMonthly") or snap.get("median_rent") or 0
-        area_name = snap.get("region") or snap.get("city") or city_ref
-        ds = snap.get("data_source", "estimate")
-
-        required_down_20 = round(price * 0.20, 2)
+    for market in markets:
+        required_down_20 = market["required_down_20pct"]
         can_full = full >= required_down_20
-        can_conservative = conservative >= required_down_20
-        can_safe = safe >= required_down_20
-
-        monthly_payment = _monthly_payment(price)
-        rent_vs_buy_diff = round(monthly_payment - rent, 0) if rent else None
-        rent_vs_buy_verdict = (
-            f"Buying costs ${abs(rent_vs_buy_diff):,.0f}/mo "
-            f"{'more' if rent_vs_buy_diff > 0 else 'less'} than renting"
-            if rent_vs_buy_diff is not None else "Rental data unavailable"
-        )
-
-        # Simple break-even: closing costs ~3% + transaction costs ~6% = ~9% of price
-        # Break even = (9% of price) / monthly_savings_vs_rent
-        monthly_savings = -(rent_vs_buy_diff or 1)
-        if monthly_savings > 0 and rent_vs_buy_diff is not None:
-            break_even_years = round((price * 0.09) / (monthly_savings * 12), 1)
-        elif rent_vs_buy_diff is not None and rent_vs_buy_diff <= 0:
-            break_even_years = 0.0  # Already cheaper to buy
-        else:
-            break_even_years = None
 
         entry = {
-            "area": area_name,
-            "city_ref": city_ref,
-            "median_price": price,
+            "area": market["area"],
+            "city_ref": market["city_ref"],
+            "median_price": market["median_price"],
             "required_down_20pct": required_down_20,
             "can_afford_full": can_full,
-            "can_afford_conservative": can_conservative,
-            "can_afford_safe": can_safe,
-            "monthly_payment_estimate": int(monthly_payment),
-            "median_rent": rent,
-            "rent_vs_buy_monthly_diff": rent_vs_buy_diff,
-            "rent_vs_buy_verdict": rent_vs_buy_verdict,
-            "break_even_years": break_even_years,
-            "data_source": ds,
+            "can_afford_conservative": conservative >= required_down_20,
+            "can_afford_safe": safe >= required_down_20,
+            "monthly_payment_estimate": market["monthly_payment_estimate"],
+            "median_rent": market["median_rent"],
+            "rent_vs_buy_monthly_diff": market["rent_vs_buy_monthly_diff"],
+            "rent_vs_buy_verdict": market["rent_vs_buy_verdict"],
+            "break_even_years": market["break_even_years"],
+            "data_source": market["data_source"],
         }
         markets_out.append(entry)
 
         if can_full:
-            affordable_markets.append(area_name)
+            affordable_markets.append(market["area"])
 
     # Build recommendation
     max_home_price = round(portfolio_value / 0.20, 0)
@@ -383,19 +437,10 @@ async def calculate_job_offer_affordability(
         Full comparison dict including adjusted purchasing power, verdict,
         break-even salary, state tax note, and housing cost comparison.
     """
-    # Fetch city data (async for Teleport; sync-cached for Austin)
-    async def _get_data(city: str) -> tuple[float, dict]:
-        if _is_austin_area(city):
-            city_key = _normalize_city(city)
-            snap = _MOCK_SNAPSHOTS.get(city_key, {})
-            col = _AUSTIN_COL_INDEX.get(city_key, 95.4)
-            return col, snap
-        data = await get_city_housing_data(city)
-        col = _col_index_for_city(city, data)
-        return col, data
-
-    current_col, current_data = await _get_data(current_city)
-    offer_col, offer_data = await _get_data(offer_city)
+    # Fetch both cities concurrently (async for Teleport; sync-cached for Austin)
+    (current_col, current_data), (offer_col, offer_data) = await asyncio.gather(
+        _get_col_data(current_city), _get_col_data(offer_city)
+    )
 
     # Core purchasing power calculation
     adjusted_offer = round(offer_salary * (current_col / offer_col), 2)
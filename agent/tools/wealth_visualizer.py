@@ -5,6 +5,8 @@ Projects retirement income and shows what-if scenarios.
 Source: Federal Reserve Survey of Consumer Finances 2022
 """
 
+from bisect import bisect_right
+
 FED_WEALTH_DATA = {
     "under_35": {
         "median": 39000, "p25": 7000,
@@ -38,17 +40,54 @@ SAVINGS_GRADES = {
 }
 
 
+# Bracket lookups are binary searches over sorted edges (bisect_right, so an
+# age or net worth exactly on an edge falls into the upper bucket — the same
+# ">=" semantics as the original if/elif ladders).
+_AGE_EDGES = (35, 45, 55, 65)
+_AGE_BRACKETS = ("under_35", "35_to_44", "45_to_54", "55_to_64", "65_to_74")
+
+_POSITION_LABELS = (
+    "bottom 25%",
+    "25th-50th percentile",
+    "50th-75th percentile",
+    "75th-90th percentile",
+    "top 10%",
+)
+_WEALTH_EDGES = {
+    key: (b["p25"], b["median"], b["p75"], b["p90"])
+    for key, b in FED_WEALTH_DATA.items()
+}
+
+
 def _get_age_bracket(age: int) -> str:
-    if age < 35:
-        return "under_35"
-    elif age < 45:
-        return "35_to_44"
-    elif age < 55:
-        return "45_to_54"
-    elif age < 65:
-        return "55_to_64"
-    else:
-        return "65_to_74"
+    return _AGE_BRACKETS[bisect_right(_AGE_EDGES, age)]
+
+
+def _position_for(total_net_worth: float, bracket_key: str) -> str:
+    return _POSITION_LABELS[
+        bisect_right(_WEALTH_EDGES[bracket_key], total_net_worth)
+    ]
+
+
+def rank_wealth_positions(cohort: list[tuple[float, int]]) -> list[dict]:
+    """
+    Fed Reserve peer position for many (net_worth, age) pairs in one pass.
+
+    Cohort callers (dashboards, household comparisons) only need the bracket
+    and percentile label, not the retirement projection and what-if scenarios
+    analyze_wealth_position builds for each person.
+    """
+    ranked = []
+    for total_net_worth, age in cohort:
+        bracket_key = _get_age_bracket(age)
+        ranked.append({
+            "age": age,
+            "total_net_worth": total_net_worth,
+            "age_bracket": bracket_key,
+            "median_for_age": FED_WEALTH_DATA[bracket_key]["median"],
+            "percentile_estimate": _position_for(total_net_worth, bracket_key),
+        })
+    return ranked
 
 
 def analyze_wealth_position(
@@ -68,16 +107,7 @@ def analyze_wealth_position(
     bracket_key = _get_age_bracket(age)
     bracket = FED_WEALTH_DATA[bracket_key]
 
-    if total_net_worth >= bracket["p90"]:
-        position = "top 10%"
-    elif total_net_worth >= bracket["p75"]:
-        position = "75th-90th percentile"
-    elif total_net_worth >= bracket["median"]:
-        position = "50th-75th percentile"
-    elif total_net_worth >= bracket["p25"]:
-        position = "25th-50th percentile"
-    else:
-        position = "bottom 25%"
+    position = _position_for(total_net_worth, bracket_key)
 
     diff_from_median = total_net_worth - bracket["median"]
     if diff_from_median >= 0: